@@ -123,9 +123,80 @@ def mesh_adapt_meshVar(mesh, meshVarH, metricVar, verbose=False, redistribute=Fa
     return icoord_vec, meshA
 
 
+def _exchange_with_candidate_ranks(mesh, sendbuf, dim):
+    """Send each row of `sendbuf` (the first `dim` columns are coordinates) to the
+    processes whose (padded) local bounding box for `mesh` contains the point.
+    The bounding boxes are gathered once (2 x dim values per process) and the data
+    are exchanged point-to-point with `Alltoallv`, so each process only receives
+    the rows that it might own. Returns the received rows."""
+
+    from mpi4py import MPI
+
+    comm = uw.mpi.comm
+    mpi_size = uw.mpi.size
+    ncols = sendbuf.shape[1]
+
+    # Local bounding box, padded by a cell size for curved / higher order elements
+
+    padding = mesh.get_max_radius()
+
+    if mesh.data.shape[0] > 0:
+        local_box = np.vstack(
+            (mesh.data.min(axis=0) - padding, mesh.data.max(axis=0) + padding)
+        )
+    else:
+        local_box = np.vstack(
+            (np.full(mesh.cdim, np.inf), np.full(mesh.cdim, -np.inf))
+        )
+
+    all_boxes = np.empty((mpi_size, 2, mesh.cdim), dtype=float)
+    comm.Allgather(np.ascontiguousarray(local_box), all_boxes)
+
+    # Candidate owners (we already know the points are not local)
+
+    coords = sendbuf[:, 0:dim]
+    send_rows = []
+    send_counts = np.zeros(mpi_size, dtype=int)
+
+    for rank in range(mpi_size):
+        if rank == uw.mpi.rank or coords.shape[0] == 0:
+            continue
+
+        inside = np.all(
+            (coords >= all_boxes[rank, 0, 0:dim])
+            & (coords <= all_boxes[rank, 1, 0:dim]),
+            axis=1,
+        )
+        rows = np.where(inside)[0]
+        send_rows.append(rows)
+        send_counts[rank] = rows.shape[0]
+
+    if len(send_rows) > 0:
+        send_data = np.ascontiguousarray(sendbuf[np.concatenate(send_rows)], dtype=float)
+    else:
+        send_data = np.empty((0, ncols), dtype=float)
+
+    recv_counts = np.empty(mpi_size, dtype=int)
+    comm.Alltoall(send_counts, recv_counts)
+
+    send_displs = np.concatenate(([0], np.cumsum(send_counts)[:-1]))
+    recv_displs = np.concatenate(([0], np.cumsum(recv_counts)[:-1]))
+
+    recvbuf = np.empty((recv_counts.sum(), ncols), dtype=float)
+
+    comm.Alltoallv(
+        [send_data, (send_counts * ncols, send_displs * ncols), MPI.DOUBLE],
+        [recvbuf, (recv_counts * ncols, recv_displs * ncols), MPI.DOUBLE],
+    )
+
+    return recvbuf
+
+
 def mesh2mesh_swarm(mesh0, mesh1, swarm0, swarmVarList, proxy=True, verbose=False):
     """Warning [NSFW] - this uses EXPLICIT message passing calls to handle the
     situation where a swarm cell_dm cannot find particles after mesh redistribution.
+    Particles that are not found locally are sent (point-to-point) to the processes
+    whose local bounding box on mesh1 contains them.
     This occurs when particles are moved accross non-neighbouring processes or if the
     mesh neighbours are redistricted. This should be fixed at the DMSwarm / DMPlex level
     so this code is just a placeholder. Or maybe it's just user error !
@@ -165,34 +236,11 @@ def mesh2mesh_swarm(mesh0, mesh1, swarm0, swarmVarList, proxy=True, verbose=Fals
     #     flush=False,
     # )
 
-    # Let's sync the number of missing points by rank
-
-    mpi_size = uw.mpi.size
-
-    missing_points = np.zeros((mpi_size))
-    comm = uw.mpi.comm
-    root = 0
-
-    local_array = n_not_found
-    # print(f"rank: {uw.mpi.rank}, local_array size: {n_not_found}")
+    # Send the missing points (with their data) only to the processes
+    # that might own them on the new mesh
 
     sendbuf = swarm_data[not_found]
-    global_sizes = np.empty(mpi_size, dtype=int)
-    local_size = np.array([sendbuf.shape[0]], dtype=int)
-
-    comm.Allgather(local_size, global_sizes)
-
-    global_size = global_sizes.sum()
-    # print(
-    #     f"{uw.mpi.rank} Sizes are: {global_sizes} Buffer size: {global_size}",
-    #     flush=True,
-    # )
-
-    uw.mpi.barrier()
-
-    recvbuf = np.empty((global_size, sendbuf.shape[1]), dtype=float)
-
-    comm.Allgatherv(sendbuf=sendbuf, recvbuf=(recvbuf, global_sizes * sendbuf.shape[1]))
+    recvbuf = _exchange_with_candidate_ranks(mesh1, sendbuf, mesh0.dim)
 
     global_unallocated_coords = recvbuf[:, 0 : mesh0.dim].copy()
     global_unallocated_data = recvbuf.copy()
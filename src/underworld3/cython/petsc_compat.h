@@ -138,3 +138,42 @@ PetscErrorCode UW_DMPlexSetSNESLocalFEM(DM dm, PetscBool flag, void *ctx)
     return DMPlexSetSNESLocalFEM(dm, flag, NULL);
 #endif
 }
+
+// Matrix-free (-snes_mf_operator) saddle point systems take the fieldsplit blocks from the
+// assembled preconditioner matrix. Its pressure block is the (viscosity-scaled) mass matrix
+// that preconditions the Schur complement (a11), but the operator's pressure block is zero,
+// so it is dropped from the Schur complement once the PC has been set up for each solve.
+
+static PetscErrorCode UW_SchurComplementDropA11(KSP ksp, Vec b, Vec x, void *ctx)
+{
+    PC pc;
+    PCCompositeType type;
+    PetscBool isfieldsplit;
+    Mat S, A00, Ap00, A01, A10, A11;
+
+    PetscFunctionBeginUser;
+    PetscCall(KSPSetUp(ksp));
+    PetscCall(KSPGetPC(ksp, &pc));
+    PetscCall(PetscObjectTypeCompare((PetscObject)pc, PCFIELDSPLIT, &isfieldsplit));
+    if (!isfieldsplit)
+        PetscFunctionReturn(0);
+
+    PetscCall(PCFieldSplitGetType(pc, &type));
+    if (type != PC_COMPOSITE_SCHUR)
+        PetscFunctionReturn(0);
+
+    PetscCall(PCFieldSplitSchurGetS(pc, &S));
+    PetscCall(MatSchurComplementGetSubMatrices(S, &A00, &Ap00, &A01, &A10, &A11));
+    if (A11)
+        PetscCall(MatSchurComplementUpdateSubMatrices(S, A00, Ap00, A01, A10, NULL));
+    PetscCall(PCFieldSplitSchurRestoreS(pc, &S));
+
+    PetscFunctionReturn(0);
+}
+
+PetscErrorCode UW_KSPSetSchurComplementZeroA11(KSP ksp, PetscBool zero)
+{
+    PetscFunctionBeginUser;
+    PetscCall(KSPSetPreSolve(ksp, zero ? UW_SchurComplementDropA11 : NULL, NULL));
+    PetscFunctionReturn(0);
+}
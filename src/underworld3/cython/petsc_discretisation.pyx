@@ -60,6 +60,154 @@ def petsc_fvm_get_local_cell_sizes(mesh) -> np.array:
         return cell_radii, cell_centroids
 
 
+def petsc_dm_get_closure_points(incoming_dm, points, num_points) -> np.ndarray:
+        """
+        Bulk version of `dm.getTransitiveClosure(p)[0][-num_points:]` for every p in `points`.
+
+        For a uniform mesh, the trailing entries of the closure are the vertices, so
+        this returns the (len(points), num_points) array of vertex point numbers
+        (not offset by the start of the vertex stratum).
+        """
+
+        cdef DM dm = incoming_dm
+        cdef PetscInt closure_size
+        cdef PetscInt *closure = NULL
+        cdef PetscInt i, j, n, npts = num_points
+
+        cdef const PetscInt [::1] points_view = np.ascontiguousarray(points, dtype=PETSc.IntType)
+        n = points_view.shape[0]
+
+        result = np.empty((n, npts), dtype=PETSc.IntType)
+        cdef PetscInt [:, ::1] result_view = result
+
+        for i in range(n):
+                closure = NULL
+                CHKERRQ( DMPlexGetTransitiveClosure(dm.dm, points_view[i], PETSC_TRUE, &closure_size, &closure) )
+                # closure is stored as (point, orientation) pairs
+                for j in range(npts):
+                        result_view[i, j] = closure[2 * (closure_size - npts + j)]
+                CHKERRQ( DMPlexRestoreTransitiveClosure(dm.dm, points_view[i], PETSC_TRUE, &closure_size, &closure) )
+
+        return result
+
+def petsc_dm_get_cones(incoming_dm, points, cone_size) -> np.ndarray:
+        """
+        Bulk version of `dm.getCone(p)` for every p in `points`. All cones are
+        assumed to have `cone_size` entries (uniform element types).
+        """
+
+        cdef DM dm = incoming_dm
+        cdef const PetscInt *cone = NULL
+        cdef PetscInt i, j, n, ncone = cone_size
+
+        cdef const PetscInt [::1] points_view = np.ascontiguousarray(points, dtype=PETSc.IntType)
+        n = points_view.shape[0]
+
+        result = np.empty((n, ncone), dtype=PETSc.IntType)
+        cdef PetscInt [:, ::1] result_view = result
+
+        for i in range(n):
+                CHKERRQ( DMPlexGetCone(dm.dm, points_view[i], &cone) )
+                for j in range(ncone):
+                        result_view[i, j] = cone[j]
+
+        return result
+
+def petsc_dm_get_supports(incoming_dm, points, max_support=2):
+        """
+        Bulk version of `dm.getSupport(p)` for every p in `points`.
+
+        Returns the support sizes and a (len(points), max_support) array of the
+        supporting points, padded with -1. For mesh faces, a support size of 1
+        identifies a boundary face (of the local domain) and the single entry
+        is the owning cell.
+        """
+
+        cdef DM dm = incoming_dm
+        cdef const PetscInt *support = NULL
+        cdef PetscInt support_size
+        cdef PetscInt i, j, n, nmax = max_support
+
+        cdef const PetscInt [::1] points_view = np.ascontiguousarray(points, dtype=PETSc.IntType)
+        n = points_view.shape[0]
+
+        sizes = np.empty(n, dtype=PETSc.IntType)
+        result = np.full((n, nmax), -1, dtype=PETSc.IntType)
+        cdef PetscInt [::1] sizes_view = sizes
+        cdef PetscInt [:, ::1] result_view = result
+
+        for i in range(n):
+                CHKERRQ( DMPlexGetSupportSize(dm.dm, points_view[i], &support_size) )
+                CHKERRQ( DMPlexGetSupport(dm.dm, points_view[i], &support) )
+                sizes_view[i] = support_size
+                for j in range(min(support_size, nmax)):
+                        result_view[i, j] = support[j]
+
+        return sizes, result
+
+
+def petsc_dmswarm_remove_points(incoming_swarm_dm, remove) -> int:
+        """
+        Remove a set of points from a DMSwarm in a single call. `remove` is either
+        a boolean mask over the local points or an array of local point indices.
+
+        Points are removed from the highest index down with `DMSwarmRemovePointAtIndex`,
+        which fills each hole with the current last point, so all the registered
+        fields stay consistent. Note that this re-orders the remaining points.
+        Returns the number of points removed.
+        """
+
+        cdef DM dm = incoming_swarm_dm
+        cdef PetscInt i, n
+
+        remove = np.asarray(remove)
+        if remove.dtype == bool:
+                remove = np.where(remove)[0]
+
+        cdef const PetscInt [::1] indices_view = np.ascontiguousarray(
+                np.unique(remove)[::-1], dtype=PETSc.IntType
+        )
+        n = indices_view.shape[0]
+
+        for i in range(n):
+                CHKERRQ( DMSwarmRemovePointAtIndex(dm.dm, indices_view[i]) )
+
+        return n
+
+
+def petsc_section_get_field_indices(incoming_section, field) -> np.ndarray:
+        """
+        The vector indices of every dof of `field` in the section (constrained or not),
+        in chart order. Bulk version of looping over `section.getFieldDof(p, field)` /
+        `section.getFieldOffset(p, field)` for every point p.
+        """
+
+        cdef Section section = incoming_section
+        cdef PetscInt f = field
+        cdef PetscInt pStart, pEnd, p, i, dof, offset, count
+
+        CHKERRQ( PetscSectionGetChart(section.sec, &pStart, &pEnd) )
+
+        count = 0
+        for p in range(pStart, pEnd):
+                CHKERRQ( PetscSectionGetFieldDof(section.sec, p, f, &dof) )
+                count += dof
+
+        result = np.empty(count, dtype=PETSc.IntType)
+        cdef PetscInt [::1] result_view = result
+
+        count = 0
+        for p in range(pStart, pEnd):
+                CHKERRQ( PetscSectionGetFieldDof(section.sec, p, f, &dof) )
+                if dof > 0:
+                        CHKERRQ( PetscSectionGetFieldOffset(section.sec, p, f, &offset) )
+                        for i in range(dof):
+                                result_view[count] = offset + i
+                                count += 1
+
+        return result
+
+
 def petsc_dm_create_submesh_from_label(incoming_dm, boundary_label_name, boundary_label_value, marked_faces=True) -> float:
         """
         Wraps DMPlexCreateSubmesh
@@ -7,8 +7,10 @@ from petsc4py.PETSc cimport Mat, PetscMat
 from petsc4py.PETSc cimport IS,  PetscIS
 from petsc4py.PETSc cimport FE,  PetscFE
 from petsc4py.PETSc cimport DMLabel, PetscDMLabel
-from petsc4py.PETSc cimport PetscQuadrature, PetscSection
+from petsc4py.PETSc cimport PetscQuadrature, PetscSection, Section
 from petsc4py.PETSc cimport MPI_Comm, PetscMat, GetCommDefault, PetscViewer
+from petsc4py.PETSc cimport SNES, PetscSNES
+from petsc4py.PETSc cimport KSP, PetscKSP
 
 
 from underworld3.cython.petsc_types cimport PetscBool, PetscInt, PetscReal, PetscScalar
@@ -43,6 +45,7 @@ cdef extern from "petsc_compat.h":
     PetscErrorCode UW_PetscDSViewWF(PetscDS)     
     PetscErrorCode UW_PetscDSViewBdWF(PetscDS, PetscInt)     
     PetscErrorCode UW_DMPlexSetSNESLocalFEM( PetscDM, PetscBool, void *)
+    PetscErrorCode UW_KSPSetSchurComplementZeroA11( PetscKSP, PetscBool )
 
 cdef extern from "petsc.h" nogil:
     PetscErrorCode DMPlexSNESComputeBoundaryFEM( PetscDM, void *, void *)
@@ -55,6 +58,12 @@ cdef extern from "petsc.h" nogil:
     PetscErrorCode PetscDSSetJacobian( PetscDS, PetscInt, PetscInt, PetscDSJacobianFn, PetscDSJacobianFn, PetscDSJacobianFn, PetscDSJacobianFn)
     PetscErrorCode PetscDSSetJacobianPreconditioner( PetscDS, PetscInt, PetscInt, PetscDSJacobianFn, PetscDSJacobianFn, PetscDSJacobianFn, PetscDSJacobianFn)
     PetscErrorCode PetscDSSetResidual( PetscDS, PetscInt, PetscDSResidualFn, PetscDSResidualFn )
+    PetscErrorCode PetscDSSetConstants( PetscDS, PetscInt, PetscScalar[] )
+
+    PetscErrorCode SNESSetLagJacobian(PetscSNES, PetscInt)
+    PetscErrorCode SNESSetLagJacobianPersists(PetscSNES, PetscBool)
+    PetscErrorCode SNESSetLagPreconditioner(PetscSNES, PetscInt)
+    PetscErrorCode SNESSetLagPreconditionerPersists(PetscSNES, PetscBool)
     
     PetscErrorCode PetscDSSetBdJacobian( PetscDS, PetscInt, PetscInt, PetscDSBdJacobianFn, PetscDSBdJacobianFn, PetscDSBdJacobianFn, PetscDSBdJacobianFn)
     PetscErrorCode PetscDSSetBdJacobianPreconditioner( PetscDS, PetscInt, PetscInt, PetscDSBdJacobianFn, PetscDSBdJacobianFn, PetscDSBdJacobianFn, PetscDSBdJacobianFn)
@@ -77,5 +86,21 @@ cdef extern from "petsc.h" nogil:
     PetscErrorCode DMSetPeriodicity(PetscDM dm, PetscReal maxCell[], PetscReal Lstart[], PetscReal L[])
     PetscErrorCode DMLocalizeCoordinates(PetscDM dm)
 
+    # Mesh topology (used for bulk connectivity extraction)
+    PetscErrorCode DMPlexGetTransitiveClosure(PetscDM dm, PetscInt p, PetscBool useCone, PetscInt *numPoints, PetscInt **points)
+    PetscErrorCode DMPlexRestoreTransitiveClosure(PetscDM dm, PetscInt p, PetscBool useCone, PetscInt *numPoints, PetscInt **points)
+    PetscErrorCode DMPlexGetConeSize(PetscDM dm, PetscInt p, PetscInt *size)
+    PetscErrorCode DMPlexGetCone(PetscDM dm, PetscInt p, const PetscInt *cone[])
+    PetscErrorCode DMPlexGetSupportSize(PetscDM dm, PetscInt p, PetscInt *size)
+    PetscErrorCode DMPlexGetSupport(PetscDM dm, PetscInt p, const PetscInt *support[])
+
+    # Swarm point management
+    PetscErrorCode DMSwarmRemovePointAtIndex(PetscDM dm, PetscInt idx)
+
+    # Section layout (used for bulk field index extraction)
+    PetscErrorCode PetscSectionGetChart(PetscSection s, PetscInt *pStart, PetscInt *pEnd)
+    PetscErrorCode PetscSectionGetFieldDof(PetscSection s, PetscInt point, PetscInt field, PetscInt *numDof)
+    PetscErrorCode PetscSectionGetFieldOffset(PetscSection s, PetscInt point, PetscInt field, PetscInt *offset)
+
     # Not wrapped at this point
     PetscErrorCode VecConcatenate(PetscInt nx, const PetscVec X[], PetscVec *, PetscIS *)
\ No newline at end of file
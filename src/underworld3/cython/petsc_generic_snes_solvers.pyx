@@ -8,7 +8,7 @@ from petsc4py import PETSc
 
 import underworld3
 import underworld3 as uw
-from   underworld3.utilities._jitextension import getext
+from   underworld3.utilities._jitextension import getext, constant_values, fn_dependencies, _JITBuild
 import underworld3.timing as timing
 
 from underworld3.utilities._api_tools import uw_object
@@ -30,6 +30,9 @@ class SolverBaseClass(uw_object):
     This class is not intended to be used directly
     """
 
+    _is_setup = False
+    _pointwise_functions_current = False
+
     def __init__(self, mesh):
 
         super().__init__()
@@ -37,6 +40,7 @@ class SolverBaseClass(uw_object):
         self.mesh = mesh
         self.mesh_dm_coordinate_hash = None
         self.compiled_extensions = None
+        self.ext_dict = None
 
         self.Unknowns = self._Unknowns(self)
 
@@ -48,6 +52,214 @@ class SolverBaseClass(uw_object):
         self.petsc_options_prefix = self.name
         self.petsc_options = PETSc.Options(self.petsc_options_prefix)
 
+        self._matrix_free = False
+
+        self._reuse_jacobian = True
+        self._jacobian_dependencies = None
+        self._jacobian_snes_state = None
+        self._jacobian_lag_snes = None
+
+        return
+
+    @property
+    def reuse_jacobian(self):
+        """
+        Re-use the assembled Jacobian and the preconditioner set-up from the previous
+        solve when nothing they depend on has changed. The compiled Jacobian (G) kernels
+        are checked for the solution fields (in which case the problem is nonlinear and
+        the Jacobian is always rebuilt), for other mesh variables (compared by state),
+        for run-time constants (compared by value) and for the mesh coordinates.
+        Changes that only affect the residual (e.g. buoyancy or history terms) then
+        skip the assembly and the (a)mg setup.
+        """
+        return self._reuse_jacobian
+
+    @reuse_jacobian.setter
+    def reuse_jacobian(self, value):
+        self._reuse_jacobian = bool(value)
+        self._jacobian_snes_state = None
+
+    def _setup_jacobian_dependencies(self, fns_jacobian, primary_field_list):
+        """
+        Record the mesh variables and the run-time constants that are read by the
+        compiled Jacobian kernels, and whether they depend on the unknowns.
+        """
+
+        self._jacobian_dependencies = fn_dependencies(fns_jacobian, primary_field_list)
+        self._jacobian_snes_state = None
+
+        return
+
+    def _jacobian_state(self):
+        """
+        A key that changes whenever the Jacobian needs to be re-assembled, or `None`
+        if the Jacobian depends on the solution (or the dependencies are unknown).
+        """
+
+        if self._jacobian_dependencies is None:
+            return None
+
+        variables, constants, depends_on_unknowns = self._jacobian_dependencies
+
+        if depends_on_unknowns:
+            return None
+
+        values = constant_values(constants)
+        if values is None:
+            return None
+
+        import xxhash
+        import numpy as np
+
+        xxh = xxhash.xxh64()
+        xxh.update(np.ascontiguousarray(self.mesh.data))
+
+        return (
+            xxh.intdigest(),
+            tuple(var._state for var in variables),
+            tuple(values),
+        )
+
+    def _update_jacobian_lag(self):
+        """
+        Set the SNES Jacobian / preconditioner lag before a solve: if the Jacobian is
+        unchanged since the last solve with this SNES, it is never rebuilt (-1),
+        otherwise it is rebuilt once at the first Newton iteration (-2). Nonlinear
+        problems, or lags set explicitly in `petsc_options`, get the default lag
+        back (or the one from the options) if a lag was set here before.
+        """
+
+        cdef SNES snes = self.snes
+
+        user_lag = (self.petsc_options.hasName("snes_lag_jacobian")
+                    or self.petsc_options.hasName("snes_lag_preconditioner"))
+
+        state = None
+        if self._reuse_jacobian and not user_lag:
+            state = self._jacobian_state()
+
+        if state is None:
+            self._jacobian_snes_state = None
+
+            # The lag persists across solves, so undo the one set here before
+
+            if self._jacobian_lag_snes is self.snes:
+                ierr = SNESSetLagJacobian(snes.snes, 1); CHKERRQ(ierr)
+                ierr = SNESSetLagJacobianPersists(snes.snes, PETSC_FALSE); CHKERRQ(ierr)
+                ierr = SNESSetLagPreconditioner(snes.snes, 1); CHKERRQ(ierr)
+                ierr = SNESSetLagPreconditionerPersists(snes.snes, PETSC_FALSE); CHKERRQ(ierr)
+
+                if user_lag:
+                    self.snes.setFromOptions()
+
+                self._jacobian_lag_snes = None
+
+            return
+
+        if (self._jacobian_snes_state is not None
+            and self._jacobian_snes_state[0] is self.snes
+            and self._jacobian_snes_state[1] == state):
+            lag = -1
+        else:
+            lag = -2
+
+        ierr = SNESSetLagJacobian(snes.snes, lag); CHKERRQ(ierr)
+        ierr = SNESSetLagJacobianPersists(snes.snes, PETSC_TRUE); CHKERRQ(ierr)
+        ierr = SNESSetLagPreconditioner(snes.snes, lag); CHKERRQ(ierr)
+        ierr = SNESSetLagPreconditionerPersists(snes.snes, PETSC_TRUE); CHKERRQ(ierr)
+
+        if self.verbose and uw.mpi.rank == 0:
+            if lag == -1:
+                print(f"{self.name}: Jacobian unchanged, re-using the assembled matrices / preconditioner", flush=True)
+
+        self._jacobian_snes_state = (self.snes, state)
+        self._jacobian_lag_snes = self.snes
+
+        return
+
+    @property
+    def matrix_free(self):
+        """
+        Apply the Jacobian matrix-free (`-snes_mf_operator`): the operator is the
+        finite-difference action of the residual kernels and only the preconditioner
+        matrix is assembled (from the Jacobian kernels, registered as the preconditioner).
+        For saddle-point systems this removes the second assembled matrix; the Schur
+        complement and its `a11` (pressure mass matrix) preconditioner are the same as
+        in the assembled solve.
+        """
+        return self._matrix_free
+
+    @matrix_free.setter
+    def matrix_free(self, value):
+        self.is_setup = False
+        self._matrix_free = bool(value)
+        self._set_matrix_free_options()
+
+    def _set_matrix_free_options(self):
+        if self._matrix_free:
+            self.petsc_options["snes_mf_operator"] = None
+        else:
+            self.petsc_options.delValue("snes_mf_operator")
+
+    @property
+    def compiled_extensions(self):
+        # Extensions may still be compiling (see `precompile`), join the build here
+        if isinstance(self._compiled_extensions, _JITBuild):
+            self._compiled_extensions = self._compiled_extensions.getptrobj()
+        return self._compiled_extensions
+
+    @compiled_extensions.setter
+    def compiled_extensions(self, value):
+        self._compiled_extensions = value
+
+    @timing.routine_timer_decorator
+    def precompile(self, verbose=False):
+        """
+        Generate the pointwise functions for this solver and start compiling
+        them in the background. Calling this for each solver in a model, once the
+        equations are defined, compiles the extensions concurrently instead of one
+        after another. Each build is joined when its solver is first set up (at `solve`).
+        The generated functions are used by `solve` unless the solver is changed in
+        the meantime (in which case they are generated again).
+        """
+
+        if self.constitutive_model is not None and not self.constitutive_model._solver_is_setup:
+            self.is_setup = False
+
+        self._add_null_boundary()
+        self._setup_pointwise_functions(verbose, asynchronous=True)
+
+        # The functions are now consistent with the constitutive model. They are
+        # re-used by the next `solve` unless something changes in between.
+
+        if self.constitutive_model is not None:
+            self.constitutive_model._solver_is_setup = True
+
+        return
+
+    @property
+    def is_setup(self):
+        return self._is_setup
+
+    @is_setup.setter
+    def is_setup(self, value):
+        # Anything that requires the solver to be set up again also
+        # invalidates pointwise functions generated ahead of the set up
+        if not value:
+            self._pointwise_functions_current = False
+        self._is_setup = value
+
+    def _add_null_boundary(self):
+        # This is a workaround for some problem in the PETSc machinery
+        # where we need a surface integral term somewhere on every process
+        # if we have a contribution from anywhere. We add a fake one here
+        # which just integrates nothing over a bunch of points. It's enough
+        # to let the rest of the machinery work.
+
+        if len(self.natural_bcs) > 0:
+            if not any(bc.boundary == "Null_Boundary" for bc in self.natural_bcs):
+                bc = (0,)*self.Unknowns.u.shape[1]
+                self.add_natural_bc(bc, "Null_Boundary")
 
         return
 
@@ -180,16 +392,7 @@ class SolverBaseClass(uw_object):
                             # can insert new functions in template (surface integrals problematic in
                             # the current implementation )
 
-        # This is a workaround for some problem in the PETSc machinery
-        # where we need a surface integral term somewhere on every process
-        # if we have a contribution from anywhere. We add a fake one here
-        # which just integrates nothing over a bunch of points. It's enough
-        # to let the rest of the machinery work.
-
-        if len(self.natural_bcs) > 0:
-            if not "Null_Boundary" in self.natural_bcs:
-                bc = (0,)*self.Unknowns.u.shape[1]
-                self.add_natural_bc(bc, "Null_Boundary")
+        self._add_null_boundary()
 
         self._setup_pointwise_functions(verbose, debug=debug, debug_name=debug_name)
         self._setup_discretisation(verbose)
@@ -200,6 +403,44 @@ class SolverBaseClass(uw_object):
         return
 
 
+    def _constants_need_rebuild(self):
+        """
+        `True` if one of the expressions compiled as a run-time constant
+        no longer has a numerical value (so the pointwise functions are stale)
+        """
+
+        if self.ext_dict is None:
+            return False
+
+        return constant_values(self.ext_dict.constants) is None
+
+    def _update_constants(self):
+        """
+        Copy the current values of the run-time constants into the PetscDS of the
+        solver dm (and the coarse dms). These are read by the compiled
+        pointwise functions as `constants[i]`.
+        """
+
+        import numpy as np
+
+        cdef DS ds
+        cdef double [::1] values_view
+
+        values = constant_values(self.ext_dict.constants)
+        if values is None or len(values) == 0:
+            return
+
+        values_array = np.array(values, dtype=np.float64)
+        values_view = values_array
+
+        for level_dm in self.dm_hierarchy:
+            if level_dm is None:
+                continue
+            ds = level_dm.getDS()
+            ierr = PetscDSSetConstants(ds.ds, len(values), &values_view[0]); CHKERRQ(ierr)
+
+        return
+
     # Deprecate in favour of properties for solver.F0, solver.F1
     @timing.routine_timer_decorator
     def _setup_problem_description(self):
@@ -771,11 +1012,12 @@ class SNES_Scalar(SolverBaseClass):
         return
 
     @timing.routine_timer_decorator
-    def _setup_pointwise_functions(self, verbose=False, debug=False, debug_name=None):
+    def _setup_pointwise_functions(self, verbose=False, debug=False, debug_name=None, asynchronous=False):
         import sympy
 
-        # Any property changes will trigger this
-        if self.is_setup:
+        # Any property changes will trigger this (functions that were generated
+        # by `precompile` and have not been invalidated since are also kept)
+        if self.is_setup or self._pointwise_functions_current:
             if verbose and uw.mpi.rank == 0:
                 print(f"SNES_Scalar ({self.name}): Pointwise functions do not need to be rebuilt", flush=True)
             return
@@ -798,8 +1040,8 @@ class SNES_Scalar(SolverBaseClass):
         # f0  = sympy.Array(uw.function.fn_substitute_expressions(self.F0.sym)).reshape(1).as_immutable()
         # F1  = sympy.Array(uw.function.fn_substitute_expressions(self.F1.sym)).reshape(dim).as_immutable()
 
-        f0  = sympy.Array(uw.function.expression.unwrap(self.F0.sym, keep_constants=False, return_self=False)).reshape(1).as_immutable()
-        F1  = sympy.Array(uw.function.expression.unwrap(self.F1.sym, keep_constants=False, return_self=False)).reshape(dim).as_immutable()
+        f0  = sympy.Array(uw.function.expression.unwrap(self.F0.sym, keep_constants=True, return_self=False)).reshape(1).as_immutable()
+        F1  = sympy.Array(uw.function.expression.unwrap(self.F1.sym, keep_constants=True, return_self=False)).reshape(dim).as_immutable()
 
         self._u_f0 = f0
         self._u_F1 = F1
@@ -901,7 +1143,11 @@ class SNES_Scalar(SolverBaseClass):
                                        tuple(fns_bd_jacobian),
                                        primary_field_list=prim_field_list,
                                        verbose=verbose,
-                                       debug=debug,)
+                                       debug=debug,
+                                       asynchronous=asynchronous,)
+
+        self._setup_jacobian_dependencies(tuple(fns_jacobian) + tuple(fns_bd_jacobian), prim_field_list)
+        self._pointwise_functions_current = True
 
         return
 
@@ -928,7 +1174,17 @@ class SNES_Scalar(SolverBaseClass):
         # identically `zero` pointwise functions instead of setting to `NULL`
 
         i_jac = self.ext_dict.jac
-        PetscDSSetJacobian(ds.ds, 0, 0,
+
+        # Matrix-free: the kernels are only needed for the preconditioner matrix
+        if self._matrix_free:
+            PetscDSSetJacobianPreconditioner(ds.ds, 0, 0,
+                ext.fns_jacobian[i_jac[self._G0]],
+                ext.fns_jacobian[i_jac[self._G1]],
+                ext.fns_jacobian[i_jac[self._G2]],
+                ext.fns_jacobian[i_jac[self._G3]],
+                )
+        else:
+            PetscDSSetJacobian(ds.ds, 0, 0,
                 ext.fns_jacobian[i_jac[self._G0]],
                 ext.fns_jacobian[i_jac[self._G1]],
                 ext.fns_jacobian[i_jac[self._G2]],
@@ -988,7 +1244,11 @@ class SNES_Scalar(SolverBaseClass):
         if _force_setup or not self.constitutive_model._solver_is_setup:
             self.is_setup = False
 
+        if self._constants_need_rebuild():
+            self.is_setup = False
+
         self._build(verbose, debug, debug_name)
+        self._update_constants()
 
         gvec = self.dm.getGlobalVec()
 
@@ -1014,6 +1274,7 @@ class SNES_Scalar(SolverBaseClass):
         ierr = DMSetAuxiliaryVec_UW(dm.dm, NULL, 0, 0, cmesh_lvec.vec); CHKERRQ(ierr)
 
         # solve
+        self._update_jacobian_lag()
         self.snes.solve(None, gvec)
 
         lvec = self.dm.getLocalVec()
@@ -1367,11 +1628,12 @@ class SNES_Vector(SolverBaseClass):
 
 
     @timing.routine_timer_decorator
-    def _setup_pointwise_functions(self, verbose=False, debug=False, debug_name=None):
+    def _setup_pointwise_functions(self, verbose=False, debug=False, debug_name=None, asynchronous=False):
         import sympy
 
-        # Any property changes will trigger this
-        if self.is_setup:
+        # Any property changes will trigger this (functions that were generated
+        # by `precompile` and have not been invalidated since are also kept)
+        if self.is_setup or self._pointwise_functions_current:
             if verbose and uw.mpi.rank == 0:
                 print(f"SNES_Vector ({self.name}): Pointwise functions do not need to be rebuilt", flush=True)
             return
@@ -1399,8 +1661,8 @@ class SNES_Vector(SolverBaseClass):
         # f0  = sympy.Array(uw.function.fn_substitute_expressions(self.F0.sym)).reshape(dim).as_immutable()
         # F1  = sympy.Array(uw.function.fn_substitute_expressions(self.F1.sym)).reshape(dim,dim).as_immutable()
 
-        f0  = sympy.Array(uw.function.expression.unwrap(self.F0.sym, keep_constants=False, return_self=False)).reshape(dim).as_immutable()
-        F1  = sympy.Array(uw.function.expression.unwrap(self.F1.sym, keep_constants=False, return_self=False)).reshape(dim,dim).as_immutable()
+        f0  = sympy.Array(uw.function.expression.unwrap(self.F0.sym, keep_constants=True, return_self=False)).reshape(dim).as_immutable()
+        F1  = sympy.Array(uw.function.expression.unwrap(self.F1.sym, keep_constants=True, return_self=False)).reshape(dim,dim).as_immutable()
 
 
         self._u_f0 = f0
@@ -1504,9 +1766,11 @@ class SNES_Vector(SolverBaseClass):
                                        tuple(fns_bd_jacobian),
                                        primary_field_list=prim_field_list,
                                        verbose=verbose,
-                                       debug=debug,)
+                                       debug=debug,
+                                       asynchronous=asynchronous,)
 
-        cdef PtrContainer ext = self.compiled_extensions
+        self._setup_jacobian_dependencies(tuple(fns_jacobian) + tuple(fns_bd_jacobian), prim_field_list)
+        self._pointwise_functions_current = True
 
         return
 
@@ -1535,7 +1799,17 @@ class SNES_Vector(SolverBaseClass):
         # identically `zero` pointwise functions instead of setting to `NULL`
 
         i_jac = self.ext_dict.jac
-        PetscDSSetJacobian(ds.ds, 0, 0,
+
+        # Matrix-free: the kernels are only needed for the preconditioner matrix
+        if self._matrix_free:
+            PetscDSSetJacobianPreconditioner(ds.ds, 0, 0,
+                ext.fns_jacobian[i_jac[self._G0]],
+                ext.fns_jacobian[i_jac[self._G1]],
+                ext.fns_jacobian[i_jac[self._G2]],
+                ext.fns_jacobian[i_jac[self._G3]],
+                )
+        else:
+            PetscDSSetJacobian(ds.ds, 0, 0,
                 ext.fns_jacobian[i_jac[self._G0]],
                 ext.fns_jacobian[i_jac[self._G1]],
                 ext.fns_jacobian[i_jac[self._G2]],
@@ -1645,7 +1919,11 @@ class SNES_Vector(SolverBaseClass):
         if _force_setup or not self.constitutive_model._solver_is_setup:
             self.is_setup = False
 
+        if self._constants_need_rebuild():
+            self.is_setup = False
+
         self._build(verbose, debug, debug_name)
+        self._update_constants()
 
         # if (not self.is_setup):
         #     if self.dm is not None:
@@ -1693,6 +1971,7 @@ class SNES_Vector(SolverBaseClass):
         ierr = DMSetAuxiliaryVec_UW(dm.dm, NULL, 0, 0, cmesh_lvec.vec); CHKERRQ(ierr)
 
         # solve
+        self._update_jacobian_lag()
         self.snes.solve(None,gvec)
 
         lvec = self.dm.getLocalVec()
@@ -1890,9 +2169,7 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
         self.petsc_options["pc_fieldsplit_schur_fact_type"] = "full"     # diag is an alternative (quick/dirty)
         self.petsc_options["pc_fieldsplit_schur_precondition"] = "a11"   # despite what the docs say for saddle points
 
-        self.petsc_options["pc_fieldsplit_diag_use_amat"] = None
-        self.petsc_options["pc_fieldsplit_off_diag_use_amat"] = None
-        # self.petsc_options["pc_use_amat"] = None                         # Using this puts more pressure on the inner solve
+        self._set_matrix_free_options()
 
         p_name = "pressure" # pressureField.clean_name
         v_name = "velocity" # velocityField.clean_name
@@ -1910,16 +2187,8 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
         # self.petsc_options[f"fieldsplit_{p_name}_pc_gamg_type"] = "agg"
         # self.petsc_options[f"fieldsplit_{p_name}_pc_gamg_repartition"] = True
 
-        # Great set of options for gamg
-        self.petsc_options[f"fieldsplit_{v_name}_ksp_type"] = "cg"
         self.petsc_options[f"fieldsplit_{v_name}_ksp_rtol"]  = self._tolerance * 0.1
-        self.petsc_options[f"fieldsplit_{v_name}_pc_type"]  = "gamg"
-        self.petsc_options[f"fieldsplit_{v_name}_pc_gamg_type"]  = "agg"
-        self.petsc_options[f"fieldsplit_{v_name}_pc_gamg_repartition"]  = True
-        self.petsc_options[f"fieldsplit_{v_name}_pc_mg_type"]  = "additive"
-        self.petsc_options[f"fieldsplit_{v_name}_pc_gamg_agg_nsmooths"] = 2
-        self.petsc_options[f"fieldsplit_{v_name}_mg_levels_ksp_max_it"] = 3
-        self.petsc_options[f"fieldsplit_{v_name}_mg_levels_ksp_converged_maxits"] = None
+        self._set_velocity_gamg_options()
 
         # Create this dict
         self.fields = {}
@@ -2028,8 +2297,34 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
         self.petsc_options["fieldsplit_velocity_ksp_rtol"]  = self._tolerance * 0.033
 
 
+    def _set_matrix_free_options(self):
+        # The fieldsplit blocks are taken from the assembled (preconditioner)
+        # matrix when the operator is matrix-free. The Schur complement is still
+        # preconditioned with the pressure block of that matrix (`a11`, the
+        # 1/viscosity mass matrix), as in the assembled path, and the pressure
+        # block is removed from S itself before each solve (see `solve`) so that
+        # S = -B A^-1 B^T as with `use_amat`.
+
+        self.petsc_options["pc_fieldsplit_schur_precondition"] = "a11"
+
+        if self._matrix_free:
+            self.petsc_options["snes_mf_operator"] = None
+            self.petsc_options.delValue("pc_fieldsplit_diag_use_amat")
+            self.petsc_options.delValue("pc_fieldsplit_off_diag_use_amat")
+        else:
+            self.petsc_options.delValue("snes_mf_operator")
+            self.petsc_options["pc_fieldsplit_diag_use_amat"] = None
+            self.petsc_options["pc_fieldsplit_off_diag_use_amat"] = None
+            # self.petsc_options["pc_use_amat"] = None                         # Using this puts more pressure on the inner solve
+
     @property
     def strategy(self):
+        """
+        Preset of solver options for the saddle point system. "default" uses gamg
+        for the velocity block, "gmg" uses geometric multigrid on the mesh refinement
+        hierarchy (the mesh must be created with `refinement` > 0). Set this before
+        the first solve.
+        """
         return self._strategy
 
     @strategy.setter
@@ -2047,9 +2342,7 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
         self.petsc_options["pc_fieldsplit_schur_fact_type"] = "full"     # diag is an alternative (quick/dirty)
         self.petsc_options["pc_fieldsplit_schur_precondition"] = "a11"   # despite what the docs say for saddle points
 
-        self.petsc_options["pc_fieldsplit_diag_use_amat"] = None
-        self.petsc_options["pc_fieldsplit_off_diag_use_amat"] = None
-        # self.petsc_options["pc_use_amat"] = None                         # Using this puts more pressure on the inner solve
+        self._set_matrix_free_options()
 
 
         if value == "robust":
@@ -2083,14 +2376,87 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
         # self.petsc_options[f"fieldsplit_{p_name}_pc_gamg_repartition"] = True
 
 
-        self.petsc_options[f"fieldsplit_velocity_ksp_type"] = "cg"
-        self.petsc_options[f"fieldsplit_velocity_pc_type"]  = "gamg"
-        self.petsc_options[f"fieldsplit_velocity_pc_gamg_type"]  = "agg"
-        self.petsc_options[f"fieldsplit_velocity_pc_gamg_repartition"]  = True
-        self.petsc_options[f"fieldsplit_velocity_pc_mg_type"]  = "kaskade"
-        self.petsc_options[f"fieldsplit_velocity_pc_gamg_agg_nsmooths"] = 2
-        self.petsc_options[f"fieldsplit_velocity_mg_levels_ksp_max_it"] = 3
-        self.petsc_options[f"fieldsplit_velocity_mg_levels_ksp_converged_maxits"] = None
+        if value == "gmg":
+            if len(self.mesh.dm_hierarchy) > 1:
+                self._set_velocity_gmg_options()
+                return
+
+            import warnings
+            warnings.warn(
+                f"Stokes solver strategy 'gmg' needs a mesh built with refinement > 0, "
+                + "using the default (gamg) velocity preconditioner instead"
+            )
+
+        self._clear_velocity_gmg_options()
+        self._set_velocity_gamg_options()
+
+    # Options that are specific to the geometric multigrid velocity preconditioner
+    # and need to be removed when switching back to gamg
+
+    _velocity_gmg_option_names = (
+        "pc_mg_levels",
+        "pc_mg_galerkin",
+        "pc_mg_type",
+        "pc_mg_cycle_type",
+        "mg_levels_ksp_type",
+        "mg_levels_ksp_chebyshev_esteig",
+        "mg_levels_ksp_max_it",
+        "mg_levels_pc_type",
+        "mg_coarse_ksp_type",
+        "mg_coarse_pc_type",
+        "mg_coarse_redundant_pc_type",
+    )
+
+    def _clear_velocity_gmg_options(self):
+        for name in self._velocity_gmg_option_names:
+            self.petsc_options.delValue(f"fieldsplit_velocity_{name}")
+
+    def _set_velocity_gamg_options(self):
+        # Great set of options for gamg (the constructor default for the velocity block)
+
+        v_name = "velocity"
+
+        self.petsc_options[f"fieldsplit_{v_name}_ksp_type"] = "cg"
+        self.petsc_options[f"fieldsplit_{v_name}_pc_type"]  = "gamg"
+        self.petsc_options[f"fieldsplit_{v_name}_pc_gamg_type"]  = "agg"
+        self.petsc_options[f"fieldsplit_{v_name}_pc_gamg_repartition"]  = True
+        self.petsc_options[f"fieldsplit_{v_name}_pc_mg_type"]  = "additive"
+        self.petsc_options[f"fieldsplit_{v_name}_pc_gamg_agg_nsmooths"] = 2
+        self.petsc_options[f"fieldsplit_{v_name}_mg_levels_ksp_max_it"] = 3
+        self.petsc_options[f"fieldsplit_{v_name}_mg_levels_ksp_converged_maxits"] = None
+
+    def _set_velocity_gmg_options(self):
+        """
+        Geometric multigrid for the velocity block using the mesh refinement hierarchy
+        (the coarse dms are attached to the solver dm in `_setup_discretisation`). The
+        coarse level operators are assembled by Galerkin projection of the fine-level
+        preconditioning matrix, so they follow the viscosity without re-assembling the
+        coarse problems, and the smoothers are Chebyshev / Jacobi which need no setup beyond
+        an eigenvalue estimate. Unlike gamg, there is no aggregation / repartitioning
+        when the operator is rebuilt.
+        """
+
+        v_name = "velocity"
+
+        for name in ("pc_gamg_type", "pc_gamg_repartition", "pc_gamg_agg_nsmooths"):
+            self.petsc_options.delValue(f"fieldsplit_{v_name}_{name}")
+
+        self.petsc_options[f"fieldsplit_{v_name}_ksp_type"] = "cg"
+        self.petsc_options[f"fieldsplit_{v_name}_pc_type"] = "mg"
+        self.petsc_options[f"fieldsplit_{v_name}_pc_mg_levels"] = len(self.mesh.dm_hierarchy)
+        self.petsc_options[f"fieldsplit_{v_name}_pc_mg_galerkin"] = "pmat"
+        self.petsc_options[f"fieldsplit_{v_name}_pc_mg_type"] = "multiplicative"
+        self.petsc_options[f"fieldsplit_{v_name}_pc_mg_cycle_type"] = "v"
+
+        self.petsc_options[f"fieldsplit_{v_name}_mg_levels_ksp_type"] = "chebyshev"
+        self.petsc_options[f"fieldsplit_{v_name}_mg_levels_ksp_chebyshev_esteig"] = "0,0.1,0,1.1"
+        self.petsc_options[f"fieldsplit_{v_name}_mg_levels_pc_type"] = "jacobi"
+        self.petsc_options[f"fieldsplit_{v_name}_mg_levels_ksp_max_it"] = 3
+        self.petsc_options[f"fieldsplit_{v_name}_mg_levels_ksp_converged_maxits"] = None
+
+        self.petsc_options[f"fieldsplit_{v_name}_mg_coarse_ksp_type"] = "preonly"
+        self.petsc_options[f"fieldsplit_{v_name}_mg_coarse_pc_type"] = "redundant"
+        self.petsc_options[f"fieldsplit_{v_name}_mg_coarse_redundant_pc_type"] = "lu"
 
 
 
@@ -2240,11 +2606,12 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
         return
 
     @timing.routine_timer_decorator
-    def _setup_pointwise_functions(self, verbose=False, debug=False, debug_name=None):
+    def _setup_pointwise_functions(self, verbose=False, debug=False, debug_name=None, asynchronous=False):
         import sympy
 
-        # Any property changes will trigger this
-        if self.is_setup:
+        # Any property changes will trigger this (functions that were generated
+        # by `precompile` and have not been invalidated since are also kept)
+        if self.is_setup or self._pointwise_functions_current:
             if verbose and uw.mpi.rank == 0:
                 print(f"SNES_Stokes_SaddlePt ({self.name}): Pointwise functions do not need to be rebuilt", flush=True)
             return
@@ -2270,9 +2637,9 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
         ## and do these one by one as required by PETSc. However, at the moment, this
         ## is working .. so be careful !!
 
-        F0  = sympy.Array(uw.function.expression.unwrap(self.F0.sym, keep_constants=False, return_self=False))
-        F1  = sympy.Array(uw.function.expression.unwrap(self.F1.sym, keep_constants=False, return_self=False))
-        PF0  = sympy.Array(uw.function.expression.unwrap(self.PF0.sym, keep_constants=False, return_self=False))
+        F0  = sympy.Array(uw.function.expression.unwrap(self.F0.sym, keep_constants=True, return_self=False))
+        F1  = sympy.Array(uw.function.expression.unwrap(self.F1.sym, keep_constants=True, return_self=False))
+        PF0  = sympy.Array(uw.function.expression.unwrap(self.PF0.sym, keep_constants=True, return_self=False))
 
         # JIT compilation needs immutable, matrix input (not arrays)
         self._u_F0 = sympy.ImmutableDenseMatrix(F0)
@@ -2443,10 +2810,12 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
                                        verbose=verbose,
                                        debug=debug,
                                        debug_name=debug_name,
-                                       cache=False)
+                                       asynchronous=asynchronous,)
 
+        self._setup_jacobian_dependencies(tuple(fns_jacobian) + tuple(fns_bd_jacobian), prim_field_list)
 
         self.is_setup = False
+        self._pointwise_functions_current = True
 
         return
 
@@ -2633,9 +3002,12 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
 
         i_jac = self.ext_dict.jac
 
-        PetscDSSetJacobian(              ds.ds, 0, 0, ext.fns_jacobian[i_jac[self._uu_G0]], ext.fns_jacobian[i_jac[self._uu_G1]], ext.fns_jacobian[i_jac[self._uu_G2]], ext.fns_jacobian[i_jac[self._uu_G3]])
-        PetscDSSetJacobian(              ds.ds, 0, 1, ext.fns_jacobian[i_jac[self._up_G0]], ext.fns_jacobian[i_jac[self._up_G1]], ext.fns_jacobian[i_jac[self._up_G2]], ext.fns_jacobian[i_jac[self._up_G3]])
-        PetscDSSetJacobian(              ds.ds, 1, 0, ext.fns_jacobian[i_jac[self._pu_G0]], ext.fns_jacobian[i_jac[self._pu_G1]],                                 NULL,                                 NULL)
+        # Matrix-free: the operator comes from the residual, only the preconditioner is assembled
+        if not self._matrix_free:
+            PetscDSSetJacobian(          ds.ds, 0, 0, ext.fns_jacobian[i_jac[self._uu_G0]], ext.fns_jacobian[i_jac[self._uu_G1]], ext.fns_jacobian[i_jac[self._uu_G2]], ext.fns_jacobian[i_jac[self._uu_G3]])
+            PetscDSSetJacobian(          ds.ds, 0, 1, ext.fns_jacobian[i_jac[self._up_G0]], ext.fns_jacobian[i_jac[self._up_G1]], ext.fns_jacobian[i_jac[self._up_G2]], ext.fns_jacobian[i_jac[self._up_G3]])
+            PetscDSSetJacobian(          ds.ds, 1, 0, ext.fns_jacobian[i_jac[self._pu_G0]], ext.fns_jacobian[i_jac[self._pu_G1]],                                 NULL,                                 NULL)
+
         PetscDSSetJacobianPreconditioner(ds.ds, 0, 0, ext.fns_jacobian[i_jac[self._uu_G0]], ext.fns_jacobian[i_jac[self._uu_G1]], ext.fns_jacobian[i_jac[self._uu_G2]], ext.fns_jacobian[i_jac[self._uu_G3]])
         PetscDSSetJacobianPreconditioner(ds.ds, 0, 1, ext.fns_jacobian[i_jac[self._up_G0]], ext.fns_jacobian[i_jac[self._up_G1]], ext.fns_jacobian[i_jac[self._up_G2]], ext.fns_jacobian[i_jac[self._up_G3]])
         PetscDSSetJacobianPreconditioner(ds.ds, 1, 0, ext.fns_jacobian[i_jac[self._pu_G0]], ext.fns_jacobian[i_jac[self._pu_G1]],                                 NULL,                                 NULL)
@@ -2765,9 +3137,38 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
         for index,name in enumerate(names):
             self._subdict[name] = (isets[index],dms[index])
 
+        # Local indices of velocity / pressure (built on first solve)
+        self._local_field_indices = None
+
         self.is_setup = True
         self.constitutive_model._solver_is_setup = True
 
+    def _get_local_field_indices(self):
+        """
+        Indices of the velocity and pressure dofs in the local vector of the solver dm,
+        used to copy the solution into `u` and `p`. These are computed once from the
+        local section and retained until the discretisation is rebuilt.
+        """
+
+        if self._local_field_indices is None:
+            import numpy as np
+            from underworld3.cython.petsc_discretisation import petsc_section_get_field_indices
+
+            local_section = self.dm.getLocalSection()
+            size = local_section.getStorageSize()
+
+            # All pressure dofs (constrained or not) are needed to separate the
+            # solution in the local vector, velocity is the complement.
+
+            pressure_indices = petsc_section_get_field_indices(local_section, 1)
+
+            velocity_mask = np.ones(size, dtype=bool)
+            velocity_mask[pressure_indices] = False
+            velocity_indices = np.nonzero(velocity_mask)[0]
+
+            self._local_field_indices = (velocity_indices, pressure_indices)
+
+        return self._local_field_indices
 
     @timing.routine_timer_decorator
     def solve(self,
@@ -2791,7 +3192,11 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
         if _force_setup or not self.constitutive_model._solver_is_setup:
             self.is_setup = False
 
+        if self._constants_need_rebuild():
+            self.is_setup = False
+
         self._build(verbose, debug, debug_name)
+        self._update_constants()
 
         # Keep a record of these set-up parameters
         tolerance = self.tolerance
@@ -2801,6 +3206,12 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
         self.mesh.update_lvec()
         self.dm.setAuxiliaryVec(self.mesh.lvec, None)
 
+        self._update_jacobian_lag()
+
+        # Matrix-free: the Pmat pressure block preconditions S but is not part of it
+        cdef KSP ksp = self.snes.getKSP()
+        ierr = UW_KSPSetSchurComplementZeroA11(ksp.ksp, PETSC_TRUE if self._matrix_free else PETSC_FALSE); CHKERRQ(ierr)
+
         gvec = self.dm.getGlobalVec()
         gvec.setArray(0.0)
 
@@ -2865,68 +3276,21 @@ class SNES_Stokes_SaddlePt(SolverBaseClass):
         if verbose and uw.mpi.rank == 0:
                  print(f"SNES Compute Boundary FEM Successfull", flush=True)
 
-        # get index set of pressure and velocity to separate solution from localvec
-        # get local section
-        local_section = self.dm.getLocalSection()
-
-        # Get the index sets for velocity and pressure fields
-        # Field numbers (adjust based on your setup)
-        velocity_field_num = 0
-        pressure_field_num = 1
-
-        # Function to get index set for a field
-        def get_local_field_is(section, field, unconstrained=False):
-            """
-            This function returns the index set of unconstrained points if True, or all points if False.
-            """
-            pStart, pEnd = section.getChart()
-            indices = []
-            for p in range(pStart, pEnd):
-                dof = section.getFieldDof(p, field)
-                if dof > 0:
-                    offset = section.getFieldOffset(p, field)
-                    if not unconstrained and self.Unknowns.p.continuous:
-                        indices.append(offset)
-                    else:
-                        cind = section.getFieldConstraintIndices(p, field)
-                        constrained = set(cind) if cind is not None else set()
-                        for i in range(dof):
-                            if i not in constrained:
-                                index = offset + i
-                                indices.append(index)
-            is_field = PETSc.IS().createGeneral(indices, comm=PETSc.COMM_SELF)
-            return is_field
-
-        # Get index sets for pressure (both constrained and unconstrained points)
-        # we need indexset of pressure field to separate the solution from localvec.
-        # so we don't care whether a point is constrained by bc or not
-        pressure_is = get_local_field_is(local_section, pressure_field_num)
-
-        # Get the total number of entries in the local vector
-        size = self.dm.getLocalVec().getLocalSize()
-
-        # Create a list of all indices
-        all_indices = set(range(size))
-
-        # Get indices of the pressure field
-        pressure_indices = set(pressure_is.getIndices())
-
-        # Compute the complement for the velocity field
-        velocity_indices = sorted(list(all_indices - pressure_indices))
-
-        # Create the index set for velocity
-        velocity_is = PETSc.IS().createGeneral(velocity_indices, comm=PETSc.COMM_SELF)
-
-        # Copy solution back into pressure and velocity variables
+        # Copy solution back into pressure and velocity variables using the
+        # (cached) local indices of each field in the solver's local vector
+
+        velocity_indices, pressure_indices = self._get_local_field_indices()
+        clvec_array = clvec.array_r
+
         with self.mesh.access(self.Unknowns.p, self.Unknowns.u):
              for name, var in self.fields.items():
                  if name=='velocity':
-                     var.vec.array[:] = clvec.getSubVector(velocity_is).array[:]
+                     var.vec.array[:] = clvec_array[velocity_indices]
                  elif name=='pressure':
-                     var.vec.array[:] = clvec.getSubVector(pressure_is).array[:]
+                     var.vec.array[:] = clvec_array[pressure_indices]
 
 
-        self.dm.restoreGlobalVec(clvec)
+        self.dm.restoreLocalVec(clvec)
         self.dm.restoreGlobalVec(gvec)
 
         converged = self.snes.getConvergedReason()
@@ -3,7 +3,7 @@ import sympy
 
 import underworld3
 import underworld3.timing as timing
-from   underworld3.utilities._jitextension import getext
+from   underworld3.utilities._jitextension import getext, constant_values
 
 from petsc4py import PETSc
 
@@ -94,6 +94,15 @@ class Integral:
         cdef DM dm = self.dm
         cdef DS ds = self.dm.getDS()
         cdef PetscScalar val_array[256]
+        cdef PetscScalar constants_array[256]
+
+        # Values of any constant expressions (read by the compiled function)
+        constants = constant_values(dictionaries.constants)
+        if len(constants) > 256:
+            raise RuntimeError("Integral evaluation supports at most 256 constant expressions.")
+        for i, value in enumerate(constants):
+            constants_array[i] = value
+        ierr = PetscDSSetConstants(ds.ds, len(constants), &(constants_array[0])); CHKERRQ(ierr)
 
         # Now set callback...
         ierr = PetscDSSetObjective(ds.ds, 0, ext.fns_residual[0]); CHKERRQ(ierr)
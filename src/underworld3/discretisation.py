@@ -506,12 +506,16 @@ class Mesh(Stateful, uw_object):
 
         self._equation_systems_register = []
 
-        self._evaluation_hash = None
-        self._evaluation_interpolated_results = None
+        self._coord_kdtree = {}
+        self._field_subdms = {}
+        self._evaluation_plan = None
+        self._coords_state = 0
         self._accessed = False
         self._quadrature = False
         self._stale_lvec = True
         self._lvec = None
+        self._lvec_var_states = {}
+        self._lvec_field_indices = {}
         self.petsc_fe = None
 
         self.degree = degree
@@ -912,6 +916,15 @@ class Mesh(Stateful, uw_object):
             )
 
         self._coord_array = {}
+        self._coord_kdtree = {}
+        self._clear_field_subdms()
+        self._partition_face_index = None
+        self._partition_face_ranks = None
+        self._interprocess_face_index = None
+        self._evaluation_plan = None
+
+        # the coordinates have changed (see `EvaluationPlan.update`)
+        self._coords_state += 1
 
         # let's go ahead and do an initial projection from linear (the default)
         # to linear. this really is a nothing operation, but a
@@ -1004,6 +1017,10 @@ class Mesh(Stateful, uw_object):
         """
         This method creates and/or updates the mesh variable local vector.
         If the local vector is already up to date, this method will do nothing.
+
+        Only the variables that were modified (their state changed) since they
+        were last copied are updated. The (ghost-synchronised) local vector of
+        each of these is copied directly into the mesh local vector.
         """
 
         if self._stale_lvec:
@@ -1012,31 +1029,48 @@ class Mesh(Stateful, uw_object):
                 self.dm.createDS()
                 # create the local vector (memory chunk) and attach to original dm
                 self._lvec = self.dm.createLocalVec()
+                self._lvec_var_states = {}
 
-            # push avar arrays into the parent dm array
-            a_global = self.dm.getGlobalVec()
+            with self.access():
+                for var in self.vars.values():
+                    if self._lvec_var_states.get(var.field_id) == var._state:
+                        continue
 
-            # The field decomposition seems to fail if coarse DMs are present
-            names, isets, dms = self.dm.createFieldDecomposition()
+                    lvec_indices, var_indices = self._get_lvec_field_indices(
+                        var.field_id
+                    )
+                    self._lvec.array[lvec_indices] = var.vec.array_r[var_indices]
+
+                    # a variable that is open for writing in an enclosing access
+                    # block may still change, so it needs to be copied again
+                    if var._writeable:
+                        self._lvec_var_states.pop(var.field_id, None)
+                    else:
+                        self._lvec_var_states[var.field_id] = var._state
 
-            with self.access():
-                # traverse subdms, taking user generated data in the subdm
-                # local vec, pushing it into a global sub vec
-                for var, subiset, subdm in zip(self.vars.values(), isets, dms):
-                    lvec = var.vec
-                    subvec = a_global.getSubVector(subiset)
-                    subdm.localToGlobal(lvec, subvec, addv=False)
-                    a_global.restoreSubVector(subiset, subvec)
-
-            for iset in isets:
-                iset.destroy()
-            for dm in dms:
-                dm.destroy()
-
-            self.dm.globalToLocal(a_global, self._lvec)
-            self.dm.restoreGlobalVec(a_global)
             self._stale_lvec = False
 
+    def _get_lvec_field_indices(self, field_id):
+        """
+        Indices of the dofs of a field in the mesh local vector and in the
+        local vector of the field's sub-dm (both in chart order). These are
+        created on first use and retained until the mesh dm changes.
+        """
+
+        if field_id not in self._lvec_field_indices:
+            from underworld3.cython.petsc_discretisation import (
+                petsc_section_get_field_indices,
+            )
+
+            indexset, subdm = self._get_field_subdm(field_id)
+
+            self._lvec_field_indices[field_id] = (
+                petsc_section_get_field_indices(self.dm.getLocalSection(), field_id),
+                petsc_section_get_field_indices(subdm.getLocalSection(), 0),
+            )
+
+        return self._lvec_field_indices[field_id]
+
     @property
     def lvec(self) -> PETSc.Vec:
         """
@@ -1066,7 +1100,7 @@ class Mesh(Stateful, uw_object):
         coords[...] = new_coords[...]
 
         self.dm.setCoordinatesLocal(coord_vec)
-        self.nuke_coords_and_rebuild()
+        self.nuke_coords_and_rebuild(verbose)
 
         # This should not be necessary any more as we now check the
         # coordinates on the DM to see if they have changed (and we rebuild the
@@ -1105,10 +1139,6 @@ class Mesh(Stateful, uw_object):
         timing._incrementDepth()
         stime = time.time()
 
-        if writeable_vars is not None:
-            self._evaluation_hash = None
-            self._evaluation_interpolated_results = None
-
         self._accessed = True
         deaccess_list = []
         for var in self.vars.values():
@@ -1124,25 +1154,14 @@ class Mesh(Stateful, uw_object):
             # create & set vec
             var._set_vec(available=True)
 
-            # grab numpy object, setting read only if necessary
-            var._data = var.vec.array.reshape(-1, var.num_components)
+            # the numpy views are only created if the variable data
+            # is used in this block (see `MeshVariable._map_data`)
+            var._writeable = var in writeable_vars
 
-            if var not in writeable_vars:
-                var._old_data_flag = var._data.flags.writeable
-                var._data.flags.writeable = False
-            else:
+            if var._writeable:
                 # increment variable state
                 var._increment()
 
-            # make view for each var component
-
-            for i in range(0, var.shape[0]):
-                for j in range(0, var.shape[1]):
-                    # var._data_ij[i, j] = var.data[:, var._data_layout(i, j)]
-                    var._data_container[i, j] = var._data_container[i, j]._replace(
-                        data=var.data[:, var._data_layout(i, j)],
-                    )
-
         class exit_manager:
             def __init__(self, mesh):
                 self.mesh = mesh
@@ -1151,38 +1170,36 @@ class Mesh(Stateful, uw_object):
                 pass
 
             def __exit__(self, *args):
-                for var in self.mesh.vars.values():
-                    # only de-access variables we have set access for.
-                    if var not in deaccess_list:
-                        continue
-                    # set this back, although possibly not required.
-                    if var not in writeable_vars:
-                        var._data.flags.writeable = var._old_data_flag
+                # only de-access variables we have set access for.
+                for var in deaccess_list:
+                    if var._data is not None:
+                        # set this back, although possibly not required.
+                        if not var._writeable:
+                            var._data.flags.writeable = var._old_data_flag
+
+                        for i in range(0, var.shape[0]):
+                            for j in range(0, var.shape[1]):
+                                var._data_container[i, j] = var._data_container[
+                                    i, j
+                                ]._replace(
+                                    data=f"MeshVariable[...].data is only available within mesh.access() context",
+                                )
+
                     # perform sync for any modified vars.
 
-                    if var in writeable_vars:
-                        indexset, subdm = self.mesh.dm.createSubDM(var.field_id)
+                    if var._writeable:
+                        indexset, subdm = self.mesh._get_field_subdm(var.field_id)
 
                         # sync ghost values
                         subdm.localToGlobal(var.vec, var._gvec, addv=False)
                         subdm.globalToLocal(var._gvec, var.vec, addv=False)
 
-                        indexset.destroy()
-                        subdm.destroy()
                         self.mesh._stale_lvec = True
 
                     var._data = None
                     var._set_vec(available=False)
                     var._is_accessed = False
 
-                    for i in range(0, var.shape[0]):
-                        for j in range(0, var.shape[1]):
-                            var._data_container[i, j] = var._data_container[
-                                i, j
-                            ]._replace(
-                                data=f"MeshVariable[...].data is only available within mesh.access() context",
-                            )
-
                 timing._decrementDepth()
                 timing.log_result(time.time() - stime, "Mesh.access", 1)
 
@@ -1415,7 +1432,7 @@ class Mesh(Stateful, uw_object):
 
         if meshVars is not None:
             for var in meshVars:
-                iset, subdm = self.dm.createSubDM(var.field_id)
+                iset, subdm = self._get_field_subdm(var.field_id)
                 subdm.setName(var.clean_name)
                 self.dm.globalVectorView(viewer, subdm, var._gvec)
                 self.dm.sectionView(viewer, subdm)
@@ -1424,7 +1441,7 @@ class Mesh(Stateful, uw_object):
         if swarmVars is not None:
             for svar in swarmVars:
                 var = svar._meshVar
-                iset, subdm = self.dm.createSubDM(var.field_id)
+                iset, subdm = self._get_field_subdm(var.field_id)
                 subdm.setName(var.clean_name)
                 self.dm.globalVectorView(viewer, subdm, var._gvec)
                 self.dm.sectionView(viewer, subdm)
@@ -1554,6 +1571,38 @@ class Mesh(Stateful, uw_object):
             )
             return self._coord_array[key]
 
+    def _get_kdtree_for_var(self, var):
+        """
+        This function returns a kd-tree index on the vertex array for the
+        provided variable. The index is cached with the coordinates and
+        discarded when the mesh coordinates are rebuilt.
+        """
+        key = (self.isSimplex, var.degree, var.continuous)
+
+        if key not in self._coord_kdtree:
+            self._coord_kdtree[key] = uw.kdtree.KDTree(self._get_coords_for_var(var))
+
+        return self._coord_kdtree[key]
+
+    def _get_field_subdm(self, field_id):
+        """
+        Returns the (index set, sub-dm) pair for a single field of the mesh dm.
+        These are created on first use and retained until the mesh is rebuilt.
+        """
+
+        if field_id not in self._field_subdms:
+            self._field_subdms[field_id] = self.dm.createSubDM(field_id)
+
+        return self._field_subdms[field_id]
+
+    def _clear_field_subdms(self):
+        for indexset, subdm in self._field_subdms.values():
+            indexset.destroy()
+            subdm.destroy()
+
+        self._field_subdms = {}
+        self._lvec_field_indices = {}
+
     def _get_coords_for_basis(self, degree, continuous):
         """
         This function returns the vertex array for the
@@ -1627,83 +1676,98 @@ class Mesh(Stateful, uw_object):
         if hasattr(self, "_index") and self._index is not None:
             return
 
-        dim = self.dim
-        # def mesh_face_skeleton_kdtree(mesh):
-
         cStart, cEnd = self.dm.getHeightStratum(0)
-        fStart, fEnd = self.dm.getHeightStratum(1)
-        pStart, pEnd = self.dm.getDepthStratum(0)
-        cell_num_faces = self.element.entities[1]
         cell_num_points = self.element.entities[self.dim]
-        face_num_points = self.element.face_entities[self.dim]
 
-        control_points_list = []
-        control_points_cell_list = []
+        # Control points near the cell vertices, plus the centroid, for every cell
 
-        for cell, cell_id in enumerate(range(cStart, cEnd)):
+        cell_point_coords = self._cell_point_coords()
+        cell_centroids = cell_point_coords.mean(axis=1)
 
-            cell_faces = self.dm.getCone(cell_id)
-            points = self.dm.getTransitiveClosure(cell_id)[0][-cell_num_points:]
-            cell_point_coords = self.data[points - pStart]
-            cell_centroid = cell_point_coords.mean(axis=0)
+        control_points = numpy.concatenate(
+            (
+                0.99 * cell_point_coords + 0.01 * cell_centroids[:, numpy.newaxis, :],
+                cell_centroids[:, numpy.newaxis, :],
+            ),
+            axis=1,
+        )
 
-            # for face in range(cell_num_faces):
+        self._indexCoords = control_points.reshape(-1, control_points.shape[-1])
+        self._index = uw.kdtree.KDTree(self._indexCoords)
+        # self._index.build_index()
+        self._indexMap = numpy.repeat(
+            numpy.arange(cStart, cEnd, dtype=numpy.int64), cell_num_points + 1
+        )
 
-            #     points = self.dm.getTransitiveClosure(cell_faces[face])[0][
-            #         -face_num_points:
-            #     ]
-            #     point_coords = self.data[points - pStart]
+        # We don't need an indexMap for this one because there is only one point per cell
+        # and the returned kdtree value IS the index.
+        # Note: self._centroids is not yet defined:
 
-            #     face_centroid = point_coords.mean(axis=0)
-            #     cell_centroid = cell_point_coords.mean(axis=0)
+        self._centroid_index = uw.kdtree.KDTree(self._get_coords_for_basis(0, False))
+        # self._centroid_index.build_index()
 
-            #     # 2D case
-            #     if self.dim == 2:
-            #         vector = point_coords[1] - point_coords[0]
-            #         normal = numpy.array((-vector[1], vector[0]))
+        return
 
-            #     # 3D simplex case (probably also OK for hexes)
-            #     else:
-            #         normal = numpy.cross(
-            #             (point_coords[1] - point_coords[0]),
-            #             (point_coords[2] - point_coords[0]),
-            #         )
+    def _cell_point_coords(self):
+        """
+        Coordinates of the vertices of every local cell as a
+        (num_cells, cell_num_points, cdim) array, extracted in bulk from the dm.
+        """
 
-            #     inward_outward = numpy.sign(normal.dot(face_centroid - cell_centroid))
-            #     normal *= inward_outward / numpy.sqrt(normal.dot(normal))
+        cStart, cEnd = self.dm.getHeightStratum(0)
+        pStart, pEnd = self.dm.getDepthStratum(0)
+        cell_num_points = self.element.entities[self.dim]
 
-            #     inside_control_point = -1e-3 * normal + face_centroid
+        cell_points = petsc_discretisation.petsc_dm_get_closure_points(
+            self.dm, numpy.arange(cStart, cEnd), cell_num_points
+        )
 
-            #     control_points_list.append(inside_control_point)
-            #     control_points_cell_list.append(cell_id)
-            #     control_points_list.append(cell_centroid)
-            #     control_points_cell_list.append(cell_id)
+        return self.data[cell_points - pStart]
 
-            # Add points near the cell vertices
+    def _face_point_coords(self, faces):
+        """
+        Coordinates of the vertices of the given faces as a
+        (num_faces, face_num_points, cdim) array, extracted in bulk from the dm.
+        """
 
-            for i in range(cell_point_coords.shape[0]):
-                control_points_list.append(
-                    0.99 * cell_point_coords[i] + 0.01 * cell_centroid
-                )
-                control_points_cell_list.append(cell_id)
+        pStart, pEnd = self.dm.getDepthStratum(0)
+        face_num_points = self.element.face_entities[self.dim]
 
-            # Add centroid
-            control_points_list.append(cell_centroid)
-            control_points_cell_list.append(cell_id)
+        face_points = petsc_discretisation.petsc_dm_get_closure_points(
+            self.dm, faces, face_num_points
+        )
 
-        self._indexCoords = numpy.array(control_points_list)
-        self._index = uw.kdtree.KDTree(self._indexCoords)
-        # self._index.build_index()
-        self._indexMap = numpy.array(control_points_cell_list, dtype=numpy.int64)
+        return self.data[face_points - pStart]
 
-        # We don't need an indexMap for this one because there is only one point per cell
-        # and the returned kdtree value IS the index.
-        # Note: self._centroids is not yet defined:
+    def _oriented_face_normals(self, face_point_coords, cell_centroids):
+        """
+        Face centroids and unit normals for an array of faces
+        (..., face_num_points, dim), with each normal oriented away from
+        the corresponding cell centroid (..., dim).
+        """
 
-        self._centroid_index = uw.kdtree.KDTree(self._get_coords_for_basis(0, False))
-        # self._centroid_index.build_index()
+        face_centroids = face_point_coords.mean(axis=-2)
 
-        return
+        # 2D case
+        if self.dim == 2:
+            vector = face_point_coords[..., 1, :] - face_point_coords[..., 0, :]
+            normals = numpy.stack((-vector[..., 1], vector[..., 0]), axis=-1)
+
+        # 3D simplex case (probably also OK for hexes)
+        else:
+            normals = numpy.cross(
+                (face_point_coords[..., 1, :] - face_point_coords[..., 0, :]),
+                (face_point_coords[..., 2, :] - face_point_coords[..., 0, :]),
+            )
+
+        inward_outward = numpy.sign(
+            (normals * (face_centroids - cell_centroids)).sum(axis=-1)
+        )
+        normals *= (
+            inward_outward / numpy.sqrt((normals * normals).sum(axis=-1))
+        )[..., numpy.newaxis]
+
+        return face_centroids, normals
 
     def _build_kd_tree_index_PIC(self):
 
@@ -1778,61 +1842,29 @@ class Mesh(Stateful, uw_object):
         ):
             return
 
-        dim = self.dim
-        # def mesh_face_skeleton_kdtree(mesh):
-
         cStart, cEnd = self.dm.getHeightStratum(0)
         fStart, fEnd = self.dm.getHeightStratum(1)
-        pStart, pEnd = self.dm.getDepthStratum(0)
-        num_local_cells = self.dm.getHeightStratum(0)[1]
         cell_num_faces = self.element.entities[1]
-        cell_num_points = self.element.entities[self.dim]
-        face_num_points = self.element.face_entities[self.dim]
 
         # All elements in our mesh are a single type
 
-        mesh_cell_outer_control_points = numpy.ndarray(
-            shape=(cell_num_faces, num_local_cells, self.dim)
-        )
-        mesh_cell_inner_control_points = numpy.ndarray(
-            shape=(cell_num_faces, num_local_cells, self.dim)
-        )
-
-        for cell, cell_id in enumerate(range(cStart, cEnd)):
-            cell_faces = self.dm.getCone(cell_id)
-            points = self.dm.getTransitiveClosure(cell_id)[0][-cell_num_points:]
-            cell_point_coords = self.data[points - pStart]
-
-            for face in range(cell_num_faces):
-
-                points = self.dm.getTransitiveClosure(cell_faces[face])[0][
-                    -face_num_points:
-                ]
-                point_coords = self.data[points - pStart]
+        cell_point_coords = self._cell_point_coords()
+        cell_centroids = cell_point_coords.mean(axis=1)
 
-                face_centroid = point_coords.mean(axis=0)
-                cell_centroid = cell_point_coords.mean(axis=0)
-
-                # 2D case
-                if self.dim == 2:
-                    vector = point_coords[1] - point_coords[0]
-                    normal = numpy.array((-vector[1], vector[0]))
-
-                # 3D simplex case (probably also OK for hexes)
-                else:
-                    normal = numpy.cross(
-                        (point_coords[1] - point_coords[0]),
-                        (point_coords[2] - point_coords[0]),
-                    )
+        cell_faces = petsc_discretisation.petsc_dm_get_cones(
+            self.dm, numpy.arange(cStart, cEnd), cell_num_faces
+        )
+        face_point_coords = self._face_point_coords(numpy.arange(fStart, fEnd))
 
-                inward_outward = numpy.sign(normal.dot(face_centroid - cell_centroid))
-                normal *= inward_outward / numpy.sqrt(normal.dot(normal))
+        # (cell_num_faces, num_local_cells, face_num_points, dim)
+        cell_face_point_coords = face_point_coords[cell_faces.T - fStart]
 
-                outside_control_point = 1e-3 * normal + face_centroid
-                inside_control_point = -1e-3 * normal + face_centroid
+        face_centroids, normals = self._oriented_face_normals(
+            cell_face_point_coords, cell_centroids[numpy.newaxis, :, :]
+        )
 
-                mesh_cell_outer_control_points[face, cell, :] = outside_control_point
-                mesh_cell_inner_control_points[face, cell, :] = inside_control_point
+        mesh_cell_outer_control_points = 1e-3 * normals + face_centroids
+        mesh_cell_inner_control_points = -1e-3 * normals + face_centroids
 
         self.faces_inner_control_points = mesh_cell_inner_control_points
         self.faces_outer_control_points = mesh_cell_outer_control_points
@@ -1894,77 +1926,143 @@ class Mesh(Stateful, uw_object):
 
         cStart, cEnd = self.dm.getHeightStratum(0)
         fStart, fEnd = self.dm.getHeightStratum(1)
-        pStart, pEnd = self.dm.getDepthStratum(0)
-        cell_num_faces = self.element.entities[1]
-        cell_num_points = self.element.entities[self.dim]
-        face_num_points = self.element.face_entities[self.dim]
 
-        boundary_faces = []
-        for face in range(fStart, fEnd):
-            if self.dm.getJoin(face).shape[0] == 1:
-                boundary_faces.append(face)
+        # Boundary faces (of the local domain) have only one supporting cell
 
-        boundary_faces = numpy.array(boundary_faces)
+        support_sizes, supports = petsc_discretisation.petsc_dm_get_supports(
+            self.dm, numpy.arange(fStart, fEnd)
+        )
+        boundary = support_sizes == 1
+        boundary_faces = numpy.arange(fStart, fEnd)[boundary]
+        boundary_cells = supports[boundary, 0]
 
-        control_points_list = []
-        control_point_sign_list = []
+        point_coords = self._face_point_coords(boundary_faces)
+        face_centroids, normals = self._oriented_face_normals(
+            point_coords, self._centroids[boundary_cells - cStart]
+        )
 
-        for face in boundary_faces:
-            cell = self.dm.getJoin(face)[0]
-            points = self.dm.getTransitiveClosure(face)[0][-face_num_points:]
-            point_coords = self.data[points - pStart]
-            face_centroid = point_coords.mean(axis=0)
-            cell_centroid = self._centroids[cell - cStart]
+        # Control points near centroid, then closer to each of the face nodes,
+        # each as an (outside, inside) pair
 
-            # 2D case
-            if self.dim == 2:
-                vector = point_coords[1] - point_coords[0]
-                normal = numpy.array((-vector[1], vector[0]))
+        base_points = numpy.concatenate(
+            (
+                face_centroids[:, numpy.newaxis, :],
+                0.8 * point_coords + 0.2 * face_centroids[:, numpy.newaxis, :],
+            ),
+            axis=1,
+        )
 
-            else:
-                # 3D simplex case (probably also OK for hexes)
-                normal = numpy.cross(
-                    (point_coords[1] - point_coords[0]),
-                    (point_coords[2] - point_coords[0]),
-                )
+        offsets = numpy.array((1e-8, -1e-8)).reshape(1, 1, 2, 1)
+        control_points = (
+            base_points[:, :, numpy.newaxis, :]
+            + offsets * normals[:, numpy.newaxis, numpy.newaxis, :]
+        )
 
-            inward_outward = numpy.sign(normal.dot(face_centroid - cell_centroid))
-            normal *= inward_outward / numpy.sqrt(normal.dot(normal))
+        control_point_kdtree = uw.kdtree.KDTree(
+            control_points.reshape(-1, control_points.shape[-1])
+        )
+        control_point_sign = numpy.tile(
+            numpy.array((-1, 1)), control_points.shape[0] * control_points.shape[1]
+        )
 
-            # Control points near centroid
+        self.boundary_face_control_points_kdtree = control_point_kdtree
+        self.boundary_face_control_points_sign = control_point_sign
 
-            outside_control_point = 1e-8 * normal + face_centroid
-            control_points_list.append(outside_control_point)
-            control_point_sign_list.append(-1)
+        return
 
-            inside_control_point = -1e-8 * normal + face_centroid
-            control_points_list.append(inside_control_point)
-            control_point_sign_list.append(1)
+    def _build_partition_face_index(self):
+        """
+        Identify the faces on the boundary of the local domain and the rank
+        that lies across each one (-1 for the boundary of the global domain).
+        The ranks come from the point SF of the distributed dm: a face shared
+        with another process is a leaf (remote rank known) on one side and
+        a root on the other, where the rank is obtained with an SF reduction.
 
-            # Control points closer to face nodes
+        A kd-tree on the centroids of these faces provides a quick estimate of
+        the neighbouring process that owns a point that has left the local domain.
+        """
 
-            for pt in range(0, face_num_points):
+        ## Note: this is collective (SF reduction) the first time it is called
 
-                outside_control_point = (
-                    1e-8 * normal + 0.8 * point_coords[pt] + 0.2 * face_centroid
-                )
-                control_points_list.append(outside_control_point)
-                control_point_sign_list.append(-1)
+        if (
+            hasattr(self, "_partition_face_ranks")
+            and self._partition_face_ranks is not None
+        ):
+            return
 
-                inside_control_point = (
-                    -1e-8 * normal + 0.8 * point_coords[pt] + 0.2 * face_centroid
-                )
-                control_points_list.append(inside_control_point)
-                control_point_sign_list.append(1)
+        from mpi4py import MPI
 
-        control_point_kdtree = uw.kdtree.KDTree(numpy.array(control_points_list))
-        control_point_sign = numpy.array(control_point_sign_list)
+        fStart, fEnd = self.dm.getHeightStratum(1)
+        pStart, pEnd = self.dm.getChart()
 
-        self.boundary_face_control_points_kdtree = control_point_kdtree
-        self.boundary_face_control_points_sign = control_point_sign
+        support_sizes, _ = petsc_discretisation.petsc_dm_get_supports(
+            self.dm, numpy.arange(fStart, fEnd)
+        )
+        local_boundary_faces = numpy.arange(fStart, fEnd)[support_sizes == 1]
+
+        point_neighbour_rank = numpy.full(pEnd - pStart, -1, dtype=numpy.int32)
+
+        if uw.mpi.size > 1:
+            sf = self.dm.getPointSF()
+            nroots, leaves, remotes = sf.getGraph()
+
+            leafdata = numpy.full(pEnd - pStart, uw.mpi.rank, dtype=numpy.int32)
+            sf.reduceBegin(MPI.INT, leafdata, point_neighbour_rank, MPI.MAX)
+            sf.reduceEnd(MPI.INT, leafdata, point_neighbour_rank, MPI.MAX)
+
+            if leaves is not None and len(leaves) > 0:
+                point_neighbour_rank[numpy.asarray(leaves) - pStart] = numpy.asarray(
+                    remotes
+                ).reshape(-1, 2)[:, 0]
+
+        face_ranks = point_neighbour_rank[local_boundary_faces - pStart]
+        face_centroids = self._face_point_coords(local_boundary_faces).mean(axis=1)
+
+        self._partition_face_ranks = face_ranks
+        if face_centroids.shape[0] > 0:
+            self._partition_face_index = uw.kdtree.KDTree(
+                numpy.ascontiguousarray(face_centroids)
+            )
+        else:
+            self._partition_face_index = None
+
+        # The same, restricted to the faces shared with another process
+
+        self._interprocess_face_ranks = face_ranks[face_ranks >= 0]
+        if self._interprocess_face_ranks.shape[0] > 0:
+            self._interprocess_face_index = uw.kdtree.KDTree(
+                numpy.ascontiguousarray(face_centroids[face_ranks >= 0])
+            )
+        else:
+            self._interprocess_face_index = None
 
         return
 
+    def get_neighbour_ranks_for_points(self, points, interprocess_only=False):
+        """
+        Estimate the process that owns each of the given points, which are
+        assumed to lie outside the local domain, from the nearest face on the
+        boundary of the local domain. Returns -1 where that face is on the
+        boundary of the global domain (or there is no local mesh).
+
+        With `interprocess_only`, only the faces shared with another process are
+        considered (-1 is returned only if there are none).
+        """
+
+        self._build_partition_face_index()
+
+        if interprocess_only:
+            index, ranks = self._interprocess_face_index, self._interprocess_face_ranks
+        else:
+            index, ranks = self._partition_face_index, self._partition_face_ranks
+
+        if index is None or points.shape[0] == 0:
+            return numpy.full(points.shape[0], -1, dtype=int)
+
+        _, nearest_face = index.query(points, k=1)
+
+        return ranks[nearest_face].astype(int)
+
     def points_in_domain(self, points, strict_validation=True):
         """
         Determine if the given points lie in this domain.
@@ -1974,13 +2072,24 @@ class Mesh(Stateful, uw_object):
 
         """
 
-        self._mark_local_boundary_faces_inside_and_out()
-
         max_radius = self.get_max_radius()
 
         if points.shape[0] == 0:
             return False
 
+        return self._points_in_local_domain(points, max_radius, strict_validation)
+
+    def _points_in_local_domain(self, points, max_radius, strict_validation=True):
+        """
+        The local (no communication) part of `points_in_domain`, given the global
+        `max_radius` of the cells (see `get_max_radius`). Returns a boolean array.
+        """
+
+        self._mark_local_boundary_faces_inside_and_out()
+
+        if points.shape[0] == 0:
+            return numpy.zeros(0, dtype=bool)
+
         dist2, closest_control_points_ext = (
             self.boundary_face_control_points_kdtree.query(points, k=1, sqr_dists=True)
         )
@@ -2401,6 +2510,9 @@ def MeshVariable(
         mesh.dm = dm1
         mesh.dm_hierarchy[-1] = dm1
 
+        # the field sub-DMs (and lvec indices) belong to the old dm
+        mesh._clear_field_subdms()
+
     return new_meshVariable
 
 
@@ -2496,6 +2608,7 @@ class _MeshVariable(Stateful, uw_object):
 
         self._is_accessed = False
         self._available = False
+        self._writeable = False
 
         ## Note sympy needs a unique symbol even across different meshes
         ## or it will get confused when it clones objects. We try this: add
@@ -2713,6 +2826,9 @@ class _MeshVariable(Stateful, uw_object):
         else:
             i, j = indices
 
+        if self._available and self._data is None:
+            self._map_data()
+
         return self._data_container[i, j]
 
     # We should be careful - this is an INTERPOLATION
@@ -2959,7 +3075,7 @@ class _MeshVariable(Stateful, uw_object):
             data_name = self.clean_name
 
         with self.mesh.access(self):
-            indexset, subdm = self.mesh.dm.createSubDM(self.field_id)
+            indexset, subdm = self.mesh._get_field_subdm(self.field_id)
 
             old_name = self._gvec.getName()
             viewer = PETSc.ViewerHDF5().create(filename, "r", comm=PETSc.COMM_WORLD)
@@ -3084,7 +3200,7 @@ class _MeshVariable(Stateful, uw_object):
 
     def _set_vec(self, available):
         if self._lvec == None:
-            indexset, subdm = self.mesh.dm.createSubDM(self.field_id)
+            indexset, subdm = self.mesh._get_field_subdm(self.field_id)
 
             self._lvec = subdm.createLocalVector()
             self._lvec.zeroEntries()  # not sure if required, but to be sure.
@@ -3122,11 +3238,33 @@ class _MeshVariable(Stateful, uw_object):
         mesh `access()` context manager.
         """
         if self._data is None:
-            raise RuntimeError(
-                "Data must be accessed via the mesh `access()` context manager."
-            )
+            if not self._available:
+                raise RuntimeError(
+                    "Data must be accessed via the mesh `access()` context manager."
+                )
+            self._map_data()
+
         return self._data
 
+    def _map_data(self):
+        """
+        Create the numpy view of the local vector (read only unless this variable
+        was given to `mesh.access()` as writeable) and the per-component views.
+        This happens the first time the data are used in an access block.
+        """
+
+        self._data = self._lvec.array.reshape(-1, self.num_components)
+
+        if not self._writeable:
+            self._old_data_flag = self._data.flags.writeable
+            self._data.flags.writeable = False
+
+        for i in range(0, self.shape[0]):
+            for j in range(0, self.shape[1]):
+                self._data_container[i, j] = self._data_container[i, j]._replace(
+                    data=self._data[:, self._data_layout(i, j)],
+                )
+
     ## ToDo: We should probably deprecate this in favour of using integrals
 
     def min(self) -> Union[float, tuple]:
@@ -2,6 +2,7 @@ from . import analytic
 from ._function import (
     UnderworldFunction,
     evaluate,
+    EvaluationPlan,
     dm_swarm_get_migrate_type,
     dm_swarm_set_migrate_type,
     _dmswarm_get_migrate_type,
@@ -16,6 +17,7 @@ from .expressions import substitute as fn_substitute_expressions
 from .expressions import unwrap as fn_unwrap
 from .expressions import substitute_expr as fn_substitute_one_expression
 from .expressions import is_constant_expr as fn_is_constant_expr
+from .expressions import is_number_expr as fn_is_number_expr
 from .expressions import extract_expressions as fn_extract_expressions
 from .expressions import extract_expressions as fn_extract_expressions_and_functions
 
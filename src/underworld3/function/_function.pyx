@@ -29,6 +29,8 @@ cdef extern from "petsc.h" nogil:
 cdef extern from "petsc_tools.h" nogil:
     PetscErrorCode DMInterpolationSetUp_UW(DMInterpolationInfo ipInfo, PetscDM dm, int petscbool, int petscbool, size_t* owning_cell)
     PetscErrorCode DMInterpolationEvaluate_UW(DMInterpolationInfo ipInfo, PetscDM dm, PetscVec x, PetscVec v)
+    PetscErrorCode DMInterpolationGetReferenceCoordinates_UW(DMInterpolationInfo ipInfo, PetscDM dm, PetscReal* xi)
+    PetscErrorCode DMInterpolationEvaluateReference_UW(DMInterpolationInfo ipInfo, PetscDM dm, PetscVec x, const PetscReal* xi, const PetscInt* field_mask, PetscVec v)
 
 cdef extern from "petsc.h" nogil:
     PetscErrorCode DMInterpolationCreate(MPI_Comm comm, DMInterpolationInfo *ipInfo)
@@ -164,6 +166,242 @@ class UnderworldFunction(sympy.Function):
         return ourcls
 
 
+def _coords_hash(coords):
+    import xxhash
+
+    xxh = xxhash.xxh64()
+    xxh.update(np.ascontiguousarray(coords))
+    return xxh.intdigest()
+
+
+cdef class EvaluationPlan:
+    """
+    The point location needed to evaluate mesh variables at a fixed set of
+    coordinates: which points lie in the (local) domain, their owning cells
+    and their reference coordinates in those cells.
+
+    A plan can be passed to `evaluate` to skip the point location when
+    expressions are evaluated repeatedly at the same points (e.g. sample points
+    that are re-evaluated every timestep). The plan is rebuilt automatically if
+    the mesh is deformed. `evaluate` also keeps the most recent plan on the mesh
+    and re-uses it if it is called again with identical coordinates.
+
+    Parameters
+    ----------
+    mesh:
+        The mesh on which the variables to be evaluated are defined.
+    coords: numpy.ndarray
+        Numpy array of coordinates at which expressions will be evaluated.
+    check_domain:
+        Determine which points lie in the local domain (those that do not will
+        be evaluated by `rbf_evaluate`). If False, all points must be in the domain.
+
+    Example
+    -------
+    >>> plan = uw.function.EvaluationPlan(mesh, sample_coords)
+    >>> T_samples = uw.function.evaluate(T.sym, plan=plan)
+    """
+
+    cdef DMInterpolationInfo ipInfo
+    cdef bint _ipinfo_created
+    cdef object _mesh
+    cdef readonly np.ndarray coords
+    cdef readonly np.ndarray in_or_not
+    cdef readonly np.ndarray xi
+    cdef readonly Py_ssize_t n_interior
+    cdef readonly bint check_domain
+    cdef object _coords_hash
+    cdef object _mesh_coords_state
+
+    def __cinit__(self):
+        self._ipinfo_created = False
+
+    def __init__(self, mesh, np.ndarray coords, check_domain=True):
+
+        import weakref
+
+        if coords.ndim != 2 or coords.shape[1] not in [2,3]:
+            raise ValueError("Provided `coords` must be 2 dimensional array of coordinates.\n"
+                             "For n coordinates:  [[x_0,y_0,z_0],...,[x_n,y_n,z_n]].")
+
+        self._mesh = weakref.ref(mesh)
+        self.coords = np.array(coords, dtype=np.double, order="C")
+        self.check_domain = check_domain
+        self._coords_hash = _coords_hash(self.coords)
+        self._mesh_coords_state = None
+
+        self._setup()
+
+    def __dealloc__(self):
+        self._destroy()
+
+    cdef _destroy(self):
+        cdef PetscErrorCode ierr
+
+        if self._ipinfo_created:
+            ierr = DMInterpolationDestroy(&self.ipInfo)
+            self._ipinfo_created = False
+
+    @property
+    def mesh(self):
+        return self._mesh()
+
+    def matches(self, np.ndarray coords):
+        """True if this plan was built for `coords`"""
+
+        if coords is self.coords:
+            return True
+
+        if coords.shape[0] != self.coords.shape[0] or coords.shape[1] != self.coords.shape[1]:
+            return False
+
+        return _coords_hash(np.asarray(coords, dtype=np.double)) == self._coords_hash
+
+    def update(self):
+        """Rebuild the plan if the mesh has been deformed since it was built"""
+
+        if self.mesh._coords_state != self._mesh_coords_state:
+            self._setup()
+
+        return
+
+    def _setup(self):
+
+        cdef PetscErrorCode ierr
+        cdef DM dm
+        cdef np.ndarray coords
+        cdef np.ndarray cells
+        cdef np.ndarray xi
+        cdef double* coords_buff
+        cdef long unsigned int* cells_buff
+
+        mesh = self.mesh
+        if mesh is None:
+            raise RuntimeError("The mesh for this evaluation plan no longer exists.")
+
+        self._destroy()
+        self._mesh_coords_state = mesh._coords_state
+
+        if self.check_domain:
+            # collective (`get_max_radius`), so called on every rank.
+            # It returns a scalar False if there are no local points.
+            self.in_or_not = np.asarray(mesh.points_in_domain(self.coords, strict_validation=False), dtype=bool).reshape(-1)
+            self.in_or_not = self.in_or_not[:self.coords.shape[0]]
+        else:
+            self.in_or_not = np.full((self.coords.shape[0]), True, dtype=bool )
+
+        coords = np.ascontiguousarray(self.coords[self.in_or_not])
+        self.n_interior = coords.shape[0]
+
+        dm = mesh.dm
+        tdim = dm.getDimension()
+
+        if self.n_interior == 0:
+            self.xi = np.empty((0, tdim), dtype=np.double)
+            return
+
+        # Use MPI_COMM_SELF as following uw2 paradigm, interpolations will be local.
+        ierr = DMInterpolationCreate(MPI_COMM_SELF, &self.ipInfo); CHKERRQ(ierr)
+        self._ipinfo_created = True
+        ierr = DMInterpolationSetDim(self.ipInfo, mesh.dim); CHKERRQ(ierr)
+
+        coords_buff = <double*> coords.data
+        ierr = DMInterpolationAddPoints(self.ipInfo, coords.shape[0], coords_buff); CHKERRQ(ierr)
+
+        # grab closest cells to use as hint for DMInterpolationSetUp
+        cells = mesh.get_closest_cells(coords)
+        cells_buff = <long unsigned int*> cells.data
+        ierr = DMInterpolationSetUp_UW(self.ipInfo, dm.dm, 0, 0, <size_t*> cells_buff)
+
+        if ierr != 0:
+            raise RuntimeError("Error encountered when trying to interpolate mesh variable.\n"
+                               "Interpolation location is possibly outside the domain.")
+
+        xi = np.empty((self.n_interior, tdim), dtype=np.double)
+        ierr = DMInterpolationGetReferenceCoordinates_UW(self.ipInfo, dm.dm, <PetscReal*> xi.data); CHKERRQ(ierr)
+        self.xi = xi
+
+        return
+
+    def interpolate(self, Vec lvec, dofcount, field_mask=None):
+        """
+        Interpolate the mesh local vector `lvec` at the interior points of the plan.
+        If `field_mask` is given, only the fields (mesh variables) for which it is
+        non-zero are interpolated. Returns an array of shape `(n_interior, dofcount)`
+        where `dofcount` is the number of components of the interpolated fields.
+        """
+
+        cdef PetscErrorCode ierr
+        cdef DM dm = self.mesh.dm
+        cdef Vec outvec
+        cdef np.ndarray mask
+        cdef PetscInt* mask_buff = NULL
+        cdef np.ndarray outarray = np.empty([self.n_interior, dofcount], dtype=np.double)
+
+        if self.n_interior == 0:
+            return outarray
+
+        if field_mask is not None:
+            mask = np.ascontiguousarray(field_mask, dtype=PETSc.IntType)
+            mask_buff = <PetscInt*> mask.data
+
+        ierr = DMInterpolationSetDof(self.ipInfo, dofcount); CHKERRQ(ierr)
+
+        # Create a PETSc vector to wrap the numpy memory.
+        outvec = PETSc.Vec().createWithArray(outarray, comm=PETSc.COMM_SELF)
+
+        # Use our custom routine as the PETSc one is broken.
+        ierr = DMInterpolationEvaluateReference_UW(self.ipInfo, dm.dm, lvec.vec, <PetscReal*> self.xi.data, mask_buff, outvec.vec); CHKERRQ(ierr)
+        outvec.destroy()
+
+        return outarray
+
+
+def _expression_mesh_var_fns(expr, mesh):
+    """The mesh variable functions (components) of `mesh` that appear in `expr`"""
+
+    if mesh is None or mesh.vars is None:
+        return set()
+
+    mesh_varfns = set()
+    for v in mesh.vars.values():
+        for sub in v.sym:
+            mesh_varfns.add(sub)
+
+    return expr.atoms(UnderworldAppliedFunction) & mesh_varfns
+
+
+def _evaluation_plan(mesh, np.ndarray coords, plan=None):
+    """
+    The evaluation plan for `coords` on `mesh`: `plan` if given, otherwise the
+    most recent plan for the mesh if it matches the coordinates, otherwise a new one.
+    """
+
+    if plan is not None:
+        if plan.mesh is not mesh:
+            raise RuntimeError("The evaluation plan was not built for the mesh of this expression.")
+        if not plan.matches(coords):
+            raise ValueError("The evaluation plan was built for different coordinates.")
+        plan.update()
+        return plan
+
+    # Building a plan is collective, so the most recent one is only re-used
+    # if it matches the coordinates on every rank
+
+    from mpi4py import MPI
+
+    plan = mesh._evaluation_plan
+    matches = plan is not None and plan.matches(coords)
+    if uw.mpi.comm.allreduce(matches, op=MPI.LAND):
+        plan.update()
+        return plan
+
+    plan = EvaluationPlan(mesh, coords)
+    mesh._evaluation_plan = plan
+
+    return plan
+
+
 def evaluate(   expr,
                 np.ndarray coords=None,
                 coord_sys=None,
@@ -171,7 +409,9 @@ def evaluate(   expr,
                 simplify=True,
                 verbose=False,
                 evalf=False,
-                rbf=False,):
+                rbf=False,
+                plan=None,
+                compiled=None,):
     """
     Evaluate a given expression at a list of coordinates.
 
@@ -179,6 +419,12 @@ def evaluate(   expr,
     a single coordinate. Instead the user should provide a numpy array of all
     coordinates requiring evaluation.
 
+    Vector and tensor valued expressions (`sympy.Matrix`) should be evaluated
+    in a single call rather than component by component: the point location,
+    the interpolation of the mesh variables and the lambdify step are then
+    done once for all components. The result has shape `(N, *expr.shape)`
+    with unit dimensions removed, i.e. `(N, ncomp)` for a vector.
+
     Parameters
     ----------
     expr: sympy.Basic
@@ -190,10 +436,22 @@ def evaluate(   expr,
     other_arguments: dict
         Dictionary of other arguments necessary to evaluate function.
         Not yet implemented.
+    plan: EvaluationPlan
+        The point location for `coords` (if `coords` is not given, those
+        of the plan are used).
+    compiled: bool
+        Evaluate the expression with a compiled (JIT) evaluator (`True`) or
+        with sympy's `lambdify` (`False`). By default (`None`), expressions are
+        lambdified unless compiled evaluation has been enabled for expressions
+        that are evaluated repeatedly (`evaluate_after` in
+        `uw.utilities._jitextension.set_jit_compiler_options`). Note that
+        evaluators are compiled by each rank, synchronously.
 
 
     """
 
+    if plan is not None and coords is None:
+        coords = plan.coords
 
     # Extract all the mesh/swarm variables in the expression and check that they all live on the
     # same mesh. If not, this evaluation is not valid.
@@ -255,6 +513,7 @@ def evaluate(   expr,
                             mesh,
                             simplify=simplify,
                             verbose=verbose,
+                            compiled=compiled,
                             )
 
 
@@ -266,19 +525,37 @@ def evaluate(   expr,
                                     coord_sys,
                                     mesh,
                                     simplify=simplify,
-                                    verbose=verbose, )
+                                    verbose=verbose,
+                                    compiled=compiled, )
 
 
 
     else:
-        in_or_not = mesh.points_in_domain(coords, strict_validation=False)
+        plan = _evaluation_plan(mesh, coords, plan)
+        in_or_not = plan.in_or_not
         evaluation_interior = petsc_interpolate( expr,
                                     coords[in_or_not],
                                     coord_sys,
                                     mesh,
                                     simplify=simplify,
-                                    verbose=verbose, )
-        evaluation_interior = np.atleast_1d(evaluation_interior) # handle case where there is only 1 interior point
+                                    verbose=verbose,
+                                    plan=plan,
+                                    compiled=compiled, )
+
+        # Results carry the shape of the expression after the point index
+        # (squeezed), restore that here so interior / exterior values of any
+        # number of points can be combined.
+        if isinstance(expr, sympy.MatrixBase):
+            expr_shape = expr.shape
+        elif isinstance(expr, sympy.vector.Vector):
+            expr_shape = (mesh.dim,)
+        elif isinstance(expr, sympy.vector.Dyadic):
+            expr_shape = (mesh.dim, mesh.dim)
+        else:
+            expr_shape = ()
+
+        evaluation = np.empty(shape=(in_or_not.shape[0], *expr_shape))
+        evaluation[in_or_not] = np.reshape(evaluation_interior, (-1, *expr_shape))
 
         if np.count_nonzero(in_or_not == False) > 0:
             evaluation_exterior = rbf_evaluate( expr,
@@ -286,21 +563,111 @@ def evaluate(   expr,
                                 coord_sys,
                                 mesh,
                                 simplify=simplify,
-                                verbose=verbose, )
-        else:
-            evaluation_exterior = None
+                                verbose=verbose,
+                                compiled=compiled, )
+            evaluation[~in_or_not] = np.reshape(evaluation_exterior, (-1, *expr_shape))
+
+        evaluation = evaluation.squeeze() # consistent behavior with mesh is None and only 1 coord input
+
+    return evaluation
+
 
+## Expressions that have been evaluated recently (least recently used first).
+## The entries hold the simplified expression and its lambdified / compiled
+## forms so that these are not re-generated on every call.
 
-        if len(evaluation_interior.shape) == 1:
-            evaluation = np.empty(shape=(in_or_not.shape[0],))
+from collections import OrderedDict as _OrderedDict
+
+_evaluators = _OrderedDict()
+_evaluators_max_size = 256
+
+
+def _evaluate_expression(expr, r, interpolated_results, np.ndarray coords, simplify=True, compiled=None):
+    """
+    Evaluate `expr` at `coords` given the values of the mesh variable functions
+    that it contains (`interpolated_results`). Matrix expressions are evaluated
+    in a single pass over all their components and constant components are
+    broadcast over the points.
+
+    The mesh variable functions and coordinates are replaced by generic symbols,
+    so the (simplified) expression and its lambdified / compiled forms can be
+    cached and re-used whenever the same expression is evaluated again.
+
+    Returns an array of shape `(N, *expr.shape)` (or `(N,)` for scalar
+    expressions) with unit dimensions squeezed out.
+    """
+
+    from sympy import lambdify
+    from underworld3.utilities._jitextension import getevaluator, _jit_codegen
+
+    varfns = sorted(interpolated_results.keys(), key=lambda varfn: (varfn.meshvar().field_id, varfn.component))
+    field_symbols = [sympy.Symbol(f"uw_f_{i}") for i in range(len(varfns))]
+    coord_symbols = [sympy.Symbol(f"uw_x_{i}") for i in range(len(r))]
+
+    replacements = dict(zip(varfns, field_symbols))
+    replacements.update(zip(r, coord_symbols))
+
+    subbedexpr = expr.xreplace(replacements)
+    if isinstance(subbedexpr, sympy.MatrixBase):
+        subbedexpr = sympy.ImmutableMatrix(subbedexpr)
+
+    key = (subbedexpr, bool(simplify))
+    entry = _evaluators.pop(key, None)
+    if entry is None:
+        entry = {
+            "fn": sympy.simplify(subbedexpr) if simplify else subbedexpr,
+            "count": 0,
+            "lambdified": None,
+            "compilable": True,
+        }
+
+    _evaluators[key] = entry
+    while len(_evaluators) > _evaluators_max_size:
+        _evaluators.popitem(last=False)
+
+    entry["count"] += 1
+    fn = entry["fn"]
+
+    if isinstance(fn, sympy.MatrixBase):
+        shape = fn.shape
+        components = list(fn)
+    else:
+        shape = ()
+        components = [fn]
+
+    n = coords.shape[0]
+    field_values = np.empty((n, len(varfns)))
+    for i, varfn in enumerate(varfns):
+        field_values[:, i] = interpolated_results[varfn]
+
+    if compiled is None:
+        evaluate_after = _jit_codegen["evaluate_after"]
+        compiled = evaluate_after > 0 and entry["count"] >= evaluate_after
+
+    results = None
+
+    if compiled and entry["compilable"]:
+        evaluator = getevaluator(fn, coord_symbols, field_symbols)
+        if evaluator is None:
+            # Fall back to lambdify (and don't try again)
+            entry["compilable"] = False
         else:
-            evaluation = np.empty(shape=(in_or_not.shape[0],evaluation_interior.shape[1] ))
+            results = np.empty((n, len(components)))
+            evaluator(np.ascontiguousarray(coords), field_values, results)
 
-        evaluation[in_or_not] = evaluation_interior
-        evaluation[~in_or_not] = evaluation_exterior
-        evaluation = evaluation.squeeze() # consistent behavior with mesh is None and only 1 coord input
+    if results is None:
+        if entry["lambdified"] is None:
+            # Leave out modules. This is equivalent to SYMPY_DECIDE and can then include scipy if available
+            entry["lambdified"] = lambdify( (coord_symbols, field_symbols), components )
 
-    return evaluation
+        coords_list = [ coords[:,i] for i in range(coords.shape[1]) ]
+        component_values = entry["lambdified"]( coords_list, list(field_values.T) )
+
+        results = np.empty((n, len(components)))
+        for i, values in enumerate(component_values):
+            results[:, i] = values
+
+    return results.reshape((n, *shape)).squeeze()
 
 
 def petsc_interpolate(   expr,
@@ -309,7 +676,9 @@ def petsc_interpolate(   expr,
                 mesh=None,
                 other_arguments=None,
                 simplify=True,
-                verbose=False, ):
+                verbose=False,
+                plan=None,
+                compiled=None, ):
     """
     Evaluate a given expression at a list of coordinates.
 
@@ -382,9 +751,6 @@ def petsc_interpolate(   expr,
     ## Substitute any UWExpressions for their values before calculation
     expr = uw.function.fn_substitute_expressions(expr, keep_constants=False)
 
-    if simplify:
-        expr = sympy.simplify(expr)
-
     if verbose and uw.mpi.rank==0:
         print(f"Expression to be evaluated: {expr}")
 
@@ -397,11 +763,8 @@ def petsc_interpolate(   expr,
     # more general situation.
     #
 
-    varfns = set()
-    if mesh is not None and mesh.vars is not None:
-        for v in mesh.vars.values():
-            for sub in v.sym:
-                varfns.add(sub)
+    # Only the mesh variables that appear in the expression are interpolated
+    varfns = _expression_mesh_var_fns(expr, mesh)
 
     from collections import defaultdict
     interpolant_varfns = defaultdict(lambda : [])
@@ -412,8 +775,8 @@ def petsc_interpolate(   expr,
         interpolant_varfns[varfn.meshvar().mesh].append(varfn)
 
 
-    # 2. Evaluate all mesh variables - there is no real
-    # computational benefit in interpolating a subset.
+    # 2. Evaluate the mesh variables in the expression. The interpolation
+    # skips the fields of all the other variables on the mesh.
 
     def interpolate_vars_on_mesh( varfns, np.ndarray coords ):
         """
@@ -421,86 +784,33 @@ def petsc_interpolate(   expr,
         on a single mesh.
         """
 
-        import xxhash
-
         # Grab the mesh
         mesh = varfns[0].meshvar().mesh
 
-        if mesh._evaluation_hash is not None:
-            xxh = xxhash.xxh64()
-            xxh.update(np.ascontiguousarray(coords))
-            coord_hash = xxh.intdigest()
-
-            # Note: special case: re-evaluating at the same points
-            # after updating mesh variables. This is not captured
-            # by a simple coordinate hash. We kill this in the
-            # .access for mesh variables but this is prone to mistakes
-
-            if False and coord_hash == mesh._evaluation_hash:
-                # if uw.mpi.rank == 0:
-                #     print("Using uw.evaluation cache", flush=True)
-                return mesh._evaluation_interpolated_results
-            else:
-                # if uw.mpi.rank == 0:
-                #     print("No uw.evaluation cache", flush=True)
-                mesh._evaluation_hash = None
-                mesh._evaluation_interpolated_results = None
-
-
-        # For now, eval over all vars
-        vars = mesh.vars.values()
-
-        cdef DM dm = mesh.dm
-        # vars = mesh.vars.values()
-        # Now construct and perform the PETSc evaluate of these variables
-        # Use MPI_COMM_SELF as following uw2 paradigm, interpolations will be local.
-        # TODO: Investigate whether it makes sense to default to global operations here.
-
-        cdef DMInterpolationInfo ipInfo
-        cdef PetscErrorCode ierr
-        ierr = DMInterpolationCreate(MPI_COMM_SELF, &ipInfo); CHKERRQ(ierr)
-        ierr = DMInterpolationSetDim(ipInfo, mesh.dim); CHKERRQ(ierr)
+        # The variables we need, in field order (which is the order of the results)
+        vars = sorted(set(varfn.meshvar() for varfn in varfns), key=lambda var: var.field_id)
 
         # Get and set total count of dofs
         dofcount = 0
         var_start_index = {}
+        field_mask = np.zeros(mesh.dm.getNumFields(), dtype=PETSc.IntType)
         for var in vars:
             var_start_index[var] = dofcount
             dofcount += var.num_components
+            field_mask[var.field_id] = 1
 
-        ierr = DMInterpolationSetDof(ipInfo, dofcount); CHKERRQ(ierr)
-
-        # Add interpolation points
-        # Get c-pointer to data buffer
-        # First grab copy, as we're unsure about the underlying array's
-        # memory layout
-
-        coords = np.ascontiguousarray(coords)
-        cdef double* coords_buff = <double*> coords.data
-        ierr = DMInterpolationAddPoints(ipInfo, coords.shape[0], coords_buff); CHKERRQ(ierr)
+        # The point location is in the evaluation plan (the interior points of
+        # the plan are the `coords` we have here).
 
-        # Generate a vector to hold the interpolation results.
-        # First create a numpy array of the required size.
-        cdef np.ndarray outarray = np.empty([len(coords), dofcount], dtype=np.double)
-        # Now create a PETSc vector to wrap the numpy memory.
-        cdef Vec outvec = PETSc.Vec().createWithArray(outarray,comm=PETSc.COMM_SELF)
+        if plan is not None and plan.mesh is mesh:
+            interpolation_plan = plan
+        else:
+            interpolation_plan = EvaluationPlan(mesh, coords, check_domain=False)
 
         # INTERPOLATE ALL VARIABLES ON THE DM
 
-        # grab closest cells to use as hint for DMInterpolationSetUp
-        cdef np.ndarray cells = mesh.get_closest_cells(coords)
-        cdef long unsigned int* cells_buff = <long unsigned int*> cells.data
-        ierr = DMInterpolationSetUp_UW(ipInfo, dm.dm, 0, 0, <size_t*> cells_buff)
-
-        if ierr != 0:
-            raise RuntimeError("Error encountered when trying to interpolate mesh variable.\n"
-                               "Interpolation location is possibly outside the domain.")
         mesh.update_lvec()
-        cdef Vec pyfieldvec = mesh.lvec
-        # Use our custom routine as the PETSc one is broken.
-
-        ierr = DMInterpolationEvaluate_UW(ipInfo, dm.dm, pyfieldvec.vec, outvec.vec);CHKERRQ(ierr)
-        ierr = DMInterpolationDestroy(&ipInfo);CHKERRQ(ierr)
+        outarray = interpolation_plan.interpolate(mesh.lvec, dofcount, field_mask)
 
         # Create map between array slices and variable functions
         #
@@ -512,17 +822,7 @@ def petsc_interpolate(   expr,
             arr = np.ascontiguousarray(outarray[:,var_start+comp])
             varfns_arrays[varfn] = arr
 
-        # Cache these results
-        xxh = xxhash.xxh64()
-        xxh.update(np.ascontiguousarray(coords))
-        coord_hash = xxh.intdigest()
-        mesh._evaluation_hash = coord_hash
-        mesh._evaluation_interpolated_results = varfns_arrays
-
         del outarray
-        del coords
-        del cells
-        outvec.destroy()
 
         return varfns_arrays
 
@@ -533,20 +833,7 @@ def petsc_interpolate(   expr,
         interpolated_var_values = interpolate_vars_on_mesh(vals, coords)
         interpolated_results.update(interpolated_var_values)
 
-    # 3. Replace mesh variables in the expression with sympy symbols
-    # First generate random string symbols to act as proxies.
-    import string
-    import random
-    varfns_symbols = {}
-    for varfn in interpolated_results.keys():
-        randstr = ''.join(random.choices(string.ascii_uppercase, k = 5))
-        varfns_symbols[varfn] = sympy.Symbol(randstr)
-
-    # subs variable fns in expression for symbols
-    subbedexpr = expr.subs(varfns_symbols)
-
-    # 4. Generate sympy lambdified expression
-    from sympy import lambdify
+    # 3. Coordinate symbols of the expression
     from sympy.vector import CoordSys3D
     dim = coords.shape[1]
 
@@ -562,43 +849,13 @@ def petsc_interpolate(   expr,
     r = N.base_scalars()[0:dim]
 
     # This likely never applies any more
-    if isinstance(subbedexpr, sympy.vector.Vector):
-        subbedexpr = subbedexpr.to_matrix(N)[0:dim,0]
-    elif isinstance(subbedexpr, sympy.vector.Dyadic):
-        subbedexpr = subbedexpr.to_matrix(N)[0:dim,0:dim]
-
-
-
-    lambfn = lambdify( (r, varfns_symbols.values()), subbedexpr )
-    # Leave out modules. This is equivalent to SYMPY_DECIDE and can then include scipy if available
-
-    # 5. Eval generated lambda expression
-    coords_list = [ coords[:,i] for i in range(dim) ]
-    results = lambfn( coords_list, interpolated_results.values() )
-
-
-    # Check shape of original expression
-
-    try:
-        shape = expr.shape
-    except AttributeError:
-        shape = (1,)
-
-    try:
-        results_shape = results.shape
-    except AttributeError:
-        results_shape = (1,)
-
-    # If passed a constant / constant matrix, then the result will not span the coordinates
-    # and we'll need to address that explicitly
-    if shape == results_shape:
-        results_new = np.zeros((coords.shape[0], *shape))
-        results_new[...] = results
-        results = results_new.squeeze()
-
-    else:
-        results = np.moveaxis(results, -1, 0).squeeze()
+    if isinstance(expr, sympy.vector.Vector):
+        expr = expr.to_matrix(N)[0:dim,0]
+    elif isinstance(expr, sympy.vector.Dyadic):
+        expr = expr.to_matrix(N)[0:dim,0:dim]
 
+    # 4/5. Evaluate the expression (all components in a single pass)
+    results = _evaluate_expression(expr, r, interpolated_results, coords, simplify=simplify, compiled=compiled)
 
     # # Truncated out middle index for vector results
     # if isinstance(results,np.ndarray):
@@ -624,7 +881,8 @@ def rbf_evaluate(  expr,
             mesh=None,
             other_arguments=None,
             verbose=False,
-            simplify=True,):
+            simplify=True,
+            compiled=None,):
     """
     Evaluate a given expression at a list of coordinates.
 
@@ -698,42 +956,24 @@ def rbf_evaluate(  expr,
     ## Substitute any uw_expressions for their values before calculation
     expr = uw.function.fn_substitute_expressions(expr, keep_constants=False)
 
-    if simplify:
-        expr = sympy.simplify(expr)
-
-    # 2. Evaluate all mesh variables - there is no real
-    # computational benefit in interpolating a subset.
+    # 2. Evaluate the mesh variables that appear in the expression
     #
 
-    varfns = set()
-    if mesh is not None and mesh.vars is not None:
-        for v in mesh.vars.values():
-            for sub in v.sym:
-                varfns.add(sub)
+    varfns = _expression_mesh_var_fns(expr, mesh)
 
     # Get map of all variable functions (no cache)
     interpolated_results = {}
+    parent_values = {}
     for varfn in varfns:
         parent, component = uw.discretisation.meshVariable_lookup_by_symbol(mesh, varfn)
-        values = parent.rbf_interpolate(coords, nnn=mesh.dim+1)[:,component]
+        if parent not in parent_values:
+            parent_values[parent] = parent.rbf_interpolate(coords, nnn=mesh.dim+1)
+        values = parent_values[parent][:,component]
         interpolated_results[varfn] = values
         if verbose:
             print(f"{varfn} = {parent.name}[{component}]")
 
-    # 3. Replace mesh variables in the expression with sympy symbols
-    # First generate random string symbols to act as proxies.
-
-    import string
-    import random
-    varfns_symbols = {}
-    for varfn in interpolated_results.keys():
-        randstr = ''.join(random.choices(string.ascii_uppercase, k = 5))
-        varfns_symbols[varfn] = sympy.Symbol(randstr)
-    # subs variable fns in expression for symbols
-    subbedexpr = expr.subs(varfns_symbols)
-
-    # 4. Generate sympy lambdified expression
-    from sympy import lambdify
+    # 3. Coordinate symbols of the expression
     from sympy.vector import CoordSys3D
     dim = coords.shape[1]
 
@@ -748,35 +988,9 @@ def rbf_evaluate(  expr,
         N = mesh.N
 
     r = N.base_scalars()[0:dim]
-    lambfn = lambdify( (r, varfns_symbols.values()), subbedexpr )
-
-    # 5. Eval generated lambda expression
-    coords_list = [ coords[:,i] for i in range(dim) ]
-    results = lambfn( coords_list, interpolated_results.values() )
-
-
-    # Check shape of original expression
 
-    try:
-        shape = expr.shape
-    except AttributeError:
-        shape = (1,)
-
-    try:
-        results_shape = results.shape
-    except AttributeError:
-        results_shape = (1,)
-
-    # If passed a constant / constant matrix, then the result will not span the coordinates
-    # and we'll need to address that explicitly
-
-    if shape == results_shape:
-        results_new = np.zeros((coords.shape[0], *shape))
-        results_new[...] = results
-        results = results_new.squeeze()
-
-    else:
-        results = np.moveaxis(results, -1, 0).squeeze()
+    # 4/5. Evaluate the expression (all components in a single pass)
+    results = _evaluate_expression(expr, r, interpolated_results, coords, simplify=simplify, compiled=compiled)
 
     # Constant results are a special case (evaluate to a single value)
 
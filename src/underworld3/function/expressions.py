@@ -96,6 +96,26 @@ def is_constant_expr(fn):
         return True
 
 
+def is_number_expr(fn):
+    """
+    `True` if `fn` is a uw expression with a constant, finite, real (scalar) value.
+    The JIT compiler passes these to the pointwise functions as run-time constants
+    so that they can be changed without recompiling.
+    """
+
+    if not isinstance(fn, UWexpression) or isinstance(fn, UWDerivativeExpression):
+        return False
+
+    value = fn.sym
+
+    if not isinstance(value, sympy.Basic) or isinstance(
+        value, sympy.matrices.MatrixBase
+    ):
+        return False
+
+    return bool(value.is_number and value.is_finite and value.is_real)
+
+
 def extract_expressions(fn):
     import underworld3
 
@@ -169,9 +169,55 @@ PetscErrorCode DMInterpolationSetUp_UW(DMInterpolationInfo ctx, DM dm, PetscBool
 .seealso: DMInterpolationGetVector(), DMInterpolationAddPoints(), DMInterpolationCreate()
 @*/
 PetscErrorCode DMInterpolationEvaluate_UW(DMInterpolationInfo ctx, DM dm, Vec x, Vec v)
+{
+  PetscFunctionBegin;
+  PetscCall(DMInterpolationEvaluateReference_UW(ctx, dm, x, NULL, NULL, v));
+  PetscFunctionReturn(PETSC_SUCCESS);
+}
+
+/*
+  DMInterpolationGetReferenceCoordinates_UW - The reference (cell) coordinates of the
+  interpolation points in their owning cells, so that they can be re-used for repeated
+  evaluations at the same points. xi must be of length ctx->n * (topological dim).
+  Points that were not located in the mesh are given the coordinates 0.
+*/
+PetscErrorCode DMInterpolationGetReferenceCoordinates_UW(DMInterpolationInfo ctx, DM dm, PetscReal *xi)
+{
+  const PetscScalar *coords;
+  PetscInt           cdim, dim, p, d;
+
+  PetscFunctionBegin;
+  PetscValidHeaderSpecific(dm, DM_CLASSID, 2);
+  PetscCall(DMGetCoordinateDim(dm, &cdim));
+  PetscCall(DMGetDimension(dm, &dim));
+  PetscCall(VecGetArrayRead(ctx->coords, &coords));
+  for (p = 0; p < ctx->n; ++p) {
+    PetscReal pcoords[3];
+
+    if (ctx->cells[p] < 0) {
+      for (d = 0; d < dim; ++d) xi[p * dim + d] = 0.0;
+      continue;
+    }
+    for (d = 0; d < cdim; ++d) pcoords[d] = PetscRealPart(coords[p * cdim + d]);
+    PetscCall(DMPlexCoordinatesToReference(dm, ctx->cells[p], 1, pcoords, &xi[p * dim]));
+  }
+  PetscCall(VecRestoreArrayRead(ctx->coords, &coords));
+  PetscFunctionReturn(PETSC_SUCCESS);
+}
+
+/*
+  DMInterpolationEvaluateReference_UW - As DMInterpolationEvaluate_UW, but with the
+  reference coordinates of the points provided (see DMInterpolationGetReferenceCoordinates_UW).
+  If xi is NULL, they are computed here.
+
+  If field_mask is not NULL, only the fields f with field_mask[f] set are interpolated. In that
+  case ctx->dof is the total number of components of those fields, and the values in v are in
+  field order. The other fields are skipped (they are not tabulated).
+*/
+PetscErrorCode DMInterpolationEvaluateReference_UW(DMInterpolationInfo ctx, DM dm, Vec x, const PetscReal *xi_points, const PetscInt *field_mask, Vec v)
 {
   PetscDS   ds;
-  PetscInt  n, p, Nf, field;
+  PetscInt  n, p, Nf, field, dim;
   PetscBool useDS = PETSC_FALSE;
 
   PetscFunctionBegin;
@@ -203,16 +249,23 @@ PetscErrorCode DMInterpolationEvaluate_UW(DMInterpolationInfo ctx, DM dm, Vec x,
     PetscInt           cdim, d;
 
     PetscCall(DMGetCoordinateDim(dm, &cdim));
+    PetscCall(DMGetDimension(dm, &dim));
     PetscCall(VecGetArrayRead(ctx->coords, &coords));
     PetscCall(VecGetArrayWrite(v, &interpolant));
     for (p = 0; p < ctx->n; ++p) {
-      PetscReal    pcoords[3], xi[3];
-      PetscScalar *xa   = NULL;
-      PetscInt     coff = 0, foff = 0, clSize;
+      PetscReal        pcoords[3], xi_p[3];
+      const PetscReal *xi;
+      PetscScalar     *xa   = NULL;
+      PetscInt         coff = 0, foff = 0, clSize;
 
       if (ctx->cells[p] < 0) continue;
-      for (d = 0; d < cdim; ++d) pcoords[d] = PetscRealPart(coords[p * cdim + d]);
-      PetscCall(DMPlexCoordinatesToReference(dm, ctx->cells[p], 1, pcoords, xi));
+      if (xi_points) {
+        xi = &xi_points[p * dim];
+      } else {
+        for (d = 0; d < cdim; ++d) pcoords[d] = PetscRealPart(coords[p * cdim + d]);
+        PetscCall(DMPlexCoordinatesToReference(dm, ctx->cells[p], 1, pcoords, xi_p));
+        xi = xi_p;
+      }
       PetscCall(DMPlexVecGetClosure(dm, NULL, x, ctx->cells[p], &clSize, &xa));
       for (field = 0; field < Nf; ++field) {
         PetscTabulation T;
@@ -224,6 +277,13 @@ PetscErrorCode DMInterpolationEvaluate_UW(DMInterpolationInfo ctx, DM dm, Vec x,
         if (id == PETSCFE_CLASSID) {
           PetscFE fe = (PetscFE)obj;
 
+          if (field_mask && !field_mask[field]) {
+            PetscInt Nb;
+
+            PetscCall(PetscFEGetDimension(fe, &Nb));
+            foff += Nb;
+            continue;
+          }
           PetscCall(PetscFECreateTabulation(fe, 1, 1, xi, 0, &T));
           {
             const PetscReal *basis = T->T[0];
@@ -244,6 +304,10 @@ PetscErrorCode DMInterpolationEvaluate_UW(DMInterpolationInfo ctx, DM dm, Vec x,
 
           // TODO Could use reconstruction if available
           PetscCall(PetscFVGetNumComponents(fv, &Nc));
+          if (field_mask && !field_mask[field]) {
+            foff += Nc;
+            continue;
+          }
           for (PetscInt fc = 0; fc < Nc; ++fc) interpolant[p * ctx->dof + coff + fc] = xa[foff + fc];
           coff += Nc;
           foff += Nc;
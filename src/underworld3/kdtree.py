@@ -3,17 +3,6 @@ import underworld3 as uw
 import numpy as np
 
 
-## Note we are missing the function rbf_interpolator_local_to_kdtree
-#
-# Should be used in this swarm proxy function instead of hand-writing the code:
-#
-#    def _rbf_reduce_to_meshVar(self, meshVar, verbose=False):
-#    """
-#    This method updates a mesh variable for the current
-#    swarm & particle variable state by reducing the swarm to
-#    the nearest point for each particle
-
-
 # inherit from the pykdtree
 class KDTree(_oKDTree):
     def rbf_interpolator_local(
@@ -101,5 +90,82 @@ class KDTree(_oKDTree):
 
         return vals
 
+    def rbf_interpolator_local_to_kdtree(
+        self,
+        coords,
+        data,
+        nnn=1,
+        p=2,
+        verbose=False,
+        weights=None,
+    ):
+        """
+        Performs an inverse distance weighted average of data, known at `coords`, onto the
+        points of the kd-tree (the reverse mapping of `rbf_interpolator_local_from_kdtree`).
+        Each coordinate contributes to its `nnn` nearest kd-tree points, so this is a
+        conservative (particle to node) reduction. Points with no contributions are set to zero.
+
+        Args:
+        coords  : ndarray,
+                The spatial coordinates where the data are known.
+                coords.shape[1] == self.ndim
+        data    : ndarray
+                The known data to map from, data.shape[0] == coords.shape[0]
+        nnn     : int,
+                The number of kd-tree points each coordinate contributes to.
+        p       : int,
+                The power index to calculate weights, ie. pow(distance, -p)
+        verbose : bool,
+                Print when mapping occurs
+        weights : ndarray, optional
+                If provided, filled with the accumulated weights on the kd-tree points
+                (zero weight identifies points that received no contribution).
+        """
+
+        if coords.shape[1] != self.ndim:
+            raise RuntimeError(
+                f"Interpolation coordinates dimensionality ({coords.shape[1]}) is different to kD-tree dimensionality ({self.ndim})."
+            )
+        if data.shape[0] != coords.shape[0]:
+            raise RuntimeError(
+                f"Data does not match coords size array ({data.shape[0]} v ({coords.shape[0]}))"
+            )
+
+        data = data.reshape(data.shape[0], -1)
+
+        coords_contiguous = np.ascontiguousarray(coords)
+        distance_n, closest_n = self.query(coords_contiguous, k=nnn)
+
+        closest_n = closest_n.reshape(-1).astype(np.int64)
+        distance_n = distance_n.reshape(-1)
+
+        if verbose and uw.mpi.rank == 0:
+            print(
+                f"Mapping values to kd-tree with nnn - {nnn} & p {p}  ... start",
+                flush=True,
+            )
+
+        epsilon = 1e-12
+        c_weights = 1 / np.power(epsilon + distance_n, p)
+
+        # scatter-add of the weighted data to the kd-tree points
+
+        Weights = np.bincount(closest_n, weights=c_weights, minlength=self.n)
+        Values = np.empty((self.n, data.shape[1]))
+        for d in range(data.shape[1]):
+            Values[:, d] = np.bincount(
+                closest_n,
+                weights=c_weights * np.repeat(data[:, d], nnn),
+                minlength=self.n,
+            )
+
+        # In this case, weights may be zero
+        Values[Weights > 0] /= Weights[Weights > 0].reshape(-1, 1)
+
+        if isinstance(weights, np.ndarray):
+            weights[...] = Weights.reshape(weights.shape)
+
+        if verbose and uw.mpi.rank == 0:
+            print(f"Mapping values to kd-tree ... finished", flush=True)
 
-## NB the rbf interpolator TO kdtree is missing (and we need that one that we introduced to do a better job of mapping values from swarms to nodes for proxy variables)
+        return Values
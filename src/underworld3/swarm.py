@@ -40,6 +40,345 @@ class SwarmPICLayout(Enum):
     SUBDIVISION = 2
 
 
+## Explicit Runge-Kutta tableaux for swarm advection, order: (a, b).
+## The velocity field is frozen over the step, so the stage times are not needed.
+
+_advection_tableaux = {
+    1: ((), (1.0,)),
+    2: (((0.5,),), (0.0, 1.0)),
+    3: (((0.5,), (-1.0, 2.0)), (1.0 / 6.0, 2.0 / 3.0, 1.0 / 6.0)),
+    4: (
+        ((0.5,), (0.0, 0.5), (0.0, 0.0, 1.0)),
+        (1.0 / 6.0, 1.0 / 3.0, 1.0 / 3.0, 1.0 / 6.0),
+    ),
+}
+
+
+def _rk_advection_step(velocity, coords, dt, tableau, restore_fn=None):
+    """
+    One explicit Runge-Kutta step of dx/dt = velocity(x) on a coordinate buffer.
+    Each stage is a single (batched) call to `velocity` for all the points.
+    Stage points and the final positions are passed through `restore_fn`.
+    """
+
+    a, b = tableau
+
+    k = [velocity(coords)]
+    for row in a:
+        x = coords.copy()
+        for a_ij, k_j in zip(row, k):
+            if a_ij != 0.0:
+                x += (a_ij * dt) * k_j
+
+        if restore_fn is not None:
+            x = restore_fn(x)
+
+        k.append(velocity(x))
+
+    x = coords.copy()
+    for b_i, k_i in zip(b, k):
+        if b_i != 0.0:
+            x += (b_i * dt) * k_i
+
+    if restore_fn is not None:
+        x = restore_fn(x)
+
+    return x
+
+
+## Dormand-Prince 5(4) embedded pair for adaptive advection: (a, b5, b4).
+## The last stage is taken at the 5th order solution (first same as last).
+
+_advection_rk45_tableau = (
+    (
+        (1.0 / 5.0,),
+        (3.0 / 40.0, 9.0 / 40.0),
+        (44.0 / 45.0, -56.0 / 15.0, 32.0 / 9.0),
+        (19372.0 / 6561.0, -25360.0 / 2187.0, 64448.0 / 6561.0, -212.0 / 729.0),
+        (
+            9017.0 / 3168.0,
+            -355.0 / 33.0,
+            46732.0 / 5247.0,
+            49.0 / 176.0,
+            -5103.0 / 18656.0,
+        ),
+        (35.0 / 384.0, 0.0, 500.0 / 1113.0, 125.0 / 192.0, -2187.0 / 6784.0, 11.0 / 84.0),
+    ),
+    (35.0 / 384.0, 0.0, 500.0 / 1113.0, 125.0 / 192.0, -2187.0 / 6784.0, 11.0 / 84.0, 0.0),
+    (
+        5179.0 / 57600.0,
+        0.0,
+        7571.0 / 16695.0,
+        393.0 / 640.0,
+        -92097.0 / 339200.0,
+        187.0 / 2100.0,
+        1.0 / 40.0,
+    ),
+)
+
+
+def _rk45_advection_step(
+    velocity,
+    coords,
+    dt,
+    tolerance,
+    dt_init=None,
+    restore_fn=None,
+    dt_min_fraction=1.0e-4,
+):
+    """
+    Adaptive (Dormand-Prince 5(4)) integration of dx/dt = velocity(x) over `dt`
+    with a separate step size for every point. Steps are rejected and retaken
+    only for the points whose (5th - 4th order) position error exceeds
+    `tolerance`, so only points in fast or strongly varying flow are substepped.
+    Each stage is a single call to `velocity` for the points still in progress.
+    Steps smaller than `dt_min_fraction * |dt|` are always accepted.
+
+    `velocity` is collective, so every rank keeps stepping (with no points in
+    progress) until the points are done on all the ranks.
+
+    Returns the new coordinates and the number of accepted steps for each point.
+    """
+
+    from mpi4py import MPI
+
+    a, b5, b4 = _advection_rk45_tableau
+    e = np.array(b5) - np.array(b4)
+
+    duration = abs(dt)
+    sign = 1.0 if dt >= 0.0 else -1.0
+    h_min = dt_min_fraction * duration
+
+    x = coords.copy()
+    npoints = x.shape[0]
+    steps = np.zeros(npoints, dtype=int)
+
+    if duration == 0.0:
+        return x, steps
+
+    if dt_init is None:
+        dt_init = duration
+
+    t = np.zeros(npoints)
+    h = np.full(npoints, min(abs(dt_init), duration))
+    done = np.zeros(npoints, dtype=bool)
+    k_first = velocity(x)
+
+    while comm.allreduce(not np.all(done), op=MPI.LOR):
+        active = np.where(~done)[0]
+        remaining = duration - t[active]
+        h_active = np.minimum(h[active], remaining)
+        sh = (sign * h_active).reshape(-1, 1)
+
+        x_active = x[active]
+        k = [k_first[active]]
+        for row in a:
+            x_stage = x_active.copy()
+            for a_ij, k_j in zip(row, k):
+                if a_ij != 0.0:
+                    x_stage += a_ij * sh * k_j
+
+            if restore_fn is not None:
+                x_stage = restore_fn(x_stage)
+
+            k.append(velocity(x_stage))
+
+        # The last stage point is the 5th order solution
+
+        error = np.zeros_like(x_active)
+        for e_i, k_i in zip(e, k):
+            if e_i != 0.0:
+                error += e_i * sh * k_i
+
+        error_ratio = np.sqrt((error**2).sum(axis=1)) / tolerance
+        error_ratio[~np.isfinite(error_ratio)] = np.inf
+        accept = (error_ratio <= 1.0) | (h_active <= h_min)
+
+        accepted = active[accept]
+        x[accepted] = x_stage[accept]
+        k_first[accepted] = k[-1][accept]
+        t[accepted] += h_active[accept]
+        steps[accepted] += 1
+        done[accepted] = h_active[accept] >= remaining[accept]
+
+        factor = np.clip(0.9 * np.power(error_ratio + 1.0e-10, -0.2), 0.2, 5.0)
+        factor[~accept] = np.minimum(factor[~accept], 1.0)
+        h[active] = np.maximum(h_active * factor, h_min)
+
+    return x, steps
+
+
+def _sample_on_owning_rank(mesh, sample, coords, max_radius):
+    """
+    Evaluate `sample` (a collective function of an array of points) at `coords`,
+    sending the points that lie outside the local domain to the neighbouring
+    process that owns them (estimated from the partition faces, see
+    `Mesh.get_neighbour_ranks_for_points`) and returning the values. Points that
+    leave the global domain are sampled locally.
+    """
+
+    in_local = mesh._points_in_local_domain(coords, max_radius, strict_validation=False)
+    departing = np.where(~in_local)[0]
+    destination = mesh.get_neighbour_ranks_for_points(coords[departing])
+
+    sent = departing[destination >= 0]
+    destination = destination[destination >= 0]
+
+    kept = np.ones(coords.shape[0], dtype=bool)
+    kept[sent] = False
+
+    send_to = [sent[destination == r] for r in range(uw.mpi.size)]
+    received = comm.alltoall([coords[indices] for indices in send_to])
+    received_counts = [points.shape[0] for points in received]
+
+    values = sample(np.concatenate([coords[kept]] + received))
+    num_kept = np.count_nonzero(kept)
+
+    returned = comm.alltoall(
+        np.split(values[num_kept:], np.cumsum(received_counts)[:-1])
+    )
+
+    result = np.empty((coords.shape[0],) + values.shape[1:], dtype=values.dtype)
+    result[kept] = values[:num_kept]
+    for indices, rank_values in zip(send_to, returned):
+        result[indices] = rank_values
+
+    return result
+
+
+def _advect_swarm_coordinates(
+    swarm,
+    V_fn_matrix,
+    delta_t,
+    substeps=1,
+    order=2,
+    restore_points_to_domain_func=None,
+    evalf=False,
+    tolerance=None,
+):
+    """
+    Advection kernel shared by the swarm `advection` methods.
+
+    The Runge-Kutta stages of all the substeps are taken on a copy of the particle
+    coordinates and the swarm is only updated (and migrated) once, at the end of the
+    step. In parallel, every stage point is checked against the local domain (no
+    communication). If any stage point has left, on any rank, the substep is
+    retaken with the departing stage points sampled on the process that owns them,
+    as if the swarm had been migrated at every stage. Particles that end a substep
+    outside the local domain are migrated before the next substep. The checks
+    cost one or two allreduces per substep.
+
+    With `order="rk45"` each particle is integrated over the whole step with its
+    own adaptive step size (see `_rk45_advection_step`), the substep estimate is
+    only used as the initial trial step. The default `tolerance` is 1/1000 of the
+    smallest cell radius.
+
+    The launch point of the step is stored in `swarm._X0`.
+    """
+
+    from mpi4py import MPI
+
+    if order != "rk45" and order not in _advection_tableaux:
+        raise ValueError(
+            f"Advection order {order} is not supported - "
+            f"choose from {sorted(_advection_tableaux.keys())} or 'rk45'"
+        )
+
+    dim = swarm.dim
+    X0 = swarm._X0
+    mesh = swarm.mesh
+
+    def evaluate_velocity(coords):
+        return uw.function.evaluate(V_fn_matrix, coords, evalf=evalf).reshape(-1, dim)
+
+    # In parallel, record whether any stage point has left the local domain
+
+    max_radius = mesh.get_max_radius() if uw.mpi.size > 1 else None
+    departed = [False]
+
+    def in_local_domain(coords):
+        return mesh._points_in_local_domain(coords, max_radius, strict_validation=False)
+
+    def local_velocity(coords):
+        if max_radius is not None and not departed[0]:
+            departed[0] = not np.all(in_local_domain(coords))
+
+        return evaluate_velocity(coords)
+
+    def owning_rank_velocity(coords):
+        return _sample_on_owning_rank(mesh, evaluate_velocity, coords, max_radius)
+
+    if order == "rk45":
+        if tolerance is None:
+            tolerance = 0.001 * mesh.get_min_radius()
+
+        dt_init = delta_t / substeps
+        dt = delta_t
+        substeps = 1
+
+        def advance(coords, velocity):
+            coords, steps = _rk45_advection_step(
+                velocity,
+                coords,
+                dt,
+                tolerance,
+                dt_init=dt_init,
+                restore_fn=restore_points_to_domain_func,
+            )
+
+            if swarm.verbose and steps.shape[0] > 0:
+                print(
+                    f"{uw.mpi.rank}: rk45 advection - {steps.max()} steps "
+                    f"(mean {steps.mean():.2f})",
+                    flush=True,
+                )
+
+            return coords
+
+    else:
+        tableau = _advection_tableaux[order]
+        dt = delta_t / substeps
+
+        def advance(coords, velocity):
+            return _rk_advection_step(
+                velocity, coords, dt, tableau, restore_points_to_domain_func
+            )
+
+    with swarm.access(X0):
+        X0.data[...] = swarm.particle_coordinates.data[...]
+        coords = X0.data.copy()
+
+    for step in range(0, substeps):
+        departed[0] = False
+        new_coords = advance(coords, local_velocity)
+
+        if uw.mpi.size == 1:
+            coords = new_coords
+            continue
+
+        if comm.allreduce(departed[0], op=MPI.LOR):
+            new_coords = advance(coords, owning_rank_velocity)
+
+        coords = new_coords
+
+        if step == substeps - 1:
+            continue
+
+        leaving = not np.all(in_local_domain(coords))
+
+        if comm.allreduce(leaving, op=MPI.LOR):
+            with swarm.access(swarm.particle_coordinates):
+                swarm.particle_coordinates.data[...] = coords[...]
+
+            with swarm.access():
+                coords = swarm.particle_coordinates.data.copy()
+
+    with swarm.access(swarm.particle_coordinates):
+        swarm.particle_coordinates.data[...] = coords[...]
+
+    return
+
+
 # Note - much of the setup is necessarily the same as the MeshVariable
 # and the duplication should be removed.
 
@@ -70,6 +409,11 @@ class SwarmVariable(Stateful, uw_object):
         A symbolic form for printing etc (sympy / latex)
     rebuild_on_cycle:
         For cyclic swarm variables — True is the best choice for continuous fields
+    proxy_update:
+        How the proxy mesh variable is computed from the particles: "interpolate" (default)
+        samples the nearest particles at each node (inverse-distance weighting), "average"
+        is a conservative particle to node average in which each particle contributes to its
+        nearest node (nodes without particles take the nearest particle value)
 
     """
 
@@ -88,6 +432,7 @@ class SwarmVariable(Stateful, uw_object):
         _nn_proxy=False,
         varsymbol=None,
         rebuild_on_cycle=True,
+        proxy_update="interpolate",
     ):
         if name in swarm.vars.keys():
             raise ValueError(
@@ -177,6 +522,7 @@ class SwarmVariable(Stateful, uw_object):
 
         self.swarm._vars[self.clean_name] = self
         self._is_accessed = False
+        self._writeable = False
 
         # proxy variable
         self._proxy = _proxy
@@ -184,6 +530,13 @@ class SwarmVariable(Stateful, uw_object):
         self._proxy_degree = proxy_degree
         self._proxy_continuous = proxy_continuous
         self._nn_proxy = _nn_proxy
+
+        if proxy_update not in ("interpolate", "average"):
+            raise ValueError(
+                f"Unknown proxy_update '{proxy_update}'. Supported values are 'interpolate' and 'average'."
+            )
+        self._proxy_update = proxy_update
+
         self._create_proxy_variable()
 
         # recycle swarm
@@ -218,6 +571,9 @@ class SwarmVariable(Stateful, uw_object):
         else:
             i, j = indices
 
+        if self._is_accessed and self._data is None:
+            self._map_data()
+
         return self._data_container[i, j]
 
     ## Should be a single master copy
@@ -275,6 +631,9 @@ class SwarmVariable(Stateful, uw_object):
         if not self._meshVar:
             return
 
+        elif self._proxy_update == "average":
+            self._rbf_reduce_to_meshVar(self._meshVar)
+
         else:
             self._rbf_to_meshVar(self._meshVar)
 
@@ -285,7 +644,9 @@ class SwarmVariable(Stateful, uw_object):
         """
         Here is how it works: for each particle, create a distance-weighted average on the node data
 
-        Todo: caching the k-d trees etc for the proxy-mesh-variable nodal points
+        The particle kd-tree and the neighbour weights for the proxy-mesh-variable nodal
+        points are cached on the swarm and only rebuilt when the particles move.
+
         Todo: some form of global fall-back for when there are no particles on a processor
         """
 
@@ -300,7 +661,7 @@ class SwarmVariable(Stateful, uw_object):
 
         new_coords = meshVar.coords
 
-        Values = self.rbf_interpolate(new_coords, verbose=verbose, nnn=nnn)
+        Values = self._rbf_interpolate(new_coords, verbose=verbose, nnn=nnn, cache=True)
 
         with meshVar.mesh.access(meshVar):
             meshVar.data[...] = Values[...]
@@ -318,7 +679,8 @@ class SwarmVariable(Stateful, uw_object):
             1) for each particle, create a distance-weighted average on the node data
             2) check to see which nodes have zero weight / zero contribution and replace with nearest particle value
 
-        Todo: caching the k-d trees etc for the proxy-mesh-variable nodal points
+        The kd-tree for the mesh variable nodes is cached on the mesh.
+
         Todo: some form of global fall-back for when there are no particles on a processor
 
         """
@@ -329,23 +691,16 @@ class SwarmVariable(Stateful, uw_object):
 
         # 1 - Average particles to nodes with distance weighted average
 
-        kd = uw.kdtree.KDTree(meshVar.coords)
+        kd = self.swarm.mesh._get_kdtree_for_var(meshVar)
+        w = np.zeros(meshVar.coords.shape[0])
 
-        with self.swarm.access():
-            d, n = kd.query(self.swarm.data, k=1)
-
-            node_values = np.zeros((meshVar.coords.shape[0], self.num_components))
-            w = np.zeros(meshVar.coords.shape[0])
-
-            if not self._nn_proxy:
-                for i in range(self.data.shape[0]):
-                    # if b[i]:
-                    node_values[n[i], :] += self.data[i, :] / (1.0e-24 + d[i])
-                    w[n[i]] += 1.0 / (1.0e-24 + d[i])
-
-                node_values[np.where(w > 0.0)[0], :] /= w[np.where(w > 0.0)[0]].reshape(
-                    -1, 1
+        if not self._nn_proxy:
+            with self.swarm.access():
+                node_values = kd.rbf_interpolator_local_to_kdtree(
+                    self.swarm.data, self.data, nnn=1, p=1, verbose=verbose, weights=w
                 )
+        else:
+            node_values = np.zeros((meshVar.coords.shape[0], self.num_components))
 
         # 2 - set NN vals on mesh var where w == 0.0
 
@@ -364,6 +719,15 @@ class SwarmVariable(Stateful, uw_object):
         # as we take care of the case where some nodes coincide (likely if used with mesh2mesh)
         # We try to eliminate contributions from recently remeshed particles
 
+        return self._rbf_interpolate(new_coords, verbose=verbose, nnn=nnn)
+
+    def _rbf_interpolate(self, new_coords, verbose=False, nnn=None, cache=False):
+        """
+        Inverse-distance mapping of the particle data to `new_coords` using the
+        swarm's shared particle kd-tree. If `cache` is set, the neighbour weights
+        for `new_coords` are retained on the swarm (proxy variable nodes).
+        """
+
         import numpy as np
 
         with self.swarm.access():
@@ -379,34 +743,59 @@ class SwarmVariable(Stateful, uw_object):
         if nnn > data_size[0]:
             nnn = data_size[0]
 
-        with self.swarm.access():
-            if self.swarm.recycle_rate > 1:
-                not_remeshed = self.swarm._remeshed.data[:, 0] != 0
-                D = self.data[not_remeshed].copy()
-
-                kdt = uw.kdtree.KDTree(
-                    self.swarm.particle_coordinates.data[not_remeshed, :]
-                )
-            else:
-                D = self.data.copy()
-                kdt = uw.kdtree.KDTree(self.swarm.particle_coordinates.data[:, :])
+        mask, closest_n, weights = self.swarm._particle_rbf_weights(
+            new_coords, nnn, not_remeshed=True, cache=cache
+        )
 
-            # kdt.build_index()
+        if verbose and uw.mpi.rank == 0:
+            print(f"Mapping values with nnn - {nnn}  ... start", flush=True)
 
-            values = kdt.rbf_interpolator_local(new_coords, D, nnn, 2, verbose)
+        with self.swarm.access():
+            if mask is not None:
+                D = self.data[mask]
+            else:
+                D = self.data
 
-            del kdt
+            if weights is None:
+                values = D[closest_n]
+            else:
+                values = np.einsum("sdc,sd->sc", D[closest_n], weights)
 
         return values
 
     @property
     def data(self):
         if self._data is None:
-            raise RuntimeError(
-                "Data must be accessed via the swarm `access()` context manager."
-            )
+            if not self._is_accessed:
+                raise RuntimeError(
+                    "Data must be accessed via the swarm `access()` context manager."
+                )
+            self._map_data()
+
         return self._data
 
+    def _map_data(self):
+        """
+        Fetch the swarm field (read only unless this variable was given to
+        `swarm.access()` as writeable) and create the per-component views.
+        This happens the first time the data are used in an access block.
+        """
+
+        self._data = self.swarm.dm.getField(self.clean_name).reshape(
+            (-1, self.num_components)
+        )
+
+        if not self._writeable:
+            self._old_data_flag = self._data.flags.writeable
+            self._data.flags.writeable = False
+
+        if self._proxy:
+            for i in range(0, self.shape[0]):
+                for j in range(0, self.shape[1]):
+                    self._data_container[i, j] = self._data_container[i, j]._replace(
+                        data=self._data[:, self._data_layout(i, j)],
+                    )
+
     @property
     def sym(self):
         return self._meshVar.sym
@@ -716,99 +1105,255 @@ class IndexSwarmVariable(SwarmVariable):
         update_type 1: calculate the material property value on mesh_levelset nodes from the nearest N particles directly.
 
         """
+        num_nodes = self._meshLevelSetVars[0].coords.shape[0]
+
         if self.update_type == 0:
-            kd = uw.kdtree.KDTree(self._meshLevelSetVars[0].coords)
+            kd = self.swarm.mesh._get_kdtree_for_var(self._meshLevelSetVars[0])
 
             with self.swarm.access():
                 n_distance, n_indices = kd.query(
                     self.swarm.particle_coordinates.data, k=self.nnn
                 )
-                kd_swarm = uw.kdtree.KDTree(self.swarm.particle_coordinates.data)
+                kd_swarm, _ = self.swarm._particle_kdtree()
                 # n, d, b = kd_swarm.find_closest_point(self._meshLevelSetVars[0].coords)
                 d, n = kd_swarm.query(
                     self._meshLevelSetVars[0].coords, k=1, sqr_dists=True
                 )
+                material = self.data[:, 0].copy()
+
+            # Each particle contributes to the (equally) nearest nodes within the radius
+
+            contributes = np.isclose(n_distance, n_distance[:, 0:1]) & (
+                n_distance < self.radius_s
+            )
+            particle_material = np.broadcast_to(
+                material.reshape(-1, 1), n_distance.shape
+            )
+
+            node_values, w = self._level_set_sums(
+                num_nodes,
+                n_indices[contributes],
+                1.0 / (1.0e-16 + n_distance[contributes]),
+                particle_material[contributes],
+            )
+
+            # if there is no material found,
+            # impose a near-neighbour hunt for a valid material and set that one
+            ind_w0 = np.where(w == 0.0)[0]
+            nn_material = material[n[ind_w0]].reshape(-1, 1)
 
-            for ii in range(self.indices):
-                meshVar = self._meshLevelSetVars[ii]
-
-                with self.swarm.mesh.access(meshVar), self.swarm.access():
-                    node_values = np.zeros((meshVar.data.shape[0],))
-                    w = np.zeros((meshVar.data.shape[0],))
-
-                    for i in range(self.data.shape[0]):
-                        tem = np.isclose(n_distance[i, :], n_distance[i, 0])
-                        dist = n_distance[i, tem]
-                        indices = n_indices[i, tem]
-                        tem = dist < self.radius_s
-                        dist = dist[tem]
-                        indices = indices[tem]
-                        for j, ind in enumerate(indices):
-                            node_values[ind] += (
-                                np.isclose(self.data[i], ii) / (1.0e-16 + dist[j])
-                            )[0]
-                            w[ind] += 1.0 / (1.0e-16 + dist[j])
-
-                    node_values[np.where(w > 0.0)[0]] /= w[np.where(w > 0.0)[0]]
-                    meshVar.data[:, 0] = node_values[...]
-
-                    # if there is no material found,
-                    # impose a near-neighbour hunt for a valid material and set that one
-                    ind_w0 = np.where(w == 0.0)[0]
-                    if len(ind_w0) > 0:
-                        ind_ = np.where(self.data[n[ind_w0]] == ii)[0]
-                        if len(ind_) > 0:
-                            meshVar.data[ind_w0[ind_]] = 1.0
         elif self.update_type == 1:
             with self.swarm.access():
-                kd = uw.kdtree.KDTree(self.swarm.particle_coordinates.data)
+                kd, _ = self.swarm._particle_kdtree()
                 n_distance, n_indices = kd.query(
                     self._meshLevelSetVars[0].coords, k=self.nnn, sqr_dists=True
                 )
+                material = self.data[:, 0].copy()
 
+            # Each node samples the nearest particles within the radius
+            # (only the nearest nnn_bc for the nodes listed in ind_bc)
+
+            contributes = n_distance < self.radius_s
+            if self.ind_bc is not None:
+                bc_nodes = np.zeros(num_nodes, dtype=bool)
+                bc_nodes[np.asarray(self.ind_bc, dtype=int)] = True
+                contributes[bc_nodes, self.nnn_bc :] = False
+
+            node_ids = np.broadcast_to(
+                np.arange(num_nodes).reshape(-1, 1), n_distance.shape
+            )
+
+            node_values, w = self._level_set_sums(
+                num_nodes,
+                node_ids[contributes],
+                1.0 / (n_distance[contributes] + 1.0e-16),
+                material[n_indices[contributes]],
+            )
+
+            # if there is no material found,
+            # impose a near-neighbour hunt for a valid material and set that one
+            ind_w0 = np.where(w == 0.0)[0]
+            nn_material = material[n_indices[ind_w0]]
+
+        else:
+            return
+
+        node_values[w > 0.0] /= w[w > 0.0].reshape(-1, 1)
+
+        nn_nodes = np.broadcast_to(ind_w0.reshape(-1, 1), nn_material.shape)
+        valid = (nn_material >= 0) & (nn_material < self.indices)
+        node_values[nn_nodes[valid], nn_material[valid].astype(int)] = 1.0
+
+        with self.swarm.mesh.access(*self._meshLevelSetVars):
             for ii in range(self.indices):
-                meshVar = self._meshLevelSetVars[ii]
-                with self.swarm.mesh.access(meshVar), self.swarm.access():
-                    node_values = np.zeros((meshVar.data.shape[0],))
-                    w = np.zeros((meshVar.data.shape[0],))
-                    for i in range(meshVar.data.shape[0]):
-                        if i not in self.ind_bc:
-                            ind = np.where(n_distance[i, :] < self.radius_s)
-                            a = 1.0 / (n_distance[i, ind] + 1.0e-16)
-                            w[i] = np.sum(a)
-                            b = np.isclose(self.data[n_indices[i, ind]], ii)
-                            node_values[i] = np.sum(np.dot(a, b))
-                            if ind[0].size == 0:
-                                w[i] = 0
-                        else:
-                            ind = np.where(n_distance[i, : self.nnn_bc] < self.radius_s)
-                            a = 1.0 / (n_distance[i, : self.nnn_bc][ind] + 1.0e-16)
-                            w[i] = np.sum(a)
-                            b = np.isclose(
-                                self.data[n_indices[i, : self.nnn_bc][ind]], ii
-                            )
-                            node_values[i] = np.sum(np.dot(a, b))
-                            if ind[0].size == 0:
-                                w[i] = 0
-
-                    node_values[np.where(w > 0.0)[0]] /= w[np.where(w > 0.0)[0]]
-                    meshVar.data[:, 0] = node_values[...]
-
-                    # if there is no material found,
-                    # impose a near-neighbour hunt for a valid material and set that one
-                    ind_w0 = np.where(w == 0.0)[0]
-                    if len(ind_w0) > 0:
-                        ind_ = np.where(self.data[n_indices[ind_w0]] == ii)[0]
-                        if len(ind_) > 0:
-                            meshVar.data[ind_w0[ind_]] = 1.0
+                self._meshLevelSetVars[ii].data[:, 0] = node_values[:, ii]
+
         return
 
+    def _level_set_sums(self, num_nodes, nodes, weights, materials):
+        """
+        Scatter-add weighted (node, material) contributions for all material
+        levels in a single sweep. Returns the (num_nodes, indices) array of
+        weighted material sums and the (num_nodes,) total weights.
+        """
+
+        nodes = np.asarray(nodes, dtype=np.int64)
+        w = np.bincount(nodes, weights=weights, minlength=num_nodes)
+
+        valid = (materials >= 0) & (materials < self.indices)
+        node_values = np.bincount(
+            nodes[valid] * self.indices + materials[valid].astype(int),
+            weights=weights[valid],
+            minlength=num_nodes * self.indices,
+        ).reshape(num_nodes, self.indices)
+
+        return node_values, w
+
+
+class _SwarmParticleIndex:
+    """
+    The kd-tree on the local particle coordinates, the rbf weights derived
+    from it and the bulk particle removal that invalidates them, shared by
+    the swarm types (`PICSwarm` and `Swarm`).
+    """
+
+    def _clear_particle_index(self):
+        """
+        Discard the cached particle kd-tree and everything derived from it
+        (rbf neighbour weights and nearest-neighbour maps).
+        """
+
+        self._index = None
+        self._particle_index = {}
+        self._rbf_weights = {}
+        self._nnmapdict = {}
+
+    def _particle_kdtree(self, not_remeshed=False):
+        """
+        Returns a kd-tree index on the local particle coordinates that is shared by
+        all the swarm variables (proxy updates, rbf interpolation, nearest-neighbour maps).
+        The index is built on demand and rebuilt when the swarm state or the number
+        of local particles changes.
+
+        If `not_remeshed` is True (only relevant if `recycle_rate > 1`), the index only
+        covers the particles that were not recently remeshed and the boolean mask of those
+        particles is also returned (otherwise the mask is None).
+        """
+
+        not_remeshed = not_remeshed and self.recycle_rate > 1
+
+        key = (self._state, self.dm.getLocalSize())
+        if not_remeshed:
+            key += (self._remeshed._state,)
+
+        cached = self._particle_index.get(not_remeshed)
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+
+        with self.access():
+            if not_remeshed:
+                mask = self._remeshed.data[:, 0] != 0
+                coords = self.particle_coordinates.data[mask, :]
+            else:
+                mask = None
+                coords = self.particle_coordinates.data.copy()
+
+        self._index = uw.kdtree.KDTree(np.ascontiguousarray(coords))
+        self._particle_index[not_remeshed] = (key, self._index, mask)
+
+        return self._index, mask
+
+    def _particle_rbf_weights(self, coords, nnn, not_remeshed=False, cache=False):
+        """
+        Neighbour lists and normalised inverse-distance (squared) weights from the
+        particles to the given coordinates, using the shared particle kd-tree.
+        With `cache=True` the result is retained until the particle index is rebuilt
+        (intended for the fixed nodal coordinates of proxy mesh variables).
+
+        Returns the particle mask (see `_particle_kdtree`), the neighbour
+        indices and the weights (None if nnn == 1).
+        """
+
+        kdt, mask = self._particle_kdtree(not_remeshed)
+
+        if cache:
+            import xxhash
+
+            h = xxhash.xxh64()
+            h.update(np.ascontiguousarray(coords))
+            weights_key = (h.intdigest(), nnn, mask is not None)
+
+            cached = self._rbf_weights.get(weights_key)
+            if cached is not None and cached[0] is kdt:
+                return mask, cached[1], cached[2]
+
+        distance_n, closest_n = kdt.query(coords, k=nnn)
+
+        if np.any(closest_n > kdt.n):
+            raise RuntimeError(
+                "Error in _particle_rbf_weights - a nearest neighbour wasn't found"
+            )
+
+        if nnn == 1:
+            weights = None
+        else:
+            epsilon = 1e-12
+            weights = 1 / np.power(epsilon + distance_n, 2)
+            weights /= np.sum(weights, axis=1).reshape(-1, 1)
+
+        if cache:
+            self._rbf_weights[weights_key] = (kdt, closest_n, weights)
+
+        return mask, closest_n, weights
+
+    @timing.routine_timer_decorator
+    def remove_particles(self, remove, update_proxies=True):
+        """
+        Remove local particles in bulk.
+
+        Parameters
+        ----------
+        remove : numpy.ndarray
+            A boolean mask over the local particles (True to remove), or an
+            array of local particle indices.
+        update_proxies : bool
+            Refresh the proxy mesh variables of the swarm variables after the
+            removal. This is collective, so the call must then be made on all
+            ranks (with an empty `remove` where there is nothing to delete).
+            Internal callers that refresh the proxies themselves afterwards
+            pass False.
+
+        Returns
+        --------
+        npoints: int
+            The number of particles removed from the local section of the swarm.
+
+        Note that the order of the remaining particles is not preserved. This
+        should not be called inside the swarm `access()` context manager.
+        """
+
+        from underworld3.cython.petsc_discretisation import (
+            petsc_dmswarm_remove_points,
+        )
+
+        npoints = petsc_dmswarm_remove_points(self.dm, remove)
+
+        if npoints > 0:
+            self._increment()
+            self._clear_particle_index()
+
+        if update_proxies:
+            for var in self.vars.values():
+                var._update()
+
+        return npoints
+
 
 ## This should be the basic swarm, and we can then create a sub-class that will
 ## be a PIC swarm
 
 
-class PICSwarm(Stateful, uw_object):
+class PICSwarm(_SwarmParticleIndex, Stateful, uw_object):
     """
     Particle swarm implementation with automatic mesh-particle interactions.
 
@@ -995,8 +1540,7 @@ class PICSwarm(Stateful, uw_object):
             )
 
         self._X0_uninitialised = True
-        self._index = None
-        self._nnmapdict = {}
+        self._clear_particle_index()
 
         super().__init__()
 
@@ -1375,6 +1919,7 @@ class PICSwarm(Stateful, uw_object):
         dtype=float,
         proxy_degree=2,
         _nn_proxy=False,
+        proxy_update="interpolate",
     ):
         return SwarmVariable(
             name,
@@ -1383,6 +1928,7 @@ class PICSwarm(Stateful, uw_object):
             dtype=dtype,
             proxy_degree=proxy_degree,
             _nn_proxy=_nn_proxy,
+            proxy_update=proxy_update,
         )
 
     @timing.routine_timer_decorator
@@ -1609,26 +2155,15 @@ class PICSwarm(Stateful, uw_object):
             var._is_accessed = True
             # add to de-access list to rewind this later
             deaccess_list.append(var)
-            # grab numpy object, setting read only if necessary
-            var._data = self.dm.getField(var.clean_name).reshape(
-                (-1, var.num_components)
-            )
-            assert var._data is not None
-            if var not in writeable_vars:
-                var._old_data_flag = var._data.flags.writeable
-                var._data.flags.writeable = False
-            else:
+
+            # the swarm field is only fetched if the variable data
+            # is used in this block (see `SwarmVariable._map_data`)
+            var._writeable = var in writeable_vars
+
+            if var._writeable:
                 # increment variable state
                 var._increment()
 
-            # make view for each var component
-            if var._proxy:
-                for i in range(0, var.shape[0]):
-                    for j in range(0, var.shape[1]):
-                        var._data_container[i, j] = var._data_container[i, j]._replace(
-                            data=var.data[:, var._data_layout(i, j)],
-                        )
-
         # if particles moving, update swarm state
         if self.particle_coordinates in writeable_vars:
             self._increment()
@@ -1645,15 +2180,24 @@ class PICSwarm(Stateful, uw_object):
 
             def __exit__(self, *args):
 
-                for var in self.em_swarm.vars.values():
-                    # only de-access variables we have set access for.
-                    if var not in deaccess_list:
-                        continue
-                    # set this back, although possibly not required.
-                    if var not in writeable_vars:
-                        var._data.flags.writeable = var._old_data_flag
-                    var._data = None
-                    self.em_swarm.dm.restoreField(var.clean_name)
+                # only de-access variables we have set access for.
+                for var in deaccess_list:
+                    if var._data is not None:
+                        # set this back, although possibly not required.
+                        if not var._writeable:
+                            var._data.flags.writeable = var._old_data_flag
+                        var._data = None
+                        self.em_swarm.dm.restoreField(var.clean_name)
+
+                        if var._proxy:
+                            for i in range(0, var.shape[0]):
+                                for j in range(0, var.shape[1]):
+                                    var._data_container[i, j] = var._data_container[
+                                        i, j
+                                    ]._replace(
+                                        data=f"SwarmVariable[...].data is only available within mesh.access() context",
+                                    )
+
                     var._is_accessed = False
                 # do particle migration if coords changes
 
@@ -1686,8 +2230,7 @@ class PICSwarm(Stateful, uw_object):
                     self.em_swarm.dm.migrate(remove_sent_points=True)
 
                     # void these things too
-                    self.em_swarm._index = None
-                    self.em_swarm._nnmapdict = {}
+                    self.em_swarm._clear_particle_index()
 
                 # do var updates
                 for var in self.em_swarm.vars.values():
@@ -1698,16 +2241,6 @@ class PICSwarm(Stateful, uw_object):
                     ):
                         var._update()
 
-                    if var._proxy:
-                        for i in range(0, var.shape[0]):
-                            for j in range(0, var.shape[1]):
-                                # var._data_ij[i, j] = None
-                                var._data_container[i, j] = var._data_container[
-                                    i, j
-                                ]._replace(
-                                    data=f"SwarmVariable[...].data is only available within mesh.access() context",
-                                )
-
                 uw.timing._decrementDepth()
                 uw.timing.log_result(time.time() - stime, "Swarm.access", 1)
 
@@ -1747,11 +2280,6 @@ class PICSwarm(Stateful, uw_object):
 
     @timing.routine_timer_decorator
     def _get_map(self, var):
-        # generate tree if not avaiable
-        if not self._index:
-            with self.access():
-                self._index = uw.kdtree.KDTree(self.data)
-
         # get or generate map
         meshvar_coords = var._meshVar.coords
         # we can't use numpy arrays directly as keys in python dicts, so
@@ -1760,13 +2288,14 @@ class PICSwarm(Stateful, uw_object):
         # sufficiently confident of this.
         import xxhash
 
+        kdt, _ = self._particle_kdtree()
+
         h = xxhash.xxh64()
         h.update(meshvar_coords)
         digest = h.intdigest()
-        if digest not in self._nnmapdict:
-            # self._nnmapdict[digest] = self._index.find_closest_point(meshvar_coords)[0]
-            self._nnmapdict[digest] = self._index.query(meshvar_coords, k=1)[0]
-        return self._nnmapdict[digest]
+        if digest not in self._nnmapdict or self._nnmapdict[digest][0] is not kdt:
+            self._nnmapdict[digest] = (kdt, kdt.query(meshvar_coords, k=1)[1])
+        return self._nnmapdict[digest][1]
 
     @timing.routine_timer_decorator
     def advection(
@@ -1778,11 +2307,23 @@ class PICSwarm(Stateful, uw_object):
         restore_points_to_domain_func=None,
         evalf=False,
         step_limit=True,
+        tolerance=None,
     ):
+        """
+        Advect the swarm with the velocity `V_fn` over `delta_t`.
+
+        `order` selects the explicit Runge-Kutta scheme: 1 (forward Euler),
+        2 (midpoint), 3 or 4, or "rk45" for adaptive Dormand-Prince 5(4)
+        integration with per-particle error control. For "rk45", `tolerance`
+        is the permitted position error per step (default: 1/1000 of the
+        smallest cell radius) and the advective time-step estimate is only
+        used as the initial trial step. Otherwise, if `step_limit` is set,
+        the step is divided into uniform substeps from that estimate.
+        """
 
         dt_limit = self.estimate_dt(V_fn)
 
-        if step_limit and dt_limit is not None:
+        if (step_limit or order == "rk45") and dt_limit is not None:
             substeps = int(max(1, round(abs(delta_t) / dt_limit)))
         else:
             substeps = 1
@@ -1838,105 +2379,19 @@ class PICSwarm(Stateful, uw_object):
         #         del updated_current_coords
         #         del v_at_Vpts
 
-        print(f"{ uw.mpi.rank}: Peace", flush=True)
-
-        # Wrap this whole thing in sub-stepping loop
-        for step in range(0, substeps):
-
-            with self.access(X0):
-                X0.data[...] = self.particle_coordinates.data[...]
-
-            # Mid point algorithm (2nd order)
-
-            if order == 2:
-                with self.access(self.particle_coordinates):
-                    v_at_Vpts = np.zeros_like(self.particle_coordinates.data)
-
-                    # if evalf:
-                    #     for d in range(self.dim):
-                    #         v_at_Vpts[:, d] = uw.function.evalf(
-                    #             V_fn_matrix[d], self.particle_coordinates.data
-                    #         ).reshape(-1)
-                    # else:
-                    for d in range(self.dim):
-                        v_at_Vpts[:, d] = uw.function.evaluate(
-                            V_fn_matrix[d],
-                            self.particle_coordinates.data,
-                            evalf=evalf,
-                        ).reshape(-1)
-
-                    mid_pt_coords = (
-                        self.particle_coordinates.data[...]
-                        + 0.5 * delta_t * v_at_Vpts / substeps
-                    )
-
-                    # validate_coords to ensure they live within the domain (or there will be trouble)
-
-                    if restore_points_to_domain_func is not None:
-                        mid_pt_coords = restore_points_to_domain_func(mid_pt_coords)
-
-                    self.particle_coordinates.data[...] = mid_pt_coords[...]
-
-                    del mid_pt_coords
-
-                    ## Let the swarm be updated, and then move the rest of the way
-
-                    v_at_Vpts = np.zeros_like(self.data)
-
-                    # if evalf:
-                    #     for d in range(self.dim):
-                    #         v_at_Vpts[:, d] = uw.function.evalf(
-                    #             V_fn_matrix[d], self.particle_coordinates.data
-                    #         ).reshape(-1)
-                    # else:
-                    #
-                    for d in range(self.dim):
-                        v_at_Vpts[:, d] = uw.function.evaluate(
-                            V_fn_matrix[d],
-                            self.particle_coordinates.data,
-                            evalf=evalf,
-                        ).reshape(-1)
-
-                    # if (uw.mpi.rank == 0):
-                    #     print("Re-launch from X0", flush=True)
-
-                    new_coords = X0.data[...] + delta_t * v_at_Vpts / substeps
-
-                    # validate_coords to ensure they live within the domain (or there will be trouble)
-                    if restore_points_to_domain_func is not None:
-                        new_coords = restore_points_to_domain_func(new_coords)
-
-                    self.particle_coordinates.data[...] = new_coords[...]
-
-                    del new_coords
-                    del v_at_Vpts
-
-            # forward Euler (1st order)
-            else:
-                with self.access(self.particle_coordinates):
-                    v_at_Vpts = np.zeros_like(self.data)
-
-                    # if evalf:
-                    #     for d in range(self.dim):
-                    #         v_at_Vpts[:, d] = uw.function.evalf(
-                    #             V_fn_matrix[d], self.data
-                    #         ).reshape(-1)
-                    # else:
-                    for d in range(self.dim):
-                        v_at_Vpts[:, d] = uw.function.evaluate(
-                            V_fn_matrix[d],
-                            self.data,
-                            evalf=evalf,
-                        ).reshape(-1)
-
-                    new_coords = self.data + delta_t * v_at_Vpts / substeps
-
-                    # validate_coords to ensure they live within the domain (or there will be trouble)
+        # All the Runge-Kutta stages / substeps run on a coordinate buffer and
+        # the swarm is migrated once at the end of the step
 
-                    if restore_points_to_domain_func is not None:
-                        new_coords = restore_points_to_domain_func(new_coords)
-
-                    self.data[...] = new_coords[...].copy()
+        _advect_swarm_coordinates(
+            self,
+            V_fn_matrix,
+            delta_t,
+            substeps=substeps,
+            order=order,
+            restore_points_to_domain_func=restore_points_to_domain_func,
+            evalf=evalf,
+            tolerance=tolerance,
+        )
 
         ## End of substepping loop
 
@@ -1950,10 +2405,11 @@ class PICSwarm(Stateful, uw_object):
             # Remove remesh points and recreate a new set at the mesh-local
             # locations that we already have stored.
 
-            with self.access(self.particle_coordinates, self._remeshed):
+            with self.access():
                 remeshed = self._remeshed.data[:, 0] == 0
-                # This is one way to do it ... we can do this better though
-                self.data[remeshed, 0] = 1.0e100
+
+            # the proxies are refreshed as the variables are rebuilt below
+            self.remove_particles(remeshed, update_proxies=False)
 
             swarm_size = self.dm.getLocalSize()
 
@@ -1969,6 +2425,8 @@ class PICSwarm(Stateful, uw_object):
             # print(f"particle coords -> {coords.shape}")
             # print(f"remeshed points  -> {num_remeshed_points}")
 
+            cellid[swarm_size::] = self.mesh.particle_CellID_orig[:, 0]
+
             perturbation = 0.00001 * (
                 (0.33 / (1 + self.fill_param))
                 * (np.random.random(size=(num_remeshed_points, self.dim)) - 0.5)
@@ -1976,7 +2434,6 @@ class PICSwarm(Stateful, uw_object):
             )
 
             coords[swarm_size::] = self.mesh.particle_X_orig[:, :] + perturbation
-            cellid[swarm_size::] = self.mesh.particle_CellID_orig[:, 0]
             rmsh[swarm_size::] = 0
 
             self.dm.restoreField("DMSwarm_cellid")
@@ -2181,7 +2638,7 @@ class NodalPointPICSwarm(PICSwarm):
 ##  - No automatic definition of coordinate fields (need to add by hand)
 
 
-class Swarm(Stateful, uw_object):
+class Swarm(_SwarmParticleIndex, Stateful, uw_object):
     """
     A basic particle swarm implementation for Lagrangian particle tracking and data storage.
 
@@ -2205,6 +2662,10 @@ class Swarm(Stateful, uw_object):
     verbose : bool, optional
         Enable verbose output for debugging and monitoring particle operations.
         Default is False.
+    particles_per_cell : tuple, optional
+        The (min, max) number of particles per cell to be maintained by
+        `population_control` after each advection step. Default is None (no
+        population control).
 
     Attributes
     ----------
@@ -2243,6 +2704,8 @@ class Swarm(Stateful, uw_object):
         Advect particles using a velocity field.
     estimate_dt(V_fn, dt_min=1.0e-15, dt_max=1.0)
         Estimate appropriate timestep for particle advection.
+    population_control(min_per_cell, max_per_cell)
+        Split / delete particles to keep the number per cell within bounds.
 
     Examples
     --------
@@ -2276,7 +2739,9 @@ class Swarm(Stateful, uw_object):
     instances = 0
 
     @timing.routine_timer_decorator
-    def __init__(self, mesh, recycle_rate=0, verbose=False):
+    def __init__(
+        self, mesh, recycle_rate=0, verbose=False, particles_per_cell=None
+    ):
         Swarm.instances += 1
 
         self.verbose = verbose
@@ -2292,6 +2757,8 @@ class Swarm(Stateful, uw_object):
         self.recycle_rate = recycle_rate
         self.cycle = 0
 
+        self.particles_per_cell = particles_per_cell
+
         # dictionary for variables
 
         # import weakref (not helpful as garbage collection does not remove the fields from the DM)
@@ -2336,8 +2803,7 @@ class Swarm(Stateful, uw_object):
             )
 
         self._X0_uninitialised = True
-        self._index = None
-        self._nnmapdict = {}
+        self._clear_particle_index()
 
         super().__init__()
 
@@ -2428,11 +2894,18 @@ class Swarm(Stateful, uw_object):
         remove_sent_points=True,
         delete_lost_points=True,
         max_its=10,
+        strategy="neighbour",
     ):
         """
         Migrate swarm across processes after coordinates have been updated.
 
-        The algorithm uses a global kD-tree for the centroids of the domains to decide the particle mpi.rank (send to the closest)
+        With `strategy="neighbour"` (the default), particles that have left the local domain are
+        sent directly to the process across the nearest face of the local domain (determined from the
+        mesh partition, see `Mesh.get_neighbour_ranks_for_points`). A process that receives particles that
+        are not in its domain forwards them in the same way, for up to `max_its` exchanges. Each exchange
+        needs only one global reduction (of the number of particles still to send).
+
+        With `strategy="global"`, the algorithm uses a global kD-tree for the centroids of the domains to decide the particle mpi.rank (send to the closest)
         If the particles are mis-assigned to a particular mpi.rank, the next choice is the second-closest and so on.
 
         A few particles are still not found after this distribution process which probably means they are just outside the mesh.
@@ -2443,48 +2916,87 @@ class Swarm(Stateful, uw_object):
             which has this field pre-defined. (We'd need to add a cellid field as well, and re-compute it upon landing)
         """
 
-        from time import time
+        if strategy not in ("neighbour", "global"):
+            raise ValueError(
+                f"Unknown migration strategy '{strategy}'. Supported values are 'neighbour' and 'global'."
+            )
+
+        # The cell radius is a global (collective) quantity, so it is computed
+        # once here and the point location below needs no communication.
+        max_radius = self.mesh.get_max_radius()
 
-        time_c = time()
-        centroids = self.mesh._get_domain_centroids()
-        mesh_domain_kdtree = uw.kdtree.KDTree(centroids)
+        def points_not_in_domain():
+            swarm_coord_array = self.dm.getField("DMSwarmPIC_coor").reshape(
+                (-1, self.dim)
+            )
+            in_or_not = self.mesh._points_in_local_domain(swarm_coord_array, max_radius)
+            self.dm.restoreField("DMSwarmPIC_coor")
 
-        time0 = time()
-        time1 = time()
+            return np.count_nonzero(in_or_not == True), np.where(in_or_not == False)[0]
 
         # This will only worry about particles that are not already claimed !
         #
 
-        swarm_coord_array = self.dm.getField("DMSwarmPIC_coor").reshape((-1, self.dim))
-        in_or_not = self.mesh.points_in_domain(swarm_coord_array)
-        self.dm.restoreField("DMSwarmPIC_coor")
+        num_points_in_domain, not_my_points = points_not_in_domain()
 
-        num_points_in_domain = np.count_nonzero(in_or_not == True)
-        num_points_not_in_domain = np.count_nonzero(in_or_not == False)
-        not_my_points = np.where(in_or_not == False)[0]
+        # Single reduction: nothing more to do if no rank has unclaimed points
 
-        uw.mpi.barrier()
+        global_unclaimed_points = uw.mpi.comm.allreduce(not_my_points.shape[0])
+        if global_unclaimed_points == 0:
+            return
 
-        global_unclaimed_points = int(
-            uw.utilities.gather_data(
-                num_points_not_in_domain, bcast=True, dtype=int
-            ).sum()
-        )
+        if strategy == "neighbour" and uw.mpi.size > 1:
 
-        global_claimed_points = int(
-            uw.utilities.gather_data(num_points_in_domain, bcast=True, dtype=int).sum()
-        )
+            # Send the unclaimed points to the process across the nearest face of the
+            # local domain. Points that have to cross more than one partition are
+            # forwarded again by the process that receives them. On the first exchange,
+            # points closest to the global boundary go to the nearest neighbour anyway
+            # (near a corner of the partition that face can be the closer one); after
+            # that they are taken to be outside the mesh.
 
-        # Unlikely, but we should check this
-        uw.mpi.barrier()
-        if global_unclaimed_points == 0:
-            return
+            # (collective the first time it is called)
+            self.mesh._build_partition_face_index()
+
+            for it in range(0, max_its):
+
+                swarm_coord_array = self.dm.getField("DMSwarmPIC_coor").reshape(
+                    (-1, self.dim)
+                )
+                swarm_rank_array = self.dm.getField("DMSwarm_rank")
+
+                destination = self.mesh.get_neighbour_ranks_for_points(
+                    swarm_coord_array[not_my_points]
+                )
+                if it == 0:
+                    boundary = destination < 0
+                    destination[boundary] = self.mesh.get_neighbour_ranks_for_points(
+                        swarm_coord_array[not_my_points[boundary]], interprocess_only=True
+                    )
+
+                sent = destination >= 0
+                swarm_rank_array[not_my_points[sent], 0] = destination[sent]
+
+                self.dm.restoreField("DMSwarm_rank")
+                self.dm.restoreField("DMSwarmPIC_coor")
+
+                # Whatever is left lies outside the global domain (lost points)
+                if uw.mpi.comm.allreduce(np.count_nonzero(sent)) == 0:
+                    break
+
+                self.dm.migrate(remove_sent_points=True)
+
+                num_points_in_domain, not_my_points = points_not_in_domain()
 
         # Migrate particles between processors if appropriate
         # Otherwise skip the next step and just remove missing points
         # and tidy up.
 
-        if uw.mpi.size > 1:
+        elif uw.mpi.size > 1:
+            global_claimed_points = uw.mpi.comm.allreduce(num_points_in_domain)
+
+            centroids = self.mesh._get_domain_centroids()
+            mesh_domain_kdtree = uw.kdtree.KDTree(centroids)
+
             for it in range(0, min(max_its, uw.mpi.size)):
 
                 # Send unclaimed points to next processor in line
@@ -2507,34 +3019,14 @@ class Swarm(Stateful, uw_object):
 
                 # Now we send the points (basic migration)
                 self.dm.migrate(remove_sent_points=True)
-                uw.mpi.barrier()
 
-                swarm_coord_array = self.dm.getField("DMSwarmPIC_coor").reshape(
-                    (-1, self.dim)
-                )
-
-                in_or_not = self.mesh.points_in_domain(swarm_coord_array)
-                self.dm.restoreField("DMSwarmPIC_coor")
-
-                num_points_in_domain = np.count_nonzero(in_or_not == True)
-                num_points_not_in_domain = np.count_nonzero(in_or_not == False)
-                not_my_points = np.where(in_or_not == False)[0]
+                num_points_in_domain, not_my_points = points_not_in_domain()
 
                 unclaimed_points_last_iteration = global_unclaimed_points
                 claimed_points_last_iteration = global_claimed_points
 
-                global_unclaimed_points = int(
-                    uw.utilities.gather_data(
-                        num_points_not_in_domain,
-                        bcast=True,
-                        dtype=int,
-                    ).sum()
-                )
-
-                global_claimed_points = int(
-                    uw.utilities.gather_data(
-                        num_points_in_domain, bcast=True, dtype=int
-                    ).sum()
+                global_unclaimed_points, global_claimed_points = uw.mpi.comm.allreduce(
+                    np.array([not_my_points.shape[0], num_points_in_domain])
                 )
 
                 if (
@@ -2552,10 +3044,8 @@ class Swarm(Stateful, uw_object):
             # )
 
             uw.mpi.barrier()
-            if len(not_my_points > 0):
-                indices = np.sort(not_my_points)[::-1]
-                for index in indices:
-                    self.dm.removePointAtIndex(index)
+            # proxies are refreshed by the caller (the `access()` manager)
+            self.remove_particles(not_my_points, update_proxies=False)
 
             # print(
             #     f"{uw.mpi.rank} - final swarm size {self.dm.getLocalSize()}",
@@ -2821,6 +3311,7 @@ class Swarm(Stateful, uw_object):
         dtype=float,
         proxy_degree=2,
         _nn_proxy=False,
+        proxy_update="interpolate",
     ):
         return SwarmVariable(
             name,
@@ -2829,6 +3320,7 @@ class Swarm(Stateful, uw_object):
             dtype=dtype,
             proxy_degree=proxy_degree,
             _nn_proxy=_nn_proxy,
+            proxy_update=proxy_update,
         )
 
     @timing.routine_timer_decorator
@@ -3055,26 +3547,15 @@ class Swarm(Stateful, uw_object):
             var._is_accessed = True
             # add to de-access list to rewind this later
             deaccess_list.append(var)
-            # grab numpy object, setting read only if necessary
-            var._data = self.dm.getField(var.clean_name).reshape(
-                (-1, var.num_components)
-            )
-            assert var._data is not None
-            if var not in writeable_vars:
-                var._old_data_flag = var._data.flags.writeable
-                var._data.flags.writeable = False
-            else:
+
+            # the swarm field is only fetched if the variable data
+            # is used in this block (see `SwarmVariable._map_data`)
+            var._writeable = var in writeable_vars
+
+            if var._writeable:
                 # increment variable state
                 var._increment()
 
-            # make view for each var component
-            if var._proxy:
-                for i in range(0, var.shape[0]):
-                    for j in range(0, var.shape[1]):
-                        var._data_container[i, j] = var._data_container[i, j]._replace(
-                            data=var.data[:, var._data_layout(i, j)],
-                        )
-
         # if particles moving, update swarm state
         if self.particle_coordinates in writeable_vars:
             self._increment()
@@ -3091,15 +3572,24 @@ class Swarm(Stateful, uw_object):
 
             def __exit__(self, *args):
 
-                for var in self.em_swarm.vars.values():
-                    # only de-access variables we have set access for.
-                    if var not in deaccess_list:
-                        continue
-                    # set this back, although possibly not required.
-                    if var not in writeable_vars:
-                        var._data.flags.writeable = var._old_data_flag
-                    var._data = None
-                    self.em_swarm.dm.restoreField(var.clean_name)
+                # only de-access variables we have set access for.
+                for var in deaccess_list:
+                    if var._data is not None:
+                        # set this back, although possibly not required.
+                        if not var._writeable:
+                            var._data.flags.writeable = var._old_data_flag
+                        var._data = None
+                        self.em_swarm.dm.restoreField(var.clean_name)
+
+                        if var._proxy:
+                            for i in range(0, var.shape[0]):
+                                for j in range(0, var.shape[1]):
+                                    var._data_container[i, j] = var._data_container[
+                                        i, j
+                                    ]._replace(
+                                        data=f"SwarmVariable[...].data is only available within mesh.access() context",
+                                    )
+
                     var._is_accessed = False
                 # do particle migration if coords changes
 
@@ -3123,8 +3613,7 @@ class Swarm(Stateful, uw_object):
                         self.em_swarm.migrate(remove_sent_points=True)
 
                     # void these things too
-                    self.em_swarm._index = None
-                    self.em_swarm._nnmapdict = {}
+                    self.em_swarm._clear_particle_index()
 
                 # do var updates
                 for var in self.em_swarm.vars.values():
@@ -3135,16 +3624,6 @@ class Swarm(Stateful, uw_object):
                     ):
                         var._update()
 
-                    if var._proxy:
-                        for i in range(0, var.shape[0]):
-                            for j in range(0, var.shape[1]):
-                                # var._data_ij[i, j] = None
-                                var._data_container[i, j] = var._data_container[
-                                    i, j
-                                ]._replace(
-                                    data=f"SwarmVariable[...].data is only available within mesh.access() context",
-                                )
-
                 uw.timing._decrementDepth()
                 uw.timing.log_result(time.time() - stime, "Swarm.access", 1)
 
@@ -3185,11 +3664,6 @@ class Swarm(Stateful, uw_object):
     ## Check this - the interface to kdtree has changed, are we picking the correct field ?
     @timing.routine_timer_decorator
     def _get_map(self, var):
-        # generate tree if not avaiable
-        if not self._index:
-            with self.access():
-                self._index = uw.kdtree.KDTree(self.data)
-
         # get or generate map
         meshvar_coords = var._meshVar.coords
         # we can't use numpy arrays directly as keys in python dicts, so
@@ -3198,12 +3672,14 @@ class Swarm(Stateful, uw_object):
         # sufficiently confident of this.
         import xxhash
 
+        kdt, _ = self._particle_kdtree()
+
         h = xxhash.xxh64()
         h.update(meshvar_coords)
         digest = h.intdigest()
-        if digest not in self._nnmapdict:
-            self._nnmapdict[digest] = self._index.query(meshvar_coords, k=1)[1]
-        return self._nnmapdict[digest]
+        if digest not in self._nnmapdict or self._nnmapdict[digest][0] is not kdt:
+            self._nnmapdict[digest] = (kdt, kdt.query(meshvar_coords, k=1)[1])
+        return self._nnmapdict[digest][1]
 
     @timing.routine_timer_decorator
     def advection(
@@ -3215,11 +3691,23 @@ class Swarm(Stateful, uw_object):
         restore_points_to_domain_func=None,
         evalf=False,
         step_limit=False,
+        tolerance=None,
     ):
+        """
+        Advect the swarm with the velocity `V_fn` over `delta_t`.
+
+        `order` selects the explicit Runge-Kutta scheme: 1 (forward Euler),
+        2 (midpoint), 3 or 4, or "rk45" for adaptive Dormand-Prince 5(4)
+        integration with per-particle error control. For "rk45", `tolerance`
+        is the permitted position error per step (default: 1/1000 of the
+        smallest cell radius) and the advective time-step estimate is only
+        used as the initial trial step. Otherwise, if `step_limit` is set,
+        the step is divided into uniform substeps from that estimate.
+        """
 
         dt_limit = self.estimate_dt(V_fn)
 
-        if step_limit and dt_limit is not None:
+        if (step_limit or order == "rk45") and dt_limit is not None:
             substeps = int(max(1, round(abs(delta_t) / dt_limit)))
         else:
             substeps = 1
@@ -3275,104 +3763,19 @@ class Swarm(Stateful, uw_object):
         #         del updated_current_coords
         #         del v_at_Vpts
 
-        # Wrap this whole thing in sub-stepping loop
-        for step in range(0, substeps):
-
-            with self.access(X0):
-                X0.data[...] = self.particle_coordinates.data[...]
-
-            # Mid point algorithm (2nd order)
-
-            if order == 2:
-                with self.access(self.particle_coordinates):
-                    v_at_Vpts = np.zeros_like(self.particle_coordinates.data)
-
-                    ##
-                    ## Here we should check for particles which are interpolated and
-                    ## those which can only be extrapolated. For the former, evalf is
-                    ## not needed but for the latter it is essential
-                    ##
-
-                    # if evalf:
-                    #     for d in range(self.dim):
-                    #         v_at_Vpts[:, d] = uw.function.evalf(
-                    #             V_fn_matrix[d], self.particle_coordinates.data
-                    #         ).reshape(-1)
-                    # else:
-                    for d in range(self.dim):
-                        v_at_Vpts[:, d] = uw.function.evaluate(
-                            V_fn_matrix[d],
-                            self.particle_coordinates.data,
-                            evalf=evalf,
-                        ).reshape(-1)
-
-                    mid_pt_coords = (
-                        self.particle_coordinates.data[...]
-                        + 0.5 * delta_t * v_at_Vpts / substeps
-                    )
-
-                    if restore_points_to_domain_func is not None:
-                        mid_pt_coords = restore_points_to_domain_func(mid_pt_coords)
-
-                    self.particle_coordinates.data[...] = mid_pt_coords[...]
-
-                    del mid_pt_coords
+        # All the Runge-Kutta stages / substeps run on a coordinate buffer and
+        # the swarm is migrated once at the end of the step
 
-                    ## Let the swarm be updated, and then move the rest of the way
-
-                    v_at_Vpts = np.zeros_like(self.data)
-
-                    # if evalf:
-                    #     for d in range(self.dim):
-                    #         v_at_Vpts[:, d] = uw.function.evalf(
-                    #             V_fn_matrix[d], self.particle_coordinates.data
-                    #         ).reshape(-1)
-                    # else:
-                    for d in range(self.dim):
-                        v_at_Vpts[:, d] = uw.function.evaluate(
-                            V_fn_matrix[d],
-                            self.particle_coordinates.data,
-                            evalf=evalf,
-                        ).reshape(-1)
-
-                    # if (uw.mpi.rank == 0):
-                    #     print("Re-launch from X0", flush=True)
-
-                    new_coords = X0.data[...] + delta_t * v_at_Vpts / substeps
-
-                    if restore_points_to_domain_func is not None:
-                        new_coords = restore_points_to_domain_func(new_coords)
-
-                    self.particle_coordinates.data[...] = new_coords[...]
-
-                    del new_coords
-                    del v_at_Vpts
-
-            # forward Euler (1st order)
-            else:
-
-                with self.access(self.particle_coordinates):
-                    v_at_Vpts = np.zeros_like(self.data)
-
-                    # if evalf:
-                    #     for d in range(self.dim):
-                    #         v_at_Vpts[:, d] = uw.function.evalf(
-                    #             V_fn_matrix[d], self.data
-                    #         ).reshape(-1)
-                    # else:
-                    for d in range(self.dim):
-                        v_at_Vpts[:, d] = uw.function.evaluate(
-                            V_fn_matrix[d],
-                            self.data,
-                            evalf=evalf,
-                        ).reshape(-1)
-
-                    new_coords = self.data + delta_t * v_at_Vpts / substeps
-
-                    if restore_points_to_domain_func is not None:
-                        new_coords = restore_points_to_domain_func(new_coords)
-
-                    self.data[...] = new_coords[...].copy()
+        _advect_swarm_coordinates(
+            self,
+            V_fn_matrix,
+            delta_t,
+            substeps=substeps,
+            order=order,
+            restore_points_to_domain_func=restore_points_to_domain_func,
+            evalf=evalf,
+            tolerance=tolerance,
+        )
 
         ## End of substepping loop
 
@@ -3386,10 +3789,11 @@ class Swarm(Stateful, uw_object):
             # Remove remesh points and recreate a new set at the mesh-local
             # locations that we already have stored.
 
-            with self.access(self.particle_coordinates, self._remeshed):
+            with self.access():
                 remeshed = self._remeshed.data[:, 0] == 0
-                # This is one way to do it ... we can do this better though
-                self.data[remeshed, 0] = 1.0e100
+
+            # the proxies are refreshed as the variables are rebuilt below
+            self.remove_particles(remeshed, update_proxies=False)
 
             swarm_size = self.dm.getLocalSize()
 
@@ -3405,10 +3809,12 @@ class Swarm(Stateful, uw_object):
             # print(f"particle coords -> {coords.shape}")
             # print(f"remeshed points  -> {num_remeshed_points}")
 
+            orig_cellid = self.mesh.get_closest_local_cells(self.mesh.particle_X_orig)
+
             perturbation = 0.00001 * (
                 (0.33 / (1 + self.fill_param))
                 * (np.random.random(size=(num_remeshed_points, self.dim)) - 0.5)
-                * self.mesh._radii[cellid[swarm_size::]].reshape(-1, 1)
+                * self.mesh._radii[orig_cellid].reshape(-1, 1)
             )
 
             coords[swarm_size::] = self.mesh.particle_X_orig[:, :] + perturbation
@@ -3465,8 +3871,152 @@ class Swarm(Stateful, uw_object):
             max_its=1,
         )
 
+        if self.particles_per_cell is not None:
+            self.population_control(*self.particles_per_cell)
+
         return
 
+    @timing.routine_timer_decorator
+    def population_control(self, min_per_cell=None, max_per_cell=None):
+        """
+        Keep the number of particles in each local cell within
+        `[min_per_cell, max_per_cell]` (either bound may be None). This is intended
+        to follow a migration, e.g. at the end of `advection` (see `particles_per_cell`).
+
+        Particles beyond the limit are removed at random from crowded cells. Cells
+        with too few particles receive new particles at random locations. A new
+        particle copies the values of the nearest existing particle, except for
+        continuous (`rebuild_on_cycle`) floating point variables, which are
+        interpolated from the neighbouring particles as in the streak-swarm recycling.
+        On a rank with no particles, the new particles take zero values.
+
+        The particles are added and removed locally, but the proxy mesh
+        variables are then refreshed, so this must be called on all ranks.
+
+        Returns
+        --------
+        (nadded, nremoved): tuple(int, int)
+            The number of particles added to / removed from the local section of the swarm.
+        """
+
+        if min_per_cell is not None and max_per_cell is not None:
+            if min_per_cell > max_per_cell:
+                raise ValueError(
+                    f"min_per_cell ({min_per_cell}) must not exceed max_per_cell ({max_per_cell})"
+                )
+
+        from mpi4py import MPI
+
+        swarm_size = self.dm.getLocalSize()
+        num_cells = self.mesh._centroids.shape[0]
+
+        with self.access():
+            coords = self.particle_coordinates.data.copy()
+
+        if swarm_size > 0:
+            cells = self.mesh.get_closest_local_cells(coords)
+        else:
+            cells = np.zeros(0, dtype=int)
+
+        located = np.where(cells != -1)[0]
+        counts = np.bincount(cells[located], minlength=num_cells)
+
+        # Crowded cells: particles are ranked within each cell in a random order
+        # and those beyond the limit are removed
+
+        remove = np.zeros(swarm_size, dtype=bool)
+
+        if max_per_cell is not None and np.any(counts > max_per_cell):
+            order = located[
+                np.lexsort((np.random.random(located.shape[0]), cells[located]))
+            ]
+            sorted_cells = cells[order]
+            cell_start = np.cumsum(counts) - counts
+            rank_in_cell = np.arange(order.shape[0]) - cell_start[sorted_cells]
+            remove[order[rank_in_cell >= max_per_cell]] = True
+
+        # Sparse cells (including every cell of a rank with no particles):
+        # new points are random convex combinations of the cell vertices
+
+        if min_per_cell is not None:
+            deficit = np.maximum(min_per_cell - counts, 0)
+        else:
+            deficit = np.zeros(num_cells, dtype=int)
+
+        new_cells = np.repeat(np.arange(num_cells), deficit)
+        num_new_points = new_cells.shape[0]
+
+        # The proxy refresh below is collective, so every rank takes the same path
+
+        num_changes = comm.allreduce(
+            num_new_points + np.count_nonzero(remove), op=MPI.SUM
+        )
+        if num_changes == 0:
+            return 0, 0
+
+        # Values for the new particles (from the existing ones, or the
+        # defaults if there are none on this rank)
+
+        refill_vars = [
+            swarmVar
+            for swarmVar in self.vars.values()
+            if swarmVar is not self.particle_coordinates and swarmVar is not self._X0
+        ]
+
+        new_values = {}
+        if num_new_points > 0:
+            cell_point_coords = self.mesh._cell_point_coords()[new_cells]
+            weights = -np.log(1.0 - np.random.random(size=cell_point_coords.shape[0:2]))
+            weights /= weights.sum(axis=1).reshape(-1, 1)
+            new_coords = np.einsum("ij,ijk->ik", weights, cell_point_coords)
+
+            if swarm_size > 0:
+                closest = (
+                    self._particle_kdtree()[0].query(new_coords, k=1)[1].reshape(-1)
+                )
+
+            with self.access():
+                for swarmVar in refill_vars:
+                    if swarm_size == 0:
+                        new_values[swarmVar] = np.zeros(
+                            (num_new_points, swarmVar.num_components),
+                            dtype=swarmVar.dtype,
+                        )
+                    elif swarmVar._rebuild_on_cycle and not np.issubdtype(
+                        swarmVar.dtype, np.integer
+                    ):
+                        new_values[swarmVar] = swarmVar.rbf_interpolate(
+                            new_coords, nnn=self.mesh.dim + 1
+                        ).astype(swarmVar.dtype)
+                    else:
+                        new_values[swarmVar] = swarmVar.data[closest].copy()
+
+        nremoved = self.remove_particles(remove, update_proxies=False)
+
+        swarm_size = self.dm.getLocalSize()
+
+        if num_new_points > 0:
+            self.dm.addNPoints(num_new_points)
+
+            coords = self.dm.getField("DMSwarmPIC_coor").reshape((-1, self.dim))
+            coords[swarm_size::] = new_coords[...]
+            self.dm.restoreField("DMSwarmPIC_coor")
+
+            self._increment()
+            self._clear_particle_index()
+
+        # Writing the same variables on every rank refreshes all the proxies
+
+        with self.access(self._X0, *refill_vars):
+            if num_new_points > 0:
+                self._X0.data[swarm_size::] = new_coords[...]
+                for swarmVar, values in new_values.items():
+                    swarmVar.data[swarm_size::] = values.reshape(
+                        -1, swarmVar.num_components
+                    )
+
+        return num_new_points, nremoved
+
     @timing.routine_timer_decorator
     def estimate_dt(self, V_fn):
         """
@@ -711,12 +711,12 @@ class SemiLagrangian(uw_object):
             #
 
             with self._nswarm_psi.access(self._nswarm_psi.swarmVariable):
-                for d in range(self.psi_star[i].shape[1]):
-                    self._nswarm_psi.swarmVariable.data[:, d] = uw.function.evaluate(
-                        self.psi_star[i].sym[d],
-                        self._nswarm_psi.data,
-                        evalf=evalf,
-                    )
+                ncomp = self.psi_star[i].shape[1]
+                self._nswarm_psi.swarmVariable.data[:, 0:ncomp] = uw.function.evaluate(
+                    self.psi_star[i].sym[0, :],
+                    self._nswarm_psi.data,
+                    evalf=evalf,
+                ).reshape(-1, ncomp)
 
             if self.preserve_moments and self._workVar.num_components == 1:
 
@@ -1373,8 +1373,12 @@ class SNES_AdvectionDiffusion(SNES_Scalar):
 
     @delta_t.setter
     def delta_t(self, value):
-        self.is_setup = False
+        # Numerical values are passed to the compiled functions at solve time
+        # (as run-time constants) and do not require the solver to be rebuilt
+        was_number = uw.function.fn_is_number_expr(self._delta_t)
         self._delta_t.sym = value
+        if not (was_number and uw.function.fn_is_number_expr(self._delta_t)):
+            self.is_setup = False
 
     @timing.routine_timer_decorator
     def estimate_dt(self):
@@ -1683,8 +1687,12 @@ class SNES_Diffusion(SNES_Scalar):
 
     @delta_t.setter
     def delta_t(self, value):
-        self.is_setup = False
+        # Numerical values are passed to the compiled functions at solve time
+        # (as run-time constants) and do not require the solver to be rebuilt
+        was_number = uw.function.fn_is_number_expr(self._delta_t)
         self._delta_t.sym = value
+        if not (was_number and uw.function.fn_is_number_expr(self._delta_t)):
+            self.is_setup = False
 
     @timing.routine_timer_decorator
     def estimate_dt(self):
@@ -2033,8 +2041,12 @@ class SNES_NavierStokes(SNES_Stokes_SaddlePt):
 
     @delta_t.setter
     def delta_t(self, value):
-        self.is_setup = False
+        # Numerical values are passed to the compiled functions at solve time
+        # (as run-time constants) and do not require the solver to be rebuilt
+        was_number = uw.function.fn_is_number_expr(self._delta_t)
         self._delta_t.sym = value
+        if not (was_number and uw.function.fn_is_number_expr(self._delta_t)):
+            self.is_setup = False
 
     @property
     def rho(self):
@@ -96,7 +96,9 @@ def reset():
     """
     stop()
     global _hit_count
+    global _extension_records
     _hit_count = _dd(lambda: [0, 0.0])
+    _extension_records = []
 
 
 # go ahead and reset
@@ -353,6 +355,74 @@ def log_result(time, name, foffset=1):
             data[1] += time
 
 
+def log_extension(name, codegen_time, compile_time, load_time, cached=False):
+    """
+    Record the time taken to build a JIT extension module. These records are
+    kept whether or not timing has been started as they are infrequent
+    (and usually expensive) events.
+
+    Parameters
+    ----------
+    name: str
+        Name of the extension module.
+    codegen_time: float
+        Time spent generating the C code.
+    compile_time: float
+        Time spent compiling the extension (zero if it was found in the cache).
+    load_time: float
+        Time spent waiting for, and loading, the extension.
+    cached: bool
+        Whether the extension was loaded from the persistent cache.
+    """
+
+    _extension_records.append(
+        (name, codegen_time, compile_time, load_time, cached)
+    )
+
+
+def get_extension_data():
+    """
+    Returns a list of (name, codegen_time, compile_time, load_time, cached) tuples
+    for the JIT extension modules built so far.
+    """
+
+    return list(_extension_records)
+
+
+def print_extension_table(output_file=None):
+    """
+    Print the time taken to generate, compile and load each JIT extension
+    module to stdout or to a provided file.
+    """
+
+    if RANK != 0:
+        return
+
+    tabstr = "{:<36}{:>10}{:>10}{:>10}{:>8}\n".format(
+        "extension", "codegen", "compile", "load", "cached"
+    )
+    tabstr += "-" * 74 + "\n"
+
+    totals = [0.0, 0.0, 0.0]
+    for name, codegen_time, compile_time, load_time, cached in _extension_records:
+        tabstr += "{:<36}{:>10.3f}{:>10.3f}{:>10.3f}{:>8}\n".format(
+            name, codegen_time, compile_time, load_time, str(cached)
+        )
+        totals[0] += codegen_time
+        totals[1] += compile_time
+        totals[2] += load_time
+
+    tabstr += "-" * 74 + "\n"
+    tabstr += "{:<36}{:>10.3f}{:>10.3f}{:>10.3f}\n".format("Total", *totals)
+
+    if output_file:
+        with open(output_file, "w") as text_file:
+            text_file.write(tabstr)
+    else:
+        print("")
+        print(tabstr)
+
+
 _timedroutines = set()
 
 
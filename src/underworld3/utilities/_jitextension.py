@@ -32,6 +32,678 @@ from collections import namedtuple
 
 _ext_dict = {}
 
+## Builds of modules for the persistent cache (keyed by module name) so that
+## a digest that has been seen before in this process is not built / loaded again.
+_ext_module_dict = {}
+
+## Persistent, on-disk cache of compiled extensions. Entries are named by a
+## digest of the generated source, the include / library paths and the
+## compiler flags so that identical pointwise functions are only compiled
+## once (across runs, restarts etc). The cache is bounded in size and the
+## least-recently-used modules are evicted first.
+##
+## Environment variables (read at import):
+##    UW_JIT_CACHE_DIR     - location of the cache
+##    UW_JIT_CACHE_SIZE_MB - maximum size of the cache (MB)
+##    UW_JIT_NO_CACHE      - if set, always compile (the old behaviour)
+##    UW_JIT_COMPILE_MODE  - which ranks compile cached modules:
+##                           "node" (default), "root" or "all"
+
+import os as _os
+
+_jit_cache = {
+    "enabled": "UW_JIT_NO_CACHE" not in _os.environ,
+    "directory": _os.environ.get(
+        "UW_JIT_CACHE_DIR",
+        _os.path.join(
+            _os.environ.get(
+                "XDG_CACHE_HOME", _os.path.join(_os.path.expanduser("~"), ".cache")
+            ),
+            "underworld3",
+            "jit",
+        ),
+    ),
+    "max_size_mb": float(_os.environ.get("UW_JIT_CACHE_SIZE_MB", 1024)),
+    "compile_mode": _os.environ.get("UW_JIT_COMPILE_MODE", "node"),
+}
+
+## Shared-memory (per node) communicators used to build the JIT modules
+_jit_node_comms = {}
+
+## Code generation / compiler options. Additional compiler flags
+## (e.g. "-march=native") can be given in UW_JIT_CFLAGS and the
+## common-subexpression elimination pass disabled with UW_JIT_NO_CSE.
+## Expressions passed to `uw.function.evaluate` can be compiled once they have
+## been evaluated UW_JIT_EVALUATE_AFTER times (opt-in, the default 0 disables this).
+
+_jit_compile_args = ["-std=c99", "-O3"] + _os.environ.get("UW_JIT_CFLAGS", "").split()
+
+_jit_codegen = {
+    "cse": "UW_JIT_NO_CSE" not in _os.environ,
+    "evaluate_after": int(_os.environ.get("UW_JIT_EVALUATE_AFTER", 0)),
+}
+
+
+def set_jit_compiler_options(
+    compile_args: Optional[List[str]] = None,
+    cse: Optional[bool] = None,
+    evaluate_after: Optional[int] = None,
+):
+    """
+    Configure the code generation and compilation of JIT extensions.
+
+    Params
+    ------
+    compile_args:
+        Flags passed to the C compiler (default `["-std=c99", "-O3"]`).
+        Architecture-specific flags such as `-march=native` should only be
+        used if all the nodes sharing the JIT cache have the same processors.
+    cse:
+        If `True`, common sub-expressions are identified across all the
+        entries of each function (e.g. a Jacobian block) and evaluated once
+        into local temporaries.
+    evaluate_after:
+        The number of times an expression is passed to `uw.function.evaluate`
+        before it is compiled (see `getevaluator`). If 0 (the default),
+        expressions are only compiled when `evaluate(..., compiled=True)`.
+        Evaluators are built by every rank (not once per node) and
+        synchronously, since `evaluate` is not collective.
+    """
+
+    if compile_args is not None:
+        _jit_compile_args[:] = list(compile_args)
+    if cse is not None:
+        _jit_codegen["cse"] = bool(cse)
+    if evaluate_after is not None:
+        _jit_codegen["evaluate_after"] = int(evaluate_after)
+
+    return list(_jit_compile_args), dict(_jit_codegen)
+
+
+def set_jit_cache(
+    directory: Optional[str] = None,
+    max_size_mb: Optional[float] = None,
+    enabled: Optional[bool] = None,
+    compile_mode: Optional[str] = None,
+):
+    """
+    Configure the persistent cache of JIT-compiled extension modules.
+
+    Params
+    ------
+    directory:
+        Location of the cache. This should be on a filesystem that is
+        visible to all processes that share the compiled modules.
+    max_size_mb:
+        Size limit of the cache. Least-recently-used modules are removed
+        when this is exceeded.
+    enabled:
+        If `False`, extensions are always compiled (into `/tmp`) and are
+        not retained.
+    compile_mode:
+        "node" - one rank per node compiles and the other ranks load the
+        module from the cache, "root" - only rank 0 compiles (the cache must
+        be on a shared filesystem), "all" - every rank compiles.
+    """
+
+    if directory is not None:
+        _jit_cache["directory"] = str(directory)
+    if max_size_mb is not None:
+        _jit_cache["max_size_mb"] = float(max_size_mb)
+    if enabled is not None:
+        _jit_cache["enabled"] = bool(enabled)
+    if compile_mode is not None:
+        if compile_mode not in ("node", "root", "all"):
+            raise ValueError(
+                f"Unknown JIT compile_mode '{compile_mode}' - should be one of 'node', 'root', 'all'"
+            )
+        _jit_cache["compile_mode"] = compile_mode
+
+    return dict(_jit_cache)
+
+
+def _jit_source_digest(*items):
+    """
+    A stable (not salted per process) digest of the generated sources
+    and everything else that changes the compiled object.
+    """
+    import hashlib
+    import sys
+    import sysconfig
+
+    h = hashlib.sha256()
+    for item in items + (
+        sys.version,
+        sysconfig.get_config_var("EXT_SUFFIX"),
+        str(underworld3.__version__),
+    ):
+        h.update(repr(item).encode("utf-8"))
+        h.update(b"\0")
+
+    return h.hexdigest()
+
+
+# Cached modules used (looked up or stored) more recently than this are never
+# evicted: another process may be about to load them.
+_jit_cache_evict_min_age = 60.0
+
+
+def _jit_cache_lookup(modname):
+    """Return the path of a cached shared object for `modname` (or `None`)"""
+
+    import glob
+
+    if not _jit_cache["enabled"]:
+        return None
+
+    candidates = glob.glob(_os.path.join(_jit_cache["directory"], modname + "*.so"))
+    if len(candidates) == 0:
+        return None
+
+    # Touch to record the use (for the LRU eviction, which also leaves
+    # recently used modules alone)
+    try:
+        _os.utime(candidates[0])
+    except OSError:  # evicted in the meantime
+        return None
+
+    return candidates[0]
+
+
+def _jit_cache_store(modname, so_file):
+    """
+    Copy a freshly built shared object into the cache. The copy is written to
+    a process-unique name and renamed so that concurrent writers are safe.
+    """
+
+    import shutil
+
+    if not _jit_cache["enabled"]:
+        return so_file
+
+    cachedir = _jit_cache["directory"]
+    _os.makedirs(cachedir, exist_ok=True)
+
+    target = _os.path.join(cachedir, _os.path.basename(so_file))
+    tmp_target = f"{target}.{_os.getpid()}.{underworld3.mpi.rank}.tmp"
+    shutil.copy2(so_file, tmp_target)
+    _os.replace(tmp_target, target)
+
+    _jit_cache_evict()
+
+    return target
+
+
+def _jit_cache_evict():
+    """
+    Remove least-recently-used modules until the cache fits its size limit.
+    Modules used in the last `_jit_cache_evict_min_age` seconds (including the
+    one just stored) are kept, even if the cache stays over the limit.
+    """
+
+    import glob
+    import time
+
+    max_bytes = _jit_cache["max_size_mb"] * 1024 * 1024
+
+    entries = []
+    for so_file in glob.glob(_os.path.join(_jit_cache["directory"], "*.so")):
+        try:
+            stat = _os.stat(so_file)
+        except OSError:  # removed by someone else
+            continue
+        entries.append((stat.st_mtime, stat.st_size, so_file))
+
+    total = sum(entry[1] for entry in entries)
+    recent = time.time() - _jit_cache_evict_min_age
+
+    for mtime, size, so_file in sorted(entries):
+        if total <= max_bytes or mtime > recent:
+            break
+        try:
+            _os.remove(so_file)
+        except OSError:
+            pass
+        total -= size
+
+    return
+
+
+def _jit_build_comm(mesh):
+    """
+    The communicator on which JIT modules are built by rank 0 and shared
+    with the other ranks (through the cache), or `None` if every rank
+    compiles its own copy. This depends on `compile_mode`:
+
+      - "node": one rank per (shared-memory) node compiles
+      - "root": rank 0 of the mesh communicator compiles (the cache
+        directory must be visible to all ranks)
+      - "all": every rank compiles
+
+    Modules that are not associated with a mesh (`mesh=None`), and may be
+    needed on some ranks but not others, are always compiled locally.
+    """
+
+    from mpi4py import MPI
+
+    mode = _jit_cache["compile_mode"]
+
+    if mode == "all" or mesh is None:
+        return None
+
+    comm = mesh.dm.comm.tompi4py()
+
+    if mode == "root":
+        return comm
+    elif mode == "node":
+        key = comm.py2f()
+        if key not in _jit_node_comms.keys():
+            _jit_node_comms[key] = comm.Split_type(MPI.COMM_TYPE_SHARED)
+        return _jit_node_comms[key]
+    else:
+        raise ValueError(
+            f"Unknown JIT compile_mode '{mode}' - should be one of 'node', 'root', 'all'"
+        )
+
+
+def _load_dynamic(name, path, file=None):
+    """
+    Load an extension module.
+    Borrowed from:
+        https://stackoverflow.com/a/55172547
+    """
+    import importlib.machinery
+    from importlib._bootstrap import _load
+
+    loader = importlib.machinery.ExtensionFileLoader(name, path)
+
+    # Issue #24748: Skip the sys.modules check in _load_module_shims
+    # always load new extension
+    spec = importlib.machinery.ModuleSpec(name=name, loader=loader, origin=path)
+    return _load(spec)
+
+
+_jit_pool = None
+
+
+def _jit_executor():
+    """
+    Thread pool for background compilation. The work is done by the
+    compiler (sub)processes so threads are sufficient. The pool size can
+    be set with UW_JIT_WORKERS.
+    """
+
+    global _jit_pool
+
+    if _jit_pool is None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = int(
+            _os.environ.get("UW_JIT_WORKERS", min(8, _os.cpu_count() or 1))
+        )
+        _jit_pool = ThreadPoolExecutor(
+            max_workers=max(1, workers), thread_name_prefix="uw_jit"
+        )
+
+    return _jit_pool
+
+
+class _JITBuild:
+    """
+    The build of a JIT extension module.
+
+    The compilation may run in a background thread. The module is loaded
+    (and, if it is built by one rank and shared through the cache, broadcast)
+    when `result()` is first called. This is collective in the latter
+    case, so all ranks must call `result()` on their builds in the same order.
+
+    The time spent generating, compiling and loading the module is recorded
+    in `uw.timing` (see `timing.print_extension_table()`).
+    """
+
+    def __init__(
+        self,
+        modname,
+        codeguys,
+        mesh,
+        persistent=False,
+        asynchronous=False,
+        verbose=False,
+        codegen_time=0.0,
+        keep_build_dir=False,
+    ):
+        self.modname = modname
+        self.tmpdir = None
+        self.keep_build_dir = keep_build_dir
+        self.codeguys = codeguys
+        self.persistent = persistent
+        self.verbose = verbose
+        self.times = {"codegen": codegen_time, "compile": 0.0, "load": 0.0}
+
+        self._module = None
+        self._future = None
+        self._so_file = None
+        self._from_cache = False
+
+        self._build_comm = _jit_build_comm(mesh) if persistent else None
+
+        if self._build_comm is None or self._build_comm.rank == 0:
+            if persistent:
+                self._so_file = _jit_cache_lookup(modname)
+                self._from_cache = self._so_file is not None
+
+            if not self._from_cache:
+                if asynchronous:
+                    self._future = _jit_executor().submit(self._compile)
+                else:
+                    self._compile()
+
+        return
+
+    def _compile(self):
+        import time
+
+        time_s = time.time()
+
+        self.tmpdir, so_file = _build_extension(self.modname, self.codeguys)
+
+        if self.verbose:
+            print(f"Location of compiled module: {str(self.tmpdir)}", flush=True)
+
+        if so_file is not None and self.persistent and _jit_cache["enabled"]:
+            so_file = _jit_cache_store(self.modname, so_file)
+            self._remove_build_dir()
+
+        self._so_file = so_file
+        self.times["compile"] = time.time() - time_s
+
+        return so_file
+
+    def _remove_build_dir(self):
+        """Remove the build directory (unless it is kept for inspection)"""
+
+        import shutil
+
+        if self.tmpdir is not None and not self.keep_build_dir:
+            shutil.rmtree(self.tmpdir, ignore_errors=True)
+            self.tmpdir = None
+
+        return
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def result(self):
+        """The extension module (waits for the build to complete)"""
+
+        import time
+
+        if self._module is not None:
+            return self._module
+
+        time_s = time.time()
+
+        if self._future is not None:
+            self._future.result()
+            self._future = None
+
+        if self._build_comm is not None:
+            self._so_file, self._from_cache, self.tmpdir = self._build_comm.bcast(
+                (self._so_file, self._from_cache, self.tmpdir), root=0
+            )
+
+        if self._so_file is None:
+            raise RuntimeError(
+                f"The Underworld extension module does not appear to have been built successfully. "
+                f"The generated module may be found at:\n    {str(self.tmpdir)}\n"
+                f"To investigate, you may attempt to build it manually by running\n"
+                f"    python3 setup.py build_ext --inplace\n"
+                f"from the above directory. Note that a new module will always be written by "
+                f"Underworld and therefore any modifications to the above files will not persist into "
+                f"your Underworld runtime.\n"
+                f"Please contact the developers if you are unable to resolve the issue."
+            )
+
+        self._module = _load_dynamic(self.modname, self._so_file)
+        self.times["load"] = time.time() - time_s
+
+        # Not cached: the build directory is no longer needed once the
+        # module is loaded (by all the ranks that share it)
+        if self.tmpdir is not None and not self.keep_build_dir:
+            if self._build_comm is not None:
+                self._build_comm.barrier()
+            if self._build_comm is None or self._build_comm.rank == 0:
+                self._remove_build_dir()
+
+        if self._from_cache and self.verbose and underworld3.mpi.rank == 0:
+            print(f"JIT module loaded from cache: {self.modname}", flush=True)
+
+        timing.log_extension(
+            self.modname,
+            self.times["codegen"],
+            self.times["compile"],
+            self.times["load"],
+            cached=self._from_cache,
+        )
+
+        return self._module
+
+    def getptrobj(self):
+        return self.result().getptrobj()
+
+
+def _setup_py_str(modname):
+    """The `setup.py` that builds the extension `modname` from `cy_ext.pyx`"""
+
+    return """
+try:
+    from setuptools import setup
+    from setuptools import Extension
+except ImportError:
+    from distutils.core import setup
+    from distutils.extension import Extension
+from Cython.Build import cythonize
+
+ext_mods = [Extension(
+    '{NAME}', ['cy_ext.pyx',],
+    include_dirs={HEADERS},
+    library_dirs={LIBDIRS},
+    runtime_library_dirs={LIBDIRS},
+    libraries={LIBFILES},
+    extra_compile_args={COMPILE_ARGS},
+    extra_link_args=[]
+)]
+setup(ext_modules=cythonize(ext_mods))
+""".format(
+        NAME=modname,
+        HEADERS=list(underworld3._incdirs.keys()),
+        LIBDIRS=list(underworld3._libdirs.keys()),
+        LIBFILES=list(underworld3._libfiles.keys()),
+        COMPILE_ARGS=list(_jit_compile_args),
+    )
+
+
+def _build_extension(modname, codeguys):
+    """
+    Write out the generated sources and compile them in a new, private
+    temporary directory (module names are shared between processes that
+    build the same source, so the directory must not be).
+    Returns the build directory and the path to the shared object
+    (or `None` if the build failed).
+    """
+
+    import sys
+    import tempfile
+
+    tmpdir = tempfile.mkdtemp(prefix=f"{modname}_")
+
+    for thing in codeguys:
+        filename = thing[0]
+        strguy = thing[1]
+        with open(_os.path.join(tmpdir, filename), "w") as f:
+            f.write(strguy)
+
+    process = subprocess.Popen(
+        [sys.executable] + "setup.py build_ext --inplace".split(),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=tmpdir,
+    )
+    process.communicate()
+
+    for _file in _os.listdir(tmpdir):
+        if _file.endswith(".so"):
+            return tmpdir, _os.path.join(tmpdir, _file)
+
+    return tmpdir, None
+
+
+def _extract_runtime_constants(fns):
+    """
+    The uw expressions in `fns` with constant, numerical values, in a
+    reproducible order. The compiled functions read the value of
+    constant `i` as `constants[i]`.
+    """
+
+    from underworld3.function.expressions import UWexpression, is_number_expr
+
+    constants = set()
+    for fn in fns:
+        for atom in fn.atoms(UWexpression):
+            if is_number_expr(atom):
+                constants.add(atom)
+
+    return tuple(sorted(constants, key=lambda c: str(c.name)))
+
+
+def constant_values(constants):
+    """
+    Current values of the run-time `constants` of a compiled extension
+    (as returned in the `constants` entry of the `getext` dictionaries).
+    Returns `None` if any of these no longer has a numerical value, in which
+    case the extension needs to be rebuilt.
+    """
+
+    from underworld3.function.expressions import is_number_expr
+
+    values = []
+    for constant in constants:
+        if not is_number_expr(constant):
+            return None
+        values.append(float(constant.sym))
+
+    return values
+
+
+def fn_dependencies(fns, primary_field_list):
+    """
+    What the compiled versions of `fns` read at run time: the mesh variables
+    (other than the `primary_field_list`) that are taken from the auxiliary
+    vector, the run-time constants, and whether any of the primary fields
+    appear (i.e. whether the functions depend on the solution itself).
+    """
+
+    from underworld3.function._function import UnderworldAppliedFunction
+
+    expanded_fns = [
+        underworld3.function.expressions.unwrap(
+            fn, keep_constants=True, return_self=False
+        )
+        for fn in fns
+    ]
+
+    constants = _extract_runtime_constants(expanded_fns)
+
+    variables = set()
+    for fn in expanded_fns:
+        for varfn in fn.atoms(UnderworldAppliedFunction):
+            variables.add(varfn.meshvar())
+
+    depends_on_primary = any(var in variables for var in primary_field_list)
+
+    aux_variables = tuple(
+        sorted(
+            (var for var in variables if var not in primary_field_list),
+            key=lambda var: var.field_id,
+        )
+    )
+
+    return aux_variables, constants, depends_on_primary
+
+
+## Header content of all the generated extensions, including the implementation
+## of functions that are not in the C library (see `_ccode_printer`)
+
+_jit_h_preamble = """
+typedef int PetscInt;
+typedef double PetscReal;
+typedef double PetscScalar;
+typedef int PetscBool;
+#include <math.h>
+
+// Adding missing function implementation
+static inline double Heaviside_1 (double x)                 { return x < 0 ? 0 : x > 0 ? 1 : 0.5;     };
+static inline double Heaviside_2 (double x, double mid_val) { return x < 0 ? 0 : x > 0 ? 1 : mid_val; };
+
+"""
+
+
+def _ccode_printer():
+    """
+    The C99 code printer for the generated extensions.
+
+    The custom functions replacement dictionary is really just to appease Sympy,
+    and the actual implementation is printed directly into the generated JIT files
+    (see `_jit_h_preamble`). Without specifying this dictionary, Sympy doesn't code
+    print the Heaviside correctly. For example, it will print
+       Heaviside(petsc_x[0,1])
+    instead of
+       Heaviside(petsc_x[1]).
+    """
+
+    from sympy.printing.c import c_code_printers
+
+    custom_functions = {
+        "Heaviside": [
+            (
+                lambda *args: len(args) == 1,
+                "Heaviside_1",
+            ),  # for single arg Heaviside  (defaults to 0.5 at jump).
+            (lambda *args: len(args) == 2, "Heaviside_2"),
+        ],  # for two arg Heavisides    (second arg is jump value).
+    }
+
+    return c_code_printers["c99"]({"user_functions": custom_functions})
+
+
+def _ccode_block(printer, fn, out):
+    """
+    C code assigning the entries of the matrix `fn` to `out`. Sub-expressions
+    that are shared between entries (effective viscosities, strain-rate
+    invariants etc) are evaluated once into local temporaries.
+    """
+
+    if not _jit_codegen["cse"]:
+        return printer.doprint(fn, out)
+
+    replacements, reduced = sympy.cse(
+        list(fn),
+        symbols=sympy.numbered_symbols("uw_cse_"),
+    )
+
+    if len(replacements) == 0:
+        return printer.doprint(fn, out)
+
+    code = ""
+    for symbol, sub_expr in replacements:
+        code += f"PetscScalar {printer.doprint(symbol)};\n"
+        code += printer.doprint(sub_expr, symbol) + "\n"
+
+    code += printer.doprint(sympy.Matrix(fn.shape[0], fn.shape[1], reduced), out)
+
+    return code
+
 
 # Generates the C debugging string for the compiled function block
 def debugging_text(randstr, fn, fn_type, eqn_no):
@@ -91,10 +763,17 @@ def getext(
     debug=False,
     debug_name=None,
     cache=True,
+    asynchronous=False,
 ):
     """
     Check if we've already created an equivalent extension
     and use if available.
+
+    If `asynchronous` is `True`, a new extension is compiled in the
+    background and the returned pointer object is a `_JITBuild` that
+    resolves to the function pointers once the build has been joined
+    (with `getptrobj()`). Note: in parallel, all ranks must join their
+    builds in the same order.
     """
     import time
 
@@ -108,19 +787,46 @@ def getext(
         + tuple(fns_bd_jacobian)
     )
 
-    ## Expand all functions to ensure that changes in constants are recognised
-    ## in the caching process.
+    ## Expand all functions to ensure that changes in expressions are recognised
+    ## in the caching process. Expressions with constant (numerical) values are
+    ## the exception: these are read from the PetscDS constants array so that
+    ## changing their values does not require a new extension.
 
     expanded_fns = []
 
     for fn in raw_fns:
         expanded_fns.append(
             underworld3.function.expressions.unwrap(
-                fn, keep_constants=False, return_self=False
+                fn, keep_constants=True, return_self=False
             )
         )
 
-    fns = tuple(expanded_fns)
+    constants = _extract_runtime_constants(expanded_fns)
+    constants_subs = {}
+    for index, constant in enumerate(constants):
+        constants_subs[constant] = sympy.Symbol(f"constants[{index}]")
+
+    fns = tuple(
+        underworld3.function.expressions.unwrap(
+            fn.xreplace(constants_subs), keep_constants=False, return_self=False
+        )
+        for fn in expanded_fns
+    )
+
+    # Split back into the function categories for compilation
+
+    fn_counts = (
+        len(fns_residual),
+        len(fns_bcs),
+        len(fns_jacobian),
+        len(fns_bd_residual),
+        len(fns_bd_jacobian),
+    )
+    fn_groups = []
+    offset = 0
+    for count in fn_counts:
+        fn_groups.append(fns[offset : offset + count])
+        offset += count
 
     if debug and underworld3.mpi.rank==0:
         print(f"Expanded functions for compilation:")
@@ -150,15 +856,16 @@ def getext(
         _createext(
             jitname,
             mesh,
-            fns_residual,
-            fns_bcs,
-            fns_jacobian,
-            fns_bd_residual,
-            fns_bd_jacobian,
+            fn_groups[0],
+            fn_groups[1],
+            fn_groups[2],
+            fn_groups[3],
+            fn_groups[4],
             primary_field_list,
             verbose=verbose,
             debug=debug,
             debug_name=debug_name,
+            asynchronous=asynchronous,
         )
     else:
         if verbose and underworld3.mpi.rank == 0:
@@ -168,8 +875,11 @@ def getext(
     ## functions. Note, keep these by category as the same sympy function has
     ## different compiled form depending on the function signature
 
-    module = _ext_dict[jitname]
-    ptrobj = module.getptrobj()
+    build = _ext_dict[jitname]
+    if asynchronous and not build.loaded:
+        ptrobj = build
+    else:
+        ptrobj = build.getptrobj()
     # print(f"jit time {time.time()-time_s}", flush=True)
 
     i_res = {}
@@ -194,10 +904,12 @@ def getext(
 
     extn_fn_dict = namedtuple(
         "Functions",
-        ["res", "jac", "ebc", "bd_res", "bd_jac"],
+        ["res", "jac", "ebc", "bd_res", "bd_jac", "constants"],
     )
 
-    extensions_functions_dicts = extn_fn_dict(i_res, i_jac, i_ebc, i_bd_res, i_bd_jac)
+    extensions_functions_dicts = extn_fn_dict(
+        i_res, i_jac, i_ebc, i_bd_res, i_bd_jac, constants
+    )
 
     return ptrobj, extensions_functions_dicts
 
@@ -215,6 +927,7 @@ def _createext(
     verbose: Optional[bool] = False,
     debug: Optional[bool] = False,
     debug_name=None,
+    asynchronous: Optional[bool] = False,
 ):
     """
     This creates the required extension which houses the JIT
@@ -254,10 +967,16 @@ def _createext(
         petsc auxiliary variable arrays. Note that *all* the variables in the
         calling system's corresponding `PetscDM` must be included in this list.
         They must also be ordered according to their `field_id`.
+    asynchronous:
+        If `True`, the extension is compiled in a background thread and the
+        module is only loaded when it is first needed.
 
     """
     from sympy import symbols, Eq, MatrixSymbol
     from underworld3 import VarType
+    import time
+
+    time_s = time.time()
 
     # Note that the order here is important.
     fns = (
@@ -365,35 +1084,13 @@ def _createext(
     type(mesh.N.x)._ccode = lambda self, printer: self._ccodestr
     type(mesh.Gamma_N.x)._ccode = lambda self, printer: self._ccodestr
 
-    # Create a custom functions replacement dictionary.
-    # Note that this dictionary is really just to appease Sympy,
-    # and the actual implementation is printed directly into the
-    # generated JIT files (see `h_str` below). Without specifying
-    # this dictionary, Sympy doesn't code print the Heaviside correctly.
-    # For example, it will print
-    #    Heaviside(petsc_x[0,1])
-    # instead of
-    #    Heaviside(petsc_x[1]).
+    # The printer has a custom functions replacement dictionary (see `_ccode_printer`).
     # Note that the Heaviside implementation will be printed into all JIT
     # files now. This is fine for now, but if more complex functions are
     # required a cleaner solution might be desirable.
 
-    custom_functions = {
-        "Heaviside": [
-            (
-                lambda *args: len(args) == 1,
-                "Heaviside_1",
-            ),  # for single arg Heaviside  (defaults to 0.5 at jump).
-            (lambda *args: len(args) == 2, "Heaviside_2"),
-        ],  # for two arg Heavisides    (second arg is jump value).
-    }
-
     # Now go ahead and generate C code from substituted Sympy expressions.
-    # from sympy.printing.c import C99CodePrinter
-    # printer = C99CodePrinter(user_functions=custom_functions)
-    from sympy.printing.c import c_code_printers
-
-    printer = c_code_printers["c99"]({"user_functions": custom_functions})
+    printer = _ccode_printer()
 
     # Purge libary/header dictionaries. These will be repopulated
     # when `doprint` is called below. This ensures that we only link
@@ -429,9 +1126,9 @@ def _createext(
             print("Processing JIT {:4d} / {}".format(index, fn))
 
         out = sympy.MatrixSymbol("out", *fn.shape)
-        eqn = ("eqn_" + str(index), printer.doprint(fn, out))
-        if eqn[1].startswith("// Not supported in C:"):
-            spliteqn = eqn[1].split("\n")
+        eqn = ("eqn_" + str(index), _ccode_block(printer, fn, out))
+        if "// Not supported in C:" in eqn[1]:
+            spliteqn = eqn[1][eqn[1].index("// Not supported in C:") :].split("\n")
             raise RuntimeError(
                 f"Error encountered generating JIT extension:\n"
                 f"{spliteqn[0]}\n"
@@ -444,36 +1141,7 @@ def _createext(
             )
         eqns.append(eqn)
 
-    MODNAME = "fn_ptr_ext_" + str(name)
-
     codeguys = []
-    # Create a `setup.py`
-    setup_py_str = """
-try:
-    from setuptools import setup
-    from setuptools import Extension
-except ImportError:
-    from distutils.core import setup
-    from distutils.extension import Extension
-from Cython.Build import cythonize
-
-ext_mods = [Extension(
-    '{NAME}', ['cy_ext.pyx',],
-    include_dirs={HEADERS},
-    library_dirs={LIBDIRS},
-    runtime_library_dirs={LIBDIRS},
-    libraries={LIBFILES},
-    extra_compile_args=['-std=c99','-O3'],
-    extra_link_args=[]
-)]
-setup(ext_modules=cythonize(ext_mods))
-""".format(
-        NAME=MODNAME,
-        HEADERS=list(underworld3._incdirs.keys()),
-        LIBDIRS=list(underworld3._libdirs.keys()),
-        LIBFILES=list(underworld3._libfiles.keys()),
-    )
-    codeguys.append(["setup.py", setup_py_str])
 
     residual_sig = "(PetscInt dim, PetscInt Nf, PetscInt NfAux, const PetscInt uOff[], const PetscInt uOff_x[], const PetscScalar petsc_u[], const PetscScalar petsc_u_t[], const PetscScalar petsc_u_x[], const PetscInt aOff[], const PetscInt aOff_x[], const PetscScalar petsc_a[], const PetscScalar petsc_a_t[], const PetscScalar petsc_a_x[], PetscReal petsc_t,                           const PetscReal petsc_x[], PetscInt numConstants, const PetscScalar constants[], PetscScalar out[])"
     jacobian_sig = "(PetscInt dim, PetscInt Nf, PetscInt NfAux, const PetscInt uOff[], const PetscInt uOff_x[], const PetscScalar petsc_u[], const PetscScalar petsc_u_t[], const PetscScalar petsc_u_x[], const PetscInt aOff[], const PetscInt aOff_x[], const PetscScalar petsc_a[], const PetscScalar petsc_a_t[], const PetscScalar petsc_a_x[], PetscReal petsc_t, PetscReal petsc_u_tShift, const PetscReal petsc_x[], PetscInt numConstants, const PetscScalar constants[], PetscScalar out[])"
@@ -481,18 +1149,7 @@ setup(ext_modules=cythonize(ext_mods))
     bd_jacobian_sig = "(PetscInt dim, PetscInt Nf, PetscInt NfAux, const PetscInt uOff[], const PetscInt uOff_x[], const PetscScalar petsc_u[], const PetscScalar petsc_u_t[], const PetscScalar petsc_u_x[], const PetscInt aOff[], const PetscInt aOff_x[], const PetscScalar petsc_a[], const PetscScalar petsc_a_t[], const PetscScalar petsc_a_x[], PetscReal petsc_t, PetscReal petsc_u_tShift, const PetscReal petsc_x[],  const PetscReal petsc_n[],PetscInt numConstants, const PetscScalar constants[], PetscScalar out[])"
 
     # Create header top content.
-    h_str = """
-typedef int PetscInt;
-typedef double PetscReal;
-typedef double PetscScalar;
-typedef int PetscBool;
-#include <math.h>
-
-// Adding missing function implementation
-static inline double Heaviside_1 (double x)                 { return x < 0 ? 0 : x > 0 ? 1 : 0.5;     };
-static inline double Heaviside_2 (double x, double mid_val) { return x < 0 ? 0 : x > 0 ? 1 : mid_val; };
-
-"""
+    h_str = _jit_h_preamble
 
     # Create cython top content.
     pyx_str = """
@@ -511,12 +1168,24 @@ cdef extern from "cy_ext.h" nogil:
     # results in only the first JIT module working (with all
     # subsequent modules pointing towards the first's symbols).
     # Tags: RTLD_LOCAL, RTLD_Global, Gadi.
+    #
+    # Modules that go into the persistent cache use a placeholder here which
+    # is replaced by (part of) the source digest once the code is complete,
+    # so the symbol names are unique but also reproducible.
 
     import string
     import random
     import os
 
-    if not "UW_JITNAME" in os.environ:
+    persistent = (
+        _jit_cache["enabled"]
+        and debug_name is None
+        and not "UW_JITNAME" in os.environ
+    )
+
+    if persistent:
+        randstr = "UWJITPREFIX"
+    elif not "UW_JITNAME" in os.environ:
         randstr = "".join(random.choices(string.ascii_uppercase, k=5))
     else:
         if debug_name is None:
@@ -652,68 +1321,53 @@ cpdef PtrContainer getptrobj():
     pyx_str += "    return clsguy"
     codeguys.append(["cy_ext.pyx", pyx_str])
 
-    # Write out files
-    import os
+    MODNAME = "fn_ptr_ext_" + str(name)
 
-    tmpdir = os.path.join("/tmp", MODNAME)
-    try:
-        os.mkdir(tmpdir)
-    except OSError:
-        pass
-    for thing in codeguys:
-        filename = thing[0]
-        strguy = thing[1]
-        with open(os.path.join(tmpdir, filename), "w") as f:
-            f.write(strguy)
+    if persistent:
+        digest = _jit_source_digest(
+            h_str,
+            pyx_str,
+            list(underworld3._incdirs.keys()),
+            list(underworld3._libdirs.keys()),
+            list(underworld3._libfiles.keys()),
+            _jit_compile_args,
+        )
+        MODNAME = "fn_ptr_ext_" + digest[0:24]
+        randstr = "UW" + digest[0:10]
+        for thing in codeguys:
+            thing[1] = thing[1].replace("UWJITPREFIX", randstr)
 
-    # Build
-    import sys
+    # Create a `setup.py`
+    setup_py_str = _setup_py_str(MODNAME)
+    codeguys.append(["setup.py", setup_py_str])
 
-    process = subprocess.Popen(
-        [sys.executable] + "setup.py build_ext --inplace".split(),
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        cwd=tmpdir,
+    codegen_time = time.time() - time_s
+
+    # Re-use a module (or a build in progress) with the same source if we have
+    # one. Otherwise, the module is built (see `_JITBuild`), in the background
+    # if `asynchronous` is set.
+
+    if persistent and MODNAME in _ext_module_dict.keys():
+        _ext_dict[name] = _ext_module_dict[MODNAME]
+        if underworld3.mpi.rank == 0 and verbose:
+            print(f"JIT module loaded from cache: {MODNAME}", flush=True)
+        return
+
+    _ext_dict[name] = _JITBuild(
+        MODNAME,
+        codeguys,
+        mesh,
+        persistent=persistent,
+        asynchronous=asynchronous,
+        verbose=verbose,
+        codegen_time=codegen_time,
+        keep_build_dir=verbose or debug,
     )
-    process.communicate()
 
-    # Load and add to dictionary
-    from importlib._bootstrap import _load
-
-    def load_dynamic(name, path, file=None):
-        """
-        Load an extension module.
-        Borrowed from:
-            https://stackoverflow.com/a/55172547
-        """
-        import importlib.machinery
-
-        loader = importlib.machinery.ExtensionFileLoader(name, path)
-
-        # Issue #24748: Skip the sys.modules check in _load_module_shims
-        # always load new extension
-        spec = importlib.machinery.ModuleSpec(name=name, loader=loader, origin=path)
-        return _load(spec)
-
-    for _file in os.listdir(tmpdir):
-        if _file.endswith(".so"):
-            _ext_dict[name] = load_dynamic(MODNAME, os.path.join(tmpdir, _file))
-
-    if name not in _ext_dict.keys():
-        raise RuntimeError(
-            f"The Underworld extension module does not appear to have been built successfully. "
-            f"The generated module may be found at:\n    {str(tmpdir)}\n"
-            f"To investigate, you may attempt to build it manually by running\n"
-            f"    python3 setup.py build_ext --inplace\n"
-            f"from the above directory. Note that a new module will always be written by "
-            f"Underworld and therefore any modifications to the above files will not persist into "
-            f"your Underworld runtime.\n"
-            f"Please contact the developers if you are unable to resolve the issue."
-        )
+    if persistent:
+        _ext_module_dict[MODNAME] = _ext_dict[name]
 
     if underworld3.mpi.rank == 0 and verbose:
-        print(f"Location of compiled module: {str(tmpdir)}")
-
         print(
             f"{randstr} Equation count - {eqn_count}",
             flush=True,
@@ -740,3 +1394,169 @@ cpdef PtrContainer getptrobj():
         )
 
     return
+
+
+## Compiled evaluators for `uw.function.evaluate`, keyed by expression
+## (None if the expression could not be compiled)
+
+_evaluator_dict = {}
+
+
+def getevaluator(fn, coord_symbols, field_symbols, verbose=False):
+    """
+    A compiled (JIT) evaluator for the sympy expression or matrix `fn`, written
+    in terms of the `coord_symbols` and the `field_symbols` (which stand for the
+    values of mesh variables that have been interpolated to the points).
+
+    The evaluator is called as `evaluator(coords, fields, out)` with contiguous
+    arrays of shape `(N, dim)`, `(N, len(field_symbols))` and `(N, ncomp)`, and
+    loops over the points in C. Evaluators are cached by expression in this
+    process and in the persistent JIT cache.
+
+    Returns `None` if the expression cannot be compiled, in which case the
+    caller should fall back to `sympy.lambdify`.
+    """
+
+    key = (fn, tuple(coord_symbols), tuple(field_symbols))
+
+    if key not in _evaluator_dict.keys():
+        _evaluator_dict[key] = _createevaluator(
+            fn, coord_symbols, field_symbols, verbose=verbose
+        )
+
+    build = _evaluator_dict[key]
+    if build is None:
+        return None
+
+    try:
+        module = build.result()
+    except RuntimeError:
+        if verbose and underworld3.mpi.rank == 0:
+            print(f"Unable to compile an evaluator for {fn}", flush=True)
+        _evaluator_dict[key] = None
+        return None
+
+    return module.evaluate
+
+
+def _createevaluator(fn, coord_symbols, field_symbols, verbose=False):
+    """
+    Generate the code for, and build, the evaluator extension for `fn`
+    (see `getevaluator`). The pointwise code is the same as for the
+    solver extensions, inside a loop over the points.
+    """
+
+    import os
+    import time
+    import string
+    import random
+
+    time_s = time.time()
+
+    if isinstance(fn, sympy.MatrixBase):
+        fn = sympy.Matrix(fn)
+    else:
+        fn = sympy.Matrix([fn])
+
+    replacements = {}
+    for i, symbol in enumerate(coord_symbols):
+        replacements[symbol] = sympy.Symbol(f"petsc_x[{i}]")
+    for i, symbol in enumerate(field_symbols):
+        replacements[symbol] = sympy.Symbol(f"petsc_f[{i}]")
+
+    fn = fn.xreplace(replacements)
+
+    printer = _ccode_printer()
+
+    underworld3._incdirs.clear()
+    underworld3._libdirs.clear()
+    underworld3._libfiles.clear()
+
+    out = sympy.MatrixSymbol("out", *fn.shape)
+    eqn = _ccode_block(printer, fn, out)
+
+    if "// Not supported in C:" in eqn:
+        return None
+
+    h_str = _jit_h_preamble
+    for header in printer.headers:
+        h_str += '#include "{}"\n'.format(header)
+
+    h_str += """
+void UWJITPREFIX_evaluate(PetscInt n, PetscInt dim, PetscInt nf, const PetscReal *x_all, const PetscScalar *f_all, PetscScalar *out_all)
+{{
+  for (PetscInt p = 0; p < n; ++p) {{
+    const PetscReal   *petsc_x = &x_all[p * dim];
+    const PetscScalar *petsc_f = f_all ? &f_all[p * nf] : NULL;
+    PetscScalar       *out     = &out_all[p * {NCOMP}];
+{EQN}
+  }}
+}}
+""".format(
+        NCOMP=fn.shape[0] * fn.shape[1],
+        EQN=eqn,
+    )
+
+    pyx_str = """
+from underworld3.cython.petsc_types cimport PetscInt, PetscReal, PetscScalar
+
+cdef extern from "cy_ext.h" nogil:
+    void UWJITPREFIX_evaluate(PetscInt n, PetscInt dim, PetscInt nf, const PetscReal *x_all, const PetscScalar *f_all, PetscScalar *out_all)
+
+def evaluate(const double[:, ::1] coords, const double[:, ::1] fields, double[:, ::1] out):
+    cdef const double* f_ptr = NULL
+
+    if coords.shape[0] == 0:
+        return
+
+    if fields.shape[1] > 0:
+        f_ptr = &fields[0, 0]
+
+    with nogil:
+        UWJITPREFIX_evaluate(coords.shape[0], coords.shape[1], fields.shape[1], &coords[0, 0], f_ptr, &out[0, 0])
+"""
+
+    codeguys = [["cy_ext.h", h_str], ["cy_ext.pyx", pyx_str]]
+
+    persistent = _jit_cache["enabled"] and not "UW_JITNAME" in os.environ
+
+    if persistent:
+        digest = _jit_source_digest(
+            h_str,
+            pyx_str,
+            list(underworld3._incdirs.keys()),
+            list(underworld3._libdirs.keys()),
+            list(underworld3._libfiles.keys()),
+            _jit_compile_args,
+        )
+        MODNAME = "fn_eval_ext_" + digest[0:24]
+        randstr = "UW" + digest[0:10]
+    else:
+        randstr = "".join(random.choices(string.ascii_uppercase, k=5))
+        MODNAME = "fn_eval_ext_" + randstr + str(len(_evaluator_dict.keys()))
+
+    for thing in codeguys:
+        thing[1] = thing[1].replace("UWJITPREFIX", randstr)
+
+    codeguys.append(["setup.py", _setup_py_str(MODNAME)])
+
+    if verbose and underworld3.mpi.rank == 0:
+        print(f"Compiling evaluator {MODNAME} for {fn}", flush=True)
+
+    if persistent and MODNAME in _ext_module_dict.keys():
+        return _ext_module_dict[MODNAME]
+
+    build = _JITBuild(
+        MODNAME,
+        codeguys,
+        None,
+        persistent=persistent,
+        verbose=verbose,
+        codegen_time=time.time() - time_s,
+        keep_build_dir=verbose,
+    )
+
+    if persistent:
+        _ext_module_dict[MODNAME] = build
+
+    return build
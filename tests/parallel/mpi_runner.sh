@@ -24,3 +24,16 @@ mpirun -np 4 $PYTHON ./ptest_002_projection.py
 #mpirun -np 1 $PYTHON ./ptest_003_swarm_projection.py
 #echo "ptest 003 -np 4"
 #mpirun -np 4 $PYTHON ./ptest_003_swarm_projection.py
+
+echo "ptest 005 -np 1"
+mpirun -np 1 $PYTHON ./ptest_005_swarm_migration.py
+echo "ptest 005 -np 4"
+mpirun -np 4 $PYTHON ./ptest_005_swarm_migration.py
+
+echo "ptest 006 -np 1"
+mpirun -np 1 $PYTHON ./ptest_006_stokes_gmg_benchmark.py
+echo "ptest 006 -np 4"
+mpirun -np 4 $PYTHON ./ptest_006_stokes_gmg_benchmark.py
+
+echo "ptest 007 -np 2"
+mpirun -np 2 $PYTHON ./ptest_007_swarm_advection_stages.py
@@ -0,0 +1,54 @@
+import underworld3 as uw
+import numpy as np
+
+# Particles displaced by less than a partition should all be delivered
+# to their new owners by the neighbour exchange, with none lost. Large
+# displacements (across several partitions) are forwarded from neighbour to
+# neighbour, and particles moved outside the mesh are deleted.
+
+mesh = uw.meshing.UnstructuredSimplexBox(
+    minCoords=(0.0, 0.0), maxCoords=(1.0, 1.0), cellSize=1.0 / 32.0
+)
+
+for strategy, theta in (
+    ("neighbour", 0.05),
+    ("global", 0.05),
+    ("neighbour", 0.5 * np.pi),
+):
+    swarm = uw.swarm.Swarm(mesh=mesh)
+    swarm.populate(fill_param=2)
+
+    with swarm.access():
+        coords = swarm.data.copy()
+
+    total = uw.mpi.comm.allreduce(coords.shape[0])
+
+    # rotate about the centre of the box (stays in the box)
+    centre = np.array((0.5, 0.5))
+    r = coords - centre
+    r = 0.9 * np.column_stack(
+        (
+            np.cos(theta) * r[:, 0] - np.sin(theta) * r[:, 1],
+            np.sin(theta) * r[:, 0] + np.cos(theta) * r[:, 1],
+        )
+    )
+
+    coords = swarm.dm.getField("DMSwarmPIC_coor").reshape(-1, mesh.dim)
+    coords[...] = centre + r
+    # and one particle per process leaves the mesh
+    lost = uw.mpi.comm.allreduce(min(coords.shape[0], 1))
+    coords[:1, 0] += 2.0
+    swarm.dm.restoreField("DMSwarmPIC_coor")
+
+    swarm.migrate(strategy=strategy)
+
+    with swarm.access():
+        assert np.all(mesh.points_in_domain(swarm.data)) or swarm.data.shape[0] == 0
+        migrated_total = uw.mpi.comm.allreduce(swarm.data.shape[0])
+
+    assert migrated_total == total - lost, f"{strategy}: {migrated_total} != {total - lost}"
+
+    if uw.mpi.rank == 0:
+        print(f"{strategy} migration - {migrated_total} particles", flush=True)
+
+print(f"Finalised")
@@ -0,0 +1,102 @@
+# Compare the setup + solve time of the geometric multigrid ("gmg") and
+# the default (gamg) velocity preconditioners for the Stokes solver.
+#
+#   mpirun -np 4 python ./ptest_006_stokes_gmg_benchmark.py --refinement 3
+#
+# The mesh is built once per case and a fresh solver is created for each
+# strategy so that the reported times include the PC setup.
+
+import underworld3 as uw
+import numpy as np
+import sympy
+import time
+
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--refinement", type=int, default=2)
+parser.add_argument("--repeats", type=int, default=2)
+args = parser.parse_args()
+
+
+def box_problem(refinement):
+    mesh = uw.meshing.StructuredQuadBox(elementRes=(8, 8), refinement=refinement)
+    x, y = mesh.X
+
+    def configure(stokes):
+        stokes.bodyforce = sympy.Matrix([0, sympy.sin(sympy.pi * x) * sympy.cos(sympy.pi * y)])
+        stokes.add_dirichlet_bc((0.0, 0.0), "Bottom")
+        stokes.add_dirichlet_bc((0.0, 0.0), "Top")
+        stokes.add_dirichlet_bc((0.0, sympy.oo), "Left")
+        stokes.add_dirichlet_bc((0.0, sympy.oo), "Right")
+
+    return mesh, configure
+
+
+def cubed_sphere_problem(refinement):
+    mesh = uw.meshing.CubedSphere(
+        radiusOuter=1.0,
+        radiusInner=0.547,
+        numElements=3,
+        qdegree=2,
+        refinement=max(refinement - 1, 1),
+    )
+    x, y, z = mesh.X
+
+    radius_fn = sympy.sqrt(mesh.rvec.dot(mesh.rvec))
+    unit_rvec = mesh.X / radius_fn
+
+    def configure(stokes):
+        stokes.bodyforce = unit_rvec * sympy.exp(-10.0 * (x**2 + (y - 0.8) ** 2 + z**2))
+        stokes.add_dirichlet_bc((0.0, 0.0, 0.0), "Lower")
+        stokes.add_dirichlet_bc((0.0, 0.0, 0.0), "Upper")
+
+    return mesh, configure
+
+
+def time_strategy(mesh, configure, strategy, i):
+    u = uw.discretisation.MeshVariable(f"U_{strategy}_{i}", mesh, mesh.dim, degree=2)
+    p = uw.discretisation.MeshVariable(f"P_{strategy}_{i}", mesh, 1, degree=1)
+
+    stokes = uw.systems.Stokes(mesh, velocityField=u, pressureField=p)
+    stokes.constitutive_model = uw.constitutive_models.ViscousFlowModel
+    stokes.constitutive_model.Parameters.shear_viscosity_0 = 1
+    stokes.tolerance = 1.0e-5
+    stokes.strategy = strategy
+    configure(stokes)
+
+    uw.mpi.barrier()
+    start = time.time()
+    stokes.solve()
+    uw.mpi.barrier()
+    elapsed = time.time() - start
+
+    its = stokes.snes.getKSP().getIterationNumber()
+    reason = stokes.snes.getConvergedReason()
+
+    with mesh.access():
+        u_norm = np.linalg.norm(u.data)
+
+    return elapsed, its, reason, u_norm
+
+
+for name, problem in (
+    ("StructuredQuadBox", box_problem),
+    ("CubedSphere", cubed_sphere_problem),
+):
+    mesh, configure = problem(args.refinement)
+
+    for strategy in ("default", "gmg"):
+        times = []
+        for i in range(args.repeats):
+            elapsed, its, reason, u_norm = time_strategy(mesh, configure, strategy, i)
+            times.append(elapsed)
+
+        if uw.mpi.rank == 0:
+            print(
+                f"{name:18s} levels={len(mesh.dm_hierarchy)} strategy={strategy:8s} "
+                + f"time={min(times):8.3f}s  ksp_its={its:4d}  reason={reason}  |u|={u_norm:.6e}",
+                flush=True,
+            )
+
+    del mesh
@@ -0,0 +1,97 @@
+import underworld3 as uw
+import numpy as np
+from mpi4py import MPI
+
+# Compare the fused swarm advection kernel with the per-stage path (swarm
+# migrated at every Runge-Kutta stage). The step is large enough for the
+# midpoint of many particles to lie on the other process, where the fused
+# kernel must sample the velocity (not extrapolate from local data).
+#
+#   mpirun -np 2 python ./ptest_007_swarm_advection_stages.py
+
+comm = uw.mpi.comm
+
+mesh = uw.meshing.UnstructuredSimplexBox(
+    minCoords=(0.0, 0.0), maxCoords=(1.0, 1.0), cellSize=1 / 16, regular=False
+)
+
+v = uw.discretisation.MeshVariable("U", mesh, mesh.dim, degree=2)
+
+# Cellular flow, no normal velocity on the walls
+with mesh.access(v):
+    X = v.coords
+    v.data[:, 0] = np.sin(np.pi * X[:, 0]) * np.cos(np.pi * X[:, 1])
+    v.data[:, 1] = -np.cos(np.pi * X[:, 0]) * np.sin(np.pi * X[:, 1])
+
+dt = 0.15
+
+
+def make_swarm(name):
+    swarm = uw.swarm.Swarm(mesh)
+    tag = swarm.add_variable(f"tag_{name}", 1, dtype=int)
+    X0_ref = swarm.add_variable(f"X0_{name}", mesh.dim)
+    swarm.populate(fill_param=2)
+
+    with swarm.access(tag):
+        n = tag.data.shape[0]
+        offset = comm.exscan(n)
+        if uw.mpi.rank == 0:
+            offset = 0
+        tag.data[:, 0] = offset + np.arange(n)
+
+    return swarm, tag, X0_ref
+
+
+def gather(swarm, tag):
+    with swarm.access():
+        local = (tag.data[:, 0].copy(), swarm.particle_coordinates.data.copy())
+
+    everything = comm.gather(local, root=0)
+    if uw.mpi.rank != 0:
+        return None, None
+
+    tags = np.concatenate([t for t, c in everything])
+    coords = np.concatenate([c for t, c in everything])
+    order = np.argsort(tags)
+
+    return tags[order], coords[order]
+
+
+# Fused kernel (midpoint rule)
+
+swarm, tag, _ = make_swarm("fused")
+swarm.advection(v.sym, dt, order=2)
+fused_tags, fused_coords = gather(swarm, tag)
+
+# Per-stage path: the swarm is migrated to the midpoint before the
+# second velocity evaluation
+
+swarm, tag, X0_ref = make_swarm("staged")
+
+with swarm.access(X0_ref):
+    X0_ref.data[...] = swarm.particle_coordinates.data[...]
+    v0 = uw.function.evaluate(v.sym, swarm.particle_coordinates.data).reshape(-1, 2)
+
+with swarm.access(swarm.particle_coordinates):
+    swarm.particle_coordinates.data[...] += 0.5 * dt * v0
+
+with swarm.access():
+    v1 = uw.function.evaluate(v.sym, swarm.particle_coordinates.data).reshape(-1, 2)
+    new_coords = X0_ref.data + dt * v1
+
+with swarm.access(swarm.particle_coordinates):
+    swarm.particle_coordinates.data[...] = new_coords[...]
+
+staged_tags, staged_coords = gather(swarm, tag)
+
+if uw.mpi.rank == 0:
+    print(f"Fused: {fused_tags.shape[0]} particles, per-stage: {staged_tags.shape[0]}", flush=True)
+    print(
+        f"Max difference: {np.abs(fused_coords - staged_coords).max()}",
+        flush=True,
+    )
+
+    assert np.array_equal(fused_tags, staged_tags), "Error: particles lost during advection."
+    assert np.allclose(fused_coords, staged_coords, atol=1.0e-8), (
+        "Error: fused advection differs from the per-stage path."
+    )
@@ -60,3 +60,188 @@ def test_addNPoints(setup_data):
         npts = swarm2.data.shape[0]
     assert npts == 10
 
+
+
+def test_shared_particle_index(setup_data):
+    import numpy as np
+
+    swarm = setup_data
+    var1 = swarm.add_variable(name="p1", size=1, proxy_degree=1)
+    var2 = swarm.add_variable(name="p2", size=2, proxy_degree=1)
+    swarm.populate(fill_param=2)
+
+    with swarm.access(var1, var2):
+        var1.data[:, 0] = swarm.data[:, 0]
+        var2.data[...] = swarm.data[...]
+
+    # The index is built once and shared until the particles move
+
+    index, _ = swarm._particle_kdtree()
+    var1._update()
+    var2._update()
+    assert swarm._particle_kdtree()[0] is index
+
+    values = var2.rbf_interpolate(swarm.mesh.data)
+    assert np.allclose(values, swarm.mesh.data, atol=0.05)
+
+    with swarm.access(swarm.particle_coordinates):
+        swarm.data[:, 0] *= 0.99
+
+    assert swarm._particle_kdtree()[0] is not index
+
+
+def test_average_proxy(setup_data):
+    import numpy as np
+
+    swarm = setup_data
+    var = swarm.add_variable(
+        name="avg", size=1, proxy_degree=1, proxy_update="average"
+    )
+    swarm.populate(fill_param=2)
+
+    # A constant is preserved exactly by the particle to node average
+
+    with swarm.access(var):
+        var.data[...] = 2.0
+
+    with swarm.mesh.access():
+        assert np.allclose(var._meshVar.data, 2.0)
+
+
+def test_remove_particles(setup_data):
+    import numpy as np
+
+    swarm = setup_data
+    var = swarm.add_variable(name="tag", size=1, dtype=int, proxy_degree=1)
+    swarm.populate(fill_param=2)
+
+    with swarm.access(var):
+        npts = swarm.data.shape[0]
+        var.data[:, 0] = np.arange(npts)
+        remove = swarm.data[:, 0] < 0.5
+        kept = np.where(~remove)[0]
+        kept_coords = swarm.data[~remove].copy()
+
+    state = swarm._state
+    nremoved = swarm.remove_particles(remove)
+    assert nremoved == np.count_nonzero(remove)
+    assert swarm._state > state
+
+    # Every field is compacted consistently (the order may change)
+
+    with swarm.access():
+        assert swarm.data.shape[0] == npts - nremoved
+        assert set(var.data[:, 0]) == set(kept)
+        assert np.allclose(swarm.data, kept_coords[np.searchsorted(kept, var.data[:, 0])])
+
+
+def test_rk_advection_step():
+    import numpy as np
+    from underworld3.swarm import _advection_tableaux, _rk_advection_step
+
+    # Solid body rotation through a quarter turn (one velocity sample per stage)
+
+    def velocity(x):
+        return np.column_stack((-x[:, 1], x[:, 0]))
+
+    x0 = np.array([[1.0, 0.0], [0.0, 0.5]])
+    exact = np.array([[0.0, 1.0], [-0.5, 0.0]])
+
+    errors = {}
+    for order in _advection_tableaux:
+        x = x0.copy()
+        for step in range(16):
+            x = _rk_advection_step(
+                velocity, x, 0.5 * np.pi / 16, _advection_tableaux[order]
+            )
+        errors[order] = np.abs(x - exact).max()
+
+    assert errors[4] < errors[3] < errors[2] < errors[1]
+    assert errors[4] < 1.0e-5
+
+
+def test_rk45_advection_step():
+    import numpy as np
+    from underworld3.swarm import _rk45_advection_step
+
+    # Rotation that is fast on the right of the domain only
+
+    def velocity(x):
+        omega = 1.0 + 10.0 * (x[:, 0] > 0.5)
+        return omega.reshape(-1, 1) * np.column_stack((-x[:, 1], x[:, 0]))
+
+    x0 = np.array([[0.1, 0.0], [0.75, 0.75], [1.0, 0.0]])
+    x, steps = _rk45_advection_step(velocity, x0, 0.05, 1.0e-8)
+
+    # Radius is preserved and the slow particle takes fewer steps
+
+    assert np.allclose(np.linalg.norm(x, axis=1), np.linalg.norm(x0, axis=1))
+    assert steps[0] < steps[2]
+
+    x, steps = _rk45_advection_step(velocity, np.zeros((0, 2)), 0.05, 1.0e-8)
+    assert x.shape == (0, 2)
+
+
+def test_population_control(setup_data):
+    import numpy as np
+
+    swarm = setup_data
+    var = swarm.add_variable(name="mat", size=1, dtype=int, proxy_degree=1)
+    swarm.populate(fill_param=2)
+
+    with swarm.access(var):
+        var.data[:, 0] = swarm.data[:, 0] > 0.5
+
+    def cell_counts():
+        with swarm.access():
+            cells = swarm.mesh.get_closest_local_cells(swarm.data)
+        return np.bincount(cells, minlength=swarm.mesh._centroids.shape[0])
+
+    nadded, nremoved = swarm.population_control(min_per_cell=8)
+    assert nremoved == 0 and nadded > 0
+    assert cell_counts().min() >= 8
+
+    nadded, nremoved = swarm.population_control(max_per_cell=3)
+    assert nadded == 0 and nremoved > 0
+    assert cell_counts().max() <= 3
+
+    # New particles copy their neighbours (away from the material boundary)
+
+    with swarm.access():
+        far = np.abs(swarm.data[:, 0] - 0.5) > 0.1
+        assert np.all(var.data[far, 0] == (swarm.data[far, 0] > 0.5))
+
+
+def test_lazy_access(setup_data):
+    import numpy as np
+    import underworld3 as uw
+
+    swarm = setup_data
+    var1 = swarm.add_variable(name="l1", size=1, proxy_degree=1)
+    var2 = swarm.add_variable(name="l2", size=2, proxy_degree=1)
+    swarm.populate(fill_param=1)
+
+    # Only the variables used in the block are fetched
+
+    with swarm.access(var1):
+        var1.data[...] = 1.0
+        assert var2._data is None
+        assert var2[0, 1].data.shape == var1.data.shape
+        assert not var2.data.flags.writeable
+
+    assert var1._data is None and var2._data is None
+
+    mesh = swarm.mesh
+    T = uw.discretisation.MeshVariable("T_lazy", mesh, 1, degree=1)
+    U = uw.discretisation.MeshVariable("U_lazy", mesh, mesh.dim, degree=1)
+
+    for it in range(2):
+        with mesh.access(T):
+            T.data[...] = 2.0
+            assert U._data is None
+
+    assert len(mesh._field_subdms) > 0
+
+    with mesh.access():
+        assert np.allclose(T.data, 2.0)
+        assert np.allclose(U[0, 0].data, 0.0)
@@ -151,6 +151,58 @@ def test_getext_meshVar():
     )
 
 
+def test_getext_persistent_cache(tmp_path):
+    from underworld3.utilities import _jitextension
+
+    import glob
+
+    saved_config = _jitextension.set_jit_cache()
+    _jitextension.set_jit_cache(directory=str(tmp_path), enabled=True)
+
+    res_fn = sympy.ImmutableDenseMatrix([x * y, sympy.sin(x * y)])
+
+    def build():
+        compiled_extns, dictionaries = getext(
+            mesh,
+            [res_fn],
+            [],
+            [],
+            [],
+            [],
+            mesh.vars.values(),
+            cache=False,
+        )
+        builds = list(_jitextension._ext_dict.values())
+        return builds[-1]
+
+    try:
+        first_build = build()
+
+        # Forget the modules held in this process so that the second
+        # request has to be served from the disk cache
+
+        _jitextension._ext_module_dict.clear()
+        _jitextension._ext_dict.clear()
+
+        second_build = build()
+
+        cached_modules = glob.glob(os.path.join(str(tmp_path), "fn_ptr_ext_*.so"))
+
+    finally:
+        _jitextension.set_jit_cache(**saved_config)
+
+    # Compiled once, loaded from disk the second time
+
+    assert len(cached_modules) == 1
+    assert not first_build._from_cache
+    assert second_build._from_cache
+    assert second_build is not first_build
+
+    # The build directory is removed once the module is in the cache
+    assert first_build.tmpdir is None
+    assert second_build._so_file == cached_modules[0]
+
+
 # def test_build_functions():
 #     stokes = uw.systems.Stokes(mesh, velocityField=v, pressureField=p)
 #     stokes.constitutive_model = uw.constitutive_models.ViscousFlowModel
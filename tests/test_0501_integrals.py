@@ -49,6 +49,27 @@ def test_integrate_sympy():
     return
 
 
+def test_integrate_runtime_constant():
+
+    alpha = uw.function.expression(r"\alpha_{0501}", 2.0, "Runtime constant")
+    calculator = uw.maths.Integral(mesh, fn=alpha * x)
+
+    value = calculator.evaluate()
+    assert abs(value - 1.0) < 0.001
+
+    # Changing the value re-uses the compiled function
+    from underworld3.utilities import _jitextension
+
+    extension_count = len(_jitextension._ext_dict)
+
+    alpha.sym = 4.0
+    value = calculator.evaluate()
+    assert abs(value - 2.0) < 0.001
+    assert len(_jitextension._ext_dict) == extension_count
+
+    return
+
+
 def test_integrate_meshvar():
 
     with mesh.access(s_soln):
@@ -155,3 +176,30 @@ def test_integrate_swarmvar_deriv_00():
     assert abs(value + 2) < 0.0001
 
     return
+
+
+def test_integrate_updated_meshvars():
+
+    with mesh.access(s_soln, p_dc):
+        s_soln.data[:, 0] = 1.0
+        p_dc.data[:, 0] = p_dc.coords[:, 0]
+
+    calculator = uw.maths.Integral(mesh, fn=s_soln.sym[0] + p_dc.sym[0])
+    value = calculator.evaluate()
+
+    assert abs(value - 1.5) < 0.001
+
+    # Only the modified variable is copied into the mesh local vector again
+
+    s_state = mesh._lvec_var_states[s_soln.field_id]
+
+    with mesh.access(p_dc):
+        p_dc.data[:, 0] = 2.0 * p_dc.coords[:, 0]
+
+    value = calculator.evaluate()
+
+    assert abs(value - 2.0) < 0.001
+    assert mesh._lvec_var_states[s_soln.field_id] == s_state
+    assert mesh._lvec_var_states[p_dc.field_id] == p_dc._state
+
+    return
@@ -99,3 +99,109 @@ def test_single_vector_variable():
     assert np.allclose(np.array(((1.1, 1.2),)), result, rtol=1e-05, atol=1e-08)
 
     del mesh
+
+
+def test_mixed_vector_expression():
+    # Vector with a constant component - evaluated in a single pass
+    mesh = uw.meshing.StructuredQuadBox()
+    var = uw.discretisation.MeshVariable(
+        varname="scalar_var_5", mesh=mesh, num_components=1, vtype=uw.VarType.SCALAR
+    )
+    with mesh.access(var):
+        var.data[:] = 1.1
+
+    expr = sympy.Matrix([[var.sym[0], 0, mesh.r[0]]])
+
+    result = uw.function.evaluate(expr, coords)
+    assert result.shape == (coords.shape[0], 3)
+    assert np.allclose(1.1, result[:, 0], rtol=1e-05, atol=1e-08)
+    assert np.allclose(0.0, result[:, 1], rtol=1e-05, atol=1e-08)
+    assert np.allclose(x, result[:, 2], rtol=1e-05, atol=1e-08)
+
+    result = uw.function.evaluate(expr, coords, evalf=True)
+    assert result.shape == (coords.shape[0], 3)
+    assert np.allclose(0.0, result[:, 1], rtol=1e-05, atol=1e-08)
+
+    del mesh
+
+
+def test_evaluation_plan():
+    mesh = uw.meshing.StructuredQuadBox()
+    var = uw.discretisation.MeshVariable(
+        varname="scalar_var_6", mesh=mesh, num_components=1, vtype=uw.VarType.SCALAR
+    )
+
+    plan = uw.function.EvaluationPlan(mesh, coords)
+    assert plan.n_interior == coords.shape[0]
+
+    with mesh.access(var):
+        var.data[:, 0] = 1.0
+    result = uw.function.evaluate(var.sym[0], plan=plan)
+    assert np.allclose(1.0, result, rtol=1e-05, atol=1e-08)
+
+    # Same points, updated values
+    with mesh.access(var):
+        var.data[:, 0] = 2.0
+    result = uw.function.evaluate(var.sym[0], coords, plan=plan)
+    assert np.allclose(2.0, result, rtol=1e-05, atol=1e-08)
+
+    # The most recent plan is re-used for identical coordinates
+    uw.function.evaluate(var.sym[0], coords.copy())
+    plan_0 = mesh._evaluation_plan
+    uw.function.evaluate(var.sym[0], coords.copy())
+    assert mesh._evaluation_plan is plan_0
+
+    with pytest.raises(ValueError):
+        uw.function.evaluate(var.sym[0], coords[1:], plan=plan)
+
+    del mesh
+
+
+def test_subset_of_mesh_variables():
+    # Only the variables in the expression are interpolated, check that the
+    # results are not mixed up with the fields of the other variables
+    mesh = uw.meshing.StructuredQuadBox()
+    v = uw.discretisation.MeshVariable(
+        varname="vector_var_7", mesh=mesh, num_components=2, vtype=uw.VarType.VECTOR
+    )
+    s = uw.discretisation.MeshVariable(
+        varname="scalar_var_7", mesh=mesh, num_components=1, vtype=uw.VarType.SCALAR
+    )
+    t = uw.discretisation.MeshVariable(
+        varname="scalar_var_8", mesh=mesh, num_components=1, vtype=uw.VarType.SCALAR
+    )
+    with mesh.access(v, s, t):
+        v.data[:] = (1.1, 1.2)
+        s.data[:] = 2.0
+        t.data[:] = 3.0
+
+    result = uw.function.evaluate(t.sym[0], coords)
+    assert np.allclose(3.0, result, rtol=1e-05, atol=1e-08)
+
+    result = uw.function.evaluate(t.sym[0] * v.sym[1], coords)
+    assert np.allclose(3.6, result, rtol=1e-05, atol=1e-08)
+
+    del mesh
+
+
+def test_compiled_evaluation():
+    mesh = uw.meshing.StructuredQuadBox()
+    var = uw.discretisation.MeshVariable(
+        varname="vector_var_9", mesh=mesh, num_components=2, vtype=uw.VarType.VECTOR
+    )
+    with mesh.access(var):
+        var.data[:, 0] = 1.5
+        var.data[:, 1] = 0.5
+
+    expr = sympy.Matrix(
+        [[sympy.exp(var.sym[0] * mesh.r[0]) * sympy.sin(mesh.r[1]), var.sym[1], 2]]
+    )
+
+    result_lambdified = uw.function.evaluate(expr, coords, compiled=False)
+    result_compiled = uw.function.evaluate(expr, coords, compiled=True)
+
+    assert result_compiled.shape == (coords.shape[0], 3)
+    assert np.allclose(result_lambdified, result_compiled, rtol=1e-10, atol=1e-12)
+    assert np.allclose(np.exp(1.5 * x) * np.sin(y), result_compiled[:, 0])
+
+    del mesh
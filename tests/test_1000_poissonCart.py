@@ -42,3 +42,67 @@ def test_poisson_boxmesh(mesh):
 
     del poisson
     del mesh
+
+
+def test_poisson_jacobian_reuse():
+    import numpy as np
+
+    mesh = uw.meshing.StructuredQuadBox(elementRes=(5,) * 2)
+    x, y = mesh.X
+
+    u = uw.discretisation.MeshVariable("u_jr", mesh, 1, degree=2)
+    u_ref = uw.discretisation.MeshVariable("u_jr_ref", mesh, 1, degree=2)
+    source = uw.discretisation.MeshVariable("f_jr", mesh, 1, degree=1)
+    kappa = uw.discretisation.MeshVariable("k_jr", mesh, 1, degree=1)
+
+    def poisson_solver(u_field, reuse):
+        poisson = uw.systems.Poisson(mesh, u_Field=u_field)
+        poisson.constitutive_model = uw.constitutive_models.DiffusionModel
+        poisson.constitutive_model.Parameters.diffusivity = kappa.sym[0]
+        poisson.f = source.sym[0]
+        poisson.add_dirichlet_bc(1.0, "Bottom")
+        poisson.add_dirichlet_bc(0.0, "Top")
+        poisson.reuse_jacobian = reuse
+        return poisson
+
+    poisson = poisson_solver(u, True)
+    reference = poisson_solver(u_ref, False)
+
+    def set_values(var, values):
+        with mesh.access(var):
+            var.data[:, 0] = values(var.coords)
+
+    def check():
+        poisson.solve()
+        reference.solve()
+        assert poisson.snes.getConvergedReason() > 0
+        with mesh.access():
+            assert np.allclose(u.data, u_ref.data, atol=1.0e-5)
+
+    set_values(kappa, lambda X: 1.0 + X[:, 0])
+    set_values(source, lambda X: np.sin(np.pi * X[:, 0]))
+    check()
+
+    # Linear problem: the lag is managed for poisson only
+    assert poisson._jacobian_snes_state is not None
+    assert poisson._jacobian_lag_snes is poisson.snes
+    assert reference._jacobian_snes_state is None
+    assert reference._jacobian_lag_snes is None
+    first_state = poisson._jacobian_snes_state[1]
+
+    # RHS only - Jacobian is re-used (same key, so the lag was -1)
+    set_values(source, lambda X: np.cos(np.pi * X[:, 1]))
+    assert poisson._jacobian_state() == first_state
+    check()
+    assert poisson._jacobian_snes_state[1] == first_state
+
+    # Diffusivity changes - Jacobian must be rebuilt
+    set_values(kappa, lambda X: 2.0 + X[:, 1] ** 2)
+    assert poisson._jacobian_state() != first_state
+    check()
+    assert poisson._jacobian_snes_state[1] != first_state
+
+    # Switching reuse off restores the default (persistent) lag
+    poisson.reuse_jacobian = False
+    check()
+    assert poisson._jacobian_lag_snes is None
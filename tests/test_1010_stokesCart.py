@@ -184,3 +184,119 @@ def test_stokes_boxmesh_bc_failure():
     del stokes
 
     return
+
+
+def test_stokes_matrix_free():
+    import numpy as np
+
+    mesh = uw.meshing.StructuredQuadBox(elementRes=(4,) * 2)
+    x, y = mesh.X
+
+    u = uw.discretisation.MeshVariable(
+        r"mathbf{u_mf}", mesh, mesh.dim, vtype=uw.VarType.VECTOR, degree=2
+    )
+    p = uw.discretisation.MeshVariable(
+        r"mathbf{p_mf}", mesh, 1, vtype=uw.VarType.SCALAR, degree=1
+    )
+
+    def solve(matrix_free):
+        stokes = uw.systems.Stokes(mesh, velocityField=u, pressureField=p)
+        stokes.constitutive_model = uw.constitutive_models.ViscousFlowModel
+        stokes.constitutive_model.Parameters.shear_viscosity_0 = 1
+        stokes.petsc_options["ksp_type"] = "fgmres"
+        stokes.tolerance = 1.0e-6
+        stokes.matrix_free = matrix_free
+
+        stokes.bodyforce = sympy.Matrix([0, sympy.sin(sympy.pi * x)])
+        stokes.add_dirichlet_bc((0.0, 0.0), "Bottom")
+        stokes.add_dirichlet_bc((0.0, 0.0), "Top")
+        stokes.add_dirichlet_bc((0.0, sympy.oo), "Left")
+        stokes.add_dirichlet_bc((0.0, sympy.oo), "Right")
+
+        stokes.solve()
+        assert stokes.snes.getConvergedReason() > 0
+
+        # Outer (Schur) iterations over all Newton steps
+        its = stokes.snes.getLinearSolveIterations()
+
+        with mesh.access():
+            return u.data.copy(), its
+
+    u_assembled, its_assembled = solve(False)
+    u_mf, its_mf = solve(True)
+
+    assert np.allclose(u_mf, u_assembled, atol=1.0e-3 * np.abs(u_assembled).max())
+
+    # Same Schur complement and preconditioner: the matrix-free operator should
+    # not need many more outer iterations than the assembled one
+    assert its_mf <= 2 * its_assembled + 2
+
+
+def test_stokes_gmg_strategy():
+    import numpy as np
+
+    mesh = uw.meshing.StructuredQuadBox(elementRes=(4,) * 2, refinement=2)
+    x, y = mesh.X
+
+    u = uw.discretisation.MeshVariable(
+        r"mathbf{u_gmg}", mesh, mesh.dim, vtype=uw.VarType.VECTOR, degree=2
+    )
+    p = uw.discretisation.MeshVariable(
+        r"mathbf{p_gmg}", mesh, 1, vtype=uw.VarType.SCALAR, degree=1
+    )
+
+    def solve(strategy):
+        stokes = uw.systems.Stokes(mesh, velocityField=u, pressureField=p)
+        stokes.constitutive_model = uw.constitutive_models.ViscousFlowModel
+        stokes.constitutive_model.Parameters.shear_viscosity_0 = 1
+        stokes.petsc_options["ksp_type"] = "fgmres"
+        stokes.tolerance = 1.0e-6
+        stokes.strategy = strategy
+
+        stokes.bodyforce = sympy.Matrix([0, sympy.sin(sympy.pi * x)])
+        stokes.add_dirichlet_bc((0.0, 0.0), "Bottom")
+        stokes.add_dirichlet_bc((0.0, 0.0), "Top")
+        stokes.add_dirichlet_bc((0.0, sympy.oo), "Left")
+        stokes.add_dirichlet_bc((0.0, sympy.oo), "Right")
+
+        stokes.solve()
+        assert stokes.snes.getConvergedReason() > 0
+
+        with mesh.access():
+            return u.data.copy()
+
+    u_gamg = solve("default")
+    u_gmg = solve("gmg")
+
+    assert np.allclose(u_gmg, u_gamg, atol=1.0e-3 * np.abs(u_gamg).max())
+
+
+def test_stokes_strategy_restores_gamg_options():
+    mesh = uw.meshing.StructuredQuadBox(elementRes=(4,) * 2, refinement=1)
+
+    u = uw.discretisation.MeshVariable(
+        r"mathbf{u_st}", mesh, mesh.dim, vtype=uw.VarType.VECTOR, degree=2
+    )
+    p = uw.discretisation.MeshVariable(
+        r"mathbf{p_st}", mesh, 1, vtype=uw.VarType.SCALAR, degree=1
+    )
+
+    stokes = uw.systems.Stokes(mesh, velocityField=u, pressureField=p)
+    options = stokes.petsc_options
+
+    names = [
+        f"fieldsplit_velocity_{name}"
+        for name in ("ksp_type", "pc_type", "pc_gamg_type", "pc_mg_type", "mg_levels_ksp_max_it")
+    ]
+    defaults = {name: options.getString(name) for name in names}
+
+    # Switching to gmg and back should give exactly the constructor's gamg options
+    stokes.strategy = "gmg"
+    stokes.strategy = "default"
+
+    for name in names:
+        assert options.getString(name) == defaults[name]
+
+    for name in stokes._velocity_gmg_option_names:
+        if name not in ("pc_mg_type", "mg_levels_ksp_max_it"):
+            assert not options.hasName(f"fieldsplit_velocity_{name}")
@@ -67,6 +67,108 @@ def test_IndexSwarmVariable(mesh):
         del material
             
 
+def _level_sets_reference(material):
+    """Per-node / per-particle loop version of IndexSwarmVariable._update"""
+
+    swarm = material.swarm
+    meshVar = material._meshLevelSetVars[0]
+    num_nodes = meshVar.coords.shape[0]
+    levels = np.zeros((num_nodes, material.indices))
+
+    with swarm.access():
+        coords = swarm.particle_coordinates.data.copy()
+        data = material.data[:, 0].copy()
+
+    kd_swarm = uw.kdtree.KDTree(np.ascontiguousarray(coords))
+
+    if material.update_type == 0:
+        kd = uw.kdtree.KDTree(meshVar.coords)
+        n_distance, n_indices = kd.query(coords, k=material.nnn)
+        d, n = kd_swarm.query(meshVar.coords, k=1, sqr_dists=True)
+        n = np.asarray(n).reshape(-1)
+
+        for ii in range(material.indices):
+            node_values = np.zeros(num_nodes)
+            w = np.zeros(num_nodes)
+            for i in range(data.shape[0]):
+                tem = np.isclose(n_distance[i, :], n_distance[i, 0])
+                dist = n_distance[i, tem]
+                indices = n_indices[i, tem]
+                tem = dist < material.radius_s
+                for j, ind in enumerate(indices[tem]):
+                    node_values[ind] += np.isclose(data[i], ii) / (1.0e-16 + dist[tem][j])
+                    w[ind] += 1.0 / (1.0e-16 + dist[tem][j])
+
+            node_values[w > 0.0] /= w[w > 0.0]
+            for i in np.where(w == 0.0)[0]:
+                if data[n[i]] == ii:
+                    node_values[i] = 1.0
+            levels[:, ii] = node_values
+
+    else:
+        n_distance, n_indices = kd_swarm.query(
+            meshVar.coords, k=material.nnn, sqr_dists=True
+        )
+        ind_bc = [] if material.ind_bc is None else list(material.ind_bc)
+
+        for ii in range(material.indices):
+            node_values = np.zeros(num_nodes)
+            w = np.zeros(num_nodes)
+            for i in range(num_nodes):
+                nnn = material.nnn_bc if i in ind_bc else material.nnn
+                ind = np.where(n_distance[i, :nnn] < material.radius_s)[0]
+                a = 1.0 / (n_distance[i, :nnn][ind] + 1.0e-16)
+                w[i] = np.sum(a)
+                node_values[i] = np.dot(a, np.isclose(data[n_indices[i, :nnn][ind]], ii))
+
+            node_values[w > 0.0] /= w[w > 0.0]
+            for i in np.where(w == 0.0)[0]:
+                if np.any(data[n_indices[i]] == ii):
+                    node_values[i] = 1.0
+            levels[:, ii] = node_values
+
+    return levels
+
+
+@pytest.mark.parametrize(
+    "update_type, radius, ind_bc",
+    [
+        (0, 0.5, None),
+        (0, 0.05, None),
+        (1, 0.5, None),
+        (1, 0.05, None),
+        (1, 0.5, [0, 1, 2, 3]),
+    ],
+)
+def test_IndexSwarmVariable_update_reference(update_type, radius, ind_bc):
+    mesh = uw.meshing.StructuredQuadBox(
+        elementRes=(4, 4), minCoords=(xmin, ymin), maxCoords=(xmax, ymax)
+    )
+    swarm = uw.swarm.Swarm(mesh)
+    material = uw.swarm.IndexSwarmVariable(
+        "M",
+        swarm,
+        indices=3,
+        proxy_degree=2,
+        update_type=update_type,
+        npoints=5,
+        radius=radius,
+        npoints_bc=2,
+        ind_bc=ind_bc,
+    )
+    swarm.populate(fill_param=2)
+
+    rng = np.random.default_rng(0)
+    with swarm.access(material):
+        material.data[:, 0] = rng.integers(0, 3, size=material.data.shape[0])
+
+    expected = _level_sets_reference(material)
+
+    with mesh.access():
+        for ii in range(material.indices):
+            assert np.allclose(material._meshLevelSetVars[ii].data[:, 0], expected[:, ii])
+
+
 del meshStructuredQuadBox
 #del meshUnstructuredSimplexbox_regular
 #del meshUnstructuredSimplexbox_irregular
\ No newline at end of file